@@ -5,6 +5,20 @@ from core.math.vector2d import Vector2d
 from core.objects.object import BaseNonStaticObject
 
 
+def calculate_spring_force(result: Vector2d, attracting_point: Vector2d, point: Vector2d,
+                           rest_length: float, spring_coefficient: float) -> Vector2d:
+    """Uses Hook's Law to calculate spring force, writes the force into the result vector
+    and returns it, so the calculation doesn't allocate new vectors"""
+
+    result.set(point.x - attracting_point.x, point.y - attracting_point.y)
+
+    force_magnitude = result.get_magnitude()
+    force_magnitude = abs(force_magnitude - rest_length)
+    force_magnitude *= spring_coefficient
+
+    return result.inormalize().iscale(force_magnitude)
+
+
 class SpringForceGenerator(StaticForceGenerator):
     """Uses Hook's Law to calculate spring force between objects
 
@@ -29,6 +43,7 @@ class SpringForceGenerator(StaticForceGenerator):
         self.rest_length = rest_length
         self.attracting_object = attracting_object
         self.spring_coefficient = spring_coefficient
+        self._spring_force = Vector2d(0, 0, exact=True)
 
     def apply_force(self, time_since_last_apply: float) -> None:
 
@@ -40,15 +55,10 @@ class SpringForceGenerator(StaticForceGenerator):
 
     def calculate_force(
             self, attracting_object_pos: Vector2d, obj: BaseNonStaticObject) -> Vector2d:
-        current_spring_length = obj.position - attracting_object_pos
-        force_direction = current_spring_length.normalize()
+        """Returns the spring force, the returned vector is reused on the next call"""
 
-        force_magnitude = current_spring_length.get_magnitude()
-        force_magnitude = abs(force_magnitude - self.rest_length)
-        force_magnitude *= self.spring_coefficient
-
-        force = force_direction.scale(force_magnitude)
-        return force
+        return calculate_spring_force(self._spring_force, attracting_object_pos, obj.position,
+                                      self.rest_length, self.spring_coefficient)
 
 class AnchoredSpringForceGenerator(StaticForceGenerator):
     """Uses Hook's Law to calculate spring force between objects and anchor"""
@@ -72,6 +82,7 @@ class AnchoredSpringForceGenerator(StaticForceGenerator):
         self.rest_length = rest_length
         self.anchor_point = anchor_point
         self.spring_coefficient = spring_coefficient
+        self._spring_force = Vector2d(0, 0, exact=True)
 
     def apply_force(self, time_since_last_apply: float) -> None:
 
@@ -81,15 +92,10 @@ class AnchoredSpringForceGenerator(StaticForceGenerator):
 
     def calculate_force(
             self, attracting_object_pos: Vector2d, obj: BaseNonStaticObject) -> Vector2d:
-        current_spring_length = obj.position - attracting_object_pos
-        force_direction = current_spring_length.normalize()
-
-        force_magnitude = current_spring_length.get_magnitude()
-        force_magnitude = abs(force_magnitude - self.rest_length)
-        force_magnitude *= self.spring_coefficient
+        """Returns the spring force, the returned vector is reused on the next call"""
 
-        force = force_direction.scale(force_magnitude)
-        return force
+        return calculate_spring_force(self._spring_force, attracting_object_pos, obj.position,
+                                      self.rest_length, self.spring_coefficient)
 
 
 class BungeeForceGenerator(StaticForceGenerator):
@@ -118,6 +124,7 @@ class BungeeForceGenerator(StaticForceGenerator):
         self.rest_length = rest_length
         self.attracting_object = attracting_object
         self.spring_coefficient = spring_coefficient
+        self._spring_force = Vector2d(0, 0, exact=True)
 
     def apply_force(self, time_since_last_apply: float) -> None:
 
@@ -129,19 +136,17 @@ class BungeeForceGenerator(StaticForceGenerator):
 
     def calculate_force(
             self, attracting_object_pos: Vector2d, obj: BaseNonStaticObject) -> Vector2d:
-        current_spring_length = obj.position - attracting_object_pos
+        """Returns the spring force, the returned vector is reused on the next call"""
 
-        if current_spring_length.get_magnitude() <= self.rest_length:
-            return Vector2d(0, 0)
+        position = obj.position
+        dx = position.x - attracting_object_pos.x
+        dy = position.y - attracting_object_pos.y
 
-        force_direction = current_spring_length.normalize()
+        if dx * dx + dy * dy <= self.rest_length * self.rest_length:
+            return self._spring_force.set(0.0, 0.0)
 
-        force_magnitude = current_spring_length.get_magnitude()
-        force_magnitude = abs(force_magnitude - self.rest_length)
-        force_magnitude *= self.spring_coefficient
-
-        force = force_direction.scale(force_magnitude)
-        return force
+        return calculate_spring_force(self._spring_force, attracting_object_pos, position,
+                                      self.rest_length, self.spring_coefficient)
 
 
 class BuoyancyForceGenerator(StaticForceGenerator):
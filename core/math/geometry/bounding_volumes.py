@@ -0,0 +1,186 @@
+import math
+from typing import List, Sequence, Tuple, Optional, Any
+
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
+
+
+class AABB:
+	"""Axis aligned bounding box, bounds can be infinite (e.g. for rays and lines)"""
+
+	__slots__ = ("min_x", "min_y", "max_x", "max_y")
+
+	def __init__(self, min_x: float, min_y: float, max_x: float, max_y: float) -> None:
+		self.min_x = min_x
+		self.min_y = min_y
+		self.max_x = max_x
+		self.max_y = max_y
+
+	def __repr__(self) -> str:
+		return f"AABB({self.min_x}, {self.min_y}, {self.max_x}, {self.max_y})"
+
+	def __eq__(self, other: "AABB") -> bool:
+		return isinstance(other, AABB) and self.min_x == other.min_x and self.min_y == other.min_y and \
+		       self.max_x == other.max_x and self.max_y == other.max_y
+
+	__hash__ = None
+
+	def is_intersect(self, other: "AABB", tolerance: float = POINTS_TOLERANCE) -> bool:
+		"""Boxes that are closer than the tolerance are considered intersecting, as the
+		collision detection functions consider touching shapes intersecting
+		"""
+
+		return self.min_x <= other.max_x + tolerance and other.min_x <= self.max_x + tolerance and \
+		       self.min_y <= other.max_y + tolerance and other.min_y <= self.max_y + tolerance
+
+	def is_point_inside(self, point: Vector2d) -> bool:
+		return self.min_x <= point.x <= self.max_x and self.min_y <= point.y <= self.max_y
+
+	def is_box_inside(self, other: "AABB") -> bool:
+		return self.min_x <= other.min_x and self.min_y <= other.min_y and \
+		       other.max_x <= self.max_x and other.max_y <= self.max_y
+
+	def get_center(self) -> Vector2d:
+		return Vector2d((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2, exact=True)
+
+	def get_width(self) -> float:
+		return self.max_x - self.min_x
+
+	def get_height(self) -> float:
+		return self.max_y - self.min_y
+
+	def get_perimeter(self) -> float:
+		return 2 * (self.max_x - self.min_x + self.max_y - self.min_y)
+
+	def get_enlarged(self, margin: float) -> "AABB":
+		return AABB(self.min_x - margin, self.min_y - margin, self.max_x + margin, self.max_y + margin)
+
+	def get_union(self, other: "AABB") -> "AABB":
+		return AABB(min(self.min_x, other.min_x), min(self.min_y, other.min_y), max(self.max_x, other.max_x),
+		            max(self.max_y, other.max_y))
+
+
+class BoundingCircle:
+	"""Circle that contains a shape, radius can be infinite (e.g. for rays and lines)"""
+
+	__slots__ = ("center", "radius")
+
+	def __init__(self, center: Vector2d, radius: float) -> None:
+		self.center = center
+		self.radius = radius
+
+	def __repr__(self) -> str:
+		return f"BoundingCircle({self.center!r}, {self.radius})"
+
+	def is_intersect(self, other: "BoundingCircle", tolerance: float = POINTS_TOLERANCE) -> bool:
+		radii = self.radius + other.radius + tolerance
+		if math.isinf(radii):
+			return True
+
+		dx = self.center.x - other.center.x
+		dy = self.center.y - other.center.y
+
+		return dx * dx + dy * dy <= radii * radii
+
+
+class _TreeNode:
+	__slots__ = ("aabb", "left", "right", "item")
+
+	def __init__(self, item: Any = None, left: "_TreeNode" = None, right: "_TreeNode" = None) -> None:
+		self.aabb: Optional[AABB] = None
+		self.item = item
+		self.left = left
+		self.right = right
+
+
+class BoundingVolumeTree:
+	"""Static binary tree of bounding boxes of items that have aabb property (e.g. shapes)
+
+	The tree is built once: the items are split by the median of the boxes centers along the
+	longest side of the box that contains them. refit recalculates the boxes after the items
+	were moved, the structure isn't changed, so it suits items that move together (e.g. parts
+	of one shape)
+	"""
+
+	def __init__(self, items: Sequence[Any]) -> None:
+		if not items:
+			raise AttributeError("Bounding volume tree should have at least one item")
+
+		self.items = list(items)
+		self.root = self._build(self.items)
+		self.refit()
+
+	def refit(self) -> None:
+		self._refit(self.root)
+
+	def query(self, aabb: AABB) -> List[Any]:
+		"""Returns items which boxes intersect the box"""
+
+		items = []
+		not_visited = [self.root]
+
+		while not_visited:
+			node = not_visited.pop()
+
+			if not node.aabb.is_intersect(aabb):
+				continue
+
+			if node.item is not None:
+				items.append(node.item)
+			else:
+				not_visited.append(node.left)
+				not_visited.append(node.right)
+
+		return items
+
+	def query_pairs(self, other: "BoundingVolumeTree") -> List[Tuple[Any, Any]]:
+		"""Returns pairs of items of both trees which boxes intersect, the trees are descended
+		together, so the subtrees that don't overlap are skipped at once
+		"""
+
+		pairs = []
+		not_visited = [(self.root, other.root)]
+
+		while not_visited:
+			first, second = not_visited.pop()
+
+			if not first.aabb.is_intersect(second.aabb):
+				continue
+
+			if first.item is not None and second.item is not None:
+				pairs.append((first.item, second.item))
+			elif second.item is not None or (first.item is None and
+			                                 first.aabb.get_width() + first.aabb.get_height() >=
+			                                 second.aabb.get_width() + second.aabb.get_height()):
+				# Descend the bigger node
+				not_visited.append((first.left, second))
+				not_visited.append((first.right, second))
+			else:
+				not_visited.append((first, second.left))
+				not_visited.append((first, second.right))
+
+		return pairs
+
+	def _build(self, items: List[Any]) -> _TreeNode:
+		if len(items) == 1:
+			return _TreeNode(items[0])
+
+		aabb = items[0].aabb
+		for item in items[1:]:
+			aabb = aabb.get_union(item.aabb)
+
+		if aabb.get_width() >= aabb.get_height():
+			items = sorted(items, key=lambda item: item.aabb.min_x + item.aabb.max_x)
+		else:
+			items = sorted(items, key=lambda item: item.aabb.min_y + item.aabb.max_y)
+
+		middle = len(items) // 2
+
+		return _TreeNode(left=self._build(items[:middle]), right=self._build(items[middle:]))
+
+	def _refit(self, node: _TreeNode) -> AABB:
+		if node.item is not None:
+			node.aabb = node.item.aabb
+		else:
+			node.aabb = self._refit(node.left).get_union(self._refit(node.right))
+
+		return node.aabb
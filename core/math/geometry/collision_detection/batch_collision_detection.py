@@ -0,0 +1,227 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from core.math.geometry.collision_detection.collision_data import CollisionData
+from core.math.vector2d_array import Vector2dArray
+
+
+class BatchCollisionData:
+	"""Collision data of a batch of pairs stored as struct of arrays, one row per pair
+
+	is_intersect: (N,) bool array
+	penetration_depths: (N,) array, NaN if the pair doesn't intersect or the depth is unknown
+	normals: unit vectors from the first object to the second one, NaN if unknown
+	first_points, second_points: contact points of the first and the second object, the same
+									point for the objects without area (e.g. segments)
+	"""
+
+	__slots__ = ("is_intersect", "penetration_depths", "normals", "first_points", "second_points")
+
+	def __init__(self, is_intersect: np.ndarray, penetration_depths: np.ndarray, normals: Vector2dArray,
+	             first_points: Vector2dArray, second_points: Vector2dArray) -> None:
+		self.is_intersect = is_intersect
+		self.penetration_depths = penetration_depths
+		self.normals = normals
+		self.first_points = first_points
+		self.second_points = second_points
+
+	@classmethod
+	def empty(cls, count: int) -> "BatchCollisionData":
+		def get_nan_vectors() -> Vector2dArray:
+			return Vector2dArray(np.full(count, np.nan), np.full(count, np.nan))
+
+		return cls(np.zeros(count, dtype=bool), np.full(count, np.nan), get_nan_vectors(), get_nan_vectors(),
+		           get_nan_vectors())
+
+	def __len__(self) -> int:
+		return self.is_intersect.shape[0]
+
+	def set_rows(self, indexes: np.ndarray, data: "BatchCollisionData") -> None:
+		self.is_intersect[indexes] = data.is_intersect
+		self.penetration_depths[indexes] = data.penetration_depths
+
+		for vectors, other_vectors in ((self.normals, data.normals), (self.first_points, data.first_points),
+		                               (self.second_points, data.second_points)):
+			vectors.x[indexes] = other_vectors.x
+			vectors.y[indexes] = other_vectors.y
+
+	def set_collision_data(self, index: int, data: Optional[CollisionData]) -> None:
+		"""Sets the row of one pair from CollisionData of the pair"""
+
+		self.is_intersect[index] = data is not None
+		if data is None:
+			return
+
+		if data.penetration_depth is not None:
+			self.penetration_depths[index] = data.penetration_depth
+
+		if data.normal is not None:
+			self.normals.x[index] = data.normal.x
+			self.normals.y[index] = data.normal.y
+
+		if data.contact_points is not None:
+			first_point, second_point = data.contact_points
+		elif data.intersection_points:
+			first_point = second_point = data.intersection_points[0]
+		else:
+			return
+
+		self.first_points.x[index] = first_point.x
+		self.first_points.y[index] = first_point.y
+		self.second_points.x[index] = second_point.x
+		self.second_points.y[index] = second_point.y
+
+	def get_reversed(self) -> "BatchCollisionData":
+		"""Returns the data for the pairs with the objects in the reversed order"""
+
+		return BatchCollisionData(self.is_intersect, self.penetration_depths, self.normals.inverse(),
+		                          self.second_points, self.first_points)
+
+	def get_intersecting_indexes(self) -> np.ndarray:
+		return np.flatnonzero(self.is_intersect)
+
+	def get_collision_data(self, index: int) -> Optional[CollisionData]:
+		"""Creates CollisionData of one pair, None if the pair doesn't intersect"""
+
+		if not self.is_intersect[index]:
+			return None
+
+		first_point = self.first_points[index]
+		second_point = self.second_points[index]
+		depth = float(self.penetration_depths[index])
+		normal = self.normals[index]
+
+		return CollisionData([first_point, second_point], None if np.isnan(depth) else depth,
+		                     None if np.isnan(normal.x) else normal, (first_point, second_point))
+
+
+def get_batch_inter_data_circle_circle(first_circles: Sequence["Circle"],
+                                       second_circles: Sequence["Circle"]) -> BatchCollisionData:
+	first_centers = Vector2dArray.from_vectors(circle.center for circle in first_circles)
+	second_centers = Vector2dArray.from_vectors(circle.center for circle in second_circles)
+	first_radii = _get_radii(first_circles)
+	second_radii = _get_radii(second_circles)
+
+	offsets = second_centers - first_centers
+	distances = offsets.get_magnitude()
+	depths = first_radii + second_radii - distances
+	is_intersect = depths >= 0
+
+	# Circles with the same center are pushed apart along x
+	is_same_center = distances == 0
+	safe_distances = np.where(is_same_center, 1.0, distances)
+	normals = Vector2dArray(np.where(is_same_center, 1.0, offsets.x / safe_distances),
+	                        offsets.y / safe_distances)
+
+	return _get_batch_data(is_intersect, depths, normals, first_centers.add_scaled_vector(normals, first_radii),
+	                       second_centers.add_scaled_vector(normals, -second_radii))
+
+
+def get_batch_inter_data_circle_convexpolygon(circles: Sequence["Circle"],
+                                              polygons: Sequence["BasePolygon"]) -> BatchCollisionData:
+	"""The closest point of the border to the center of each circle is found on (pairs, sides)
+	arrays, polygons with less vertices are padded by their last vertex (sides with zero length)
+	"""
+
+	centers = Vector2dArray.from_vectors(circle.center for circle in circles)
+	radii = _get_radii(circles)
+	vertices = _get_padded_vertices(polygons)
+
+	x = centers.x[:, np.newaxis]
+	y = centers.y[:, np.newaxis]
+	first_x = vertices[:, :, 0]
+	first_y = vertices[:, :, 1]
+	side_x = np.roll(first_x, -1, axis=1) - first_x
+	side_y = np.roll(first_y, -1, axis=1) - first_y
+
+	squared_lengths = side_x * side_x + side_y * side_y
+	t = ((x - first_x) * side_x + (y - first_y) * side_y) / np.where(squared_lengths == 0, 1.0, squared_lengths)
+	t = np.clip(t, 0.0, 1.0)
+	offset_x = first_x + side_x * t - x
+	offset_y = first_y + side_y * t - y
+	squared_distances = offset_x * offset_x + offset_y * offset_y
+
+	closest = np.argmin(squared_distances, axis=1)
+	rows = np.arange(len(closest))
+	closest_x = offset_x[rows, closest]
+	closest_y = offset_y[rows, closest]
+	distances = np.sqrt(squared_distances[rows, closest])
+
+	# Crossing test of the centers, the upper end of a side isn't counted
+	is_crossing = (first_y > y) != (first_y + side_y > y)
+	crossing_x = first_x + (y - first_y) * side_x / np.where(side_y == 0, 1.0, side_y)
+	is_inside = np.count_nonzero(is_crossing & (x < crossing_x), axis=1) % 2 == 1
+
+	# The circle goes away from the closest point if its center is outside and to it if inside
+	direction = np.where(is_inside, -1.0, 1.0)
+	safe_distances = np.where(distances == 0, 1.0, distances)
+	normals = Vector2dArray(np.where(distances == 0, 1.0, direction * closest_x / safe_distances),
+	                        direction * closest_y / safe_distances)
+	depths = radii - direction * distances
+
+	return _get_batch_data(depths >= 0, depths, normals, centers.add_scaled_vector(normals, radii),
+	                       Vector2dArray(centers.x + closest_x, centers.y + closest_y))
+
+
+def get_batch_inter_data_segment_segment(first_segments: Sequence["Segment"],
+                                         second_segments: Sequence["Segment"]) -> BatchCollisionData:
+	"""Vectorized lines_penetr_coeff.get_penetr_segment_segment_coeff, the depth is the distance
+	from the intersection point to the closest end of the first segment
+	"""
+
+	first_starts = Vector2dArray.from_vectors(segment.first_point for segment in first_segments)
+	first_ends = Vector2dArray.from_vectors(segment.second_point for segment in first_segments)
+	second_starts = Vector2dArray.from_vectors(segment.first_point for segment in second_segments)
+	second_ends = Vector2dArray.from_vectors(segment.second_point for segment in second_segments)
+
+	first_vectors = first_starts - first_ends
+	second_vectors = second_starts - second_ends
+	starts_offsets = first_starts - second_starts
+
+	denominators = first_vectors.cross(second_vectors)
+	is_parallel = denominators == 0
+	safe_denominators = np.where(is_parallel, 1.0, denominators)
+
+	t = starts_offsets.cross(second_vectors) / safe_denominators
+	u = -first_vectors.cross(starts_offsets) / safe_denominators
+	is_intersect = ~is_parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+	points = first_starts.add_scaled_vector(first_vectors, -t)
+	lengths = first_vectors.get_magnitude()
+	depths = np.minimum(lengths * t, lengths - lengths * t)
+	normals = Vector2dArray(np.full(len(t), np.nan), np.full(len(t), np.nan))
+
+	return _get_batch_data(is_intersect, depths, normals, points, points)
+
+
+def _get_batch_data(is_intersect: np.ndarray, depths: np.ndarray, normals: Vector2dArray,
+                    first_points: Vector2dArray, second_points: Vector2dArray) -> BatchCollisionData:
+	"""Sets NaN to the rows of the pairs that don't intersect"""
+
+	is_apart = ~is_intersect
+	depths[is_apart] = np.nan
+
+	for vectors in (normals, first_points, second_points):
+		vectors.x[is_apart] = np.nan
+		vectors.y[is_apart] = np.nan
+
+	return BatchCollisionData(is_intersect, depths, normals, first_points, second_points)
+
+
+def _get_radii(circles: Sequence["Circle"]) -> np.ndarray:
+	return np.fromiter((circle.radius for circle in circles), dtype=np.float64, count=len(circles))
+
+
+def _get_padded_vertices(polygons: Sequence["BasePolygon"]) -> np.ndarray:
+	max_count = max(polygon.points_count for polygon in polygons)
+	vertices = np.empty((len(polygons), max_count, 2))
+
+	for i, polygon in enumerate(polygons):
+		polygon_vertices = polygon.vertices
+		count = len(polygon_vertices)
+
+		vertices[i, :count] = polygon_vertices
+		vertices[i, count:] = polygon_vertices[-1]
+
+	return vertices
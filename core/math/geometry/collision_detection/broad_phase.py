@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from core.math.geometry.collision_detection.batch_collision_detection import BatchCollisionData
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+
+Pair = Tuple["BaseGeometryObject", "BaseGeometryObject"]
+
+
+class BaseBroadPhase(ABC):
+	"""Finds pairs of objects which bounding boxes intersect, only they go to the narrow phase
+
+	Objects are geometry objects (shapes, segments ...), a collider adds its shape. Bounding
+	boxes are read from aabb property of the objects on add and update
+	"""
+
+	@abstractmethod
+	def add(self, geometry_object: "BaseGeometryObject") -> None:
+		raise NotImplemented()
+
+	@abstractmethod
+	def remove(self, geometry_object: "BaseGeometryObject") -> None:
+		raise NotImplemented()
+
+	@abstractmethod
+	def update(self) -> None:
+		"""Reads bounding boxes of the objects again, should be called after the objects moved"""
+
+		raise NotImplemented()
+
+	@abstractmethod
+	def get_pairs(self) -> List[Pair]:
+		"""Returns pairs of the objects which bounding boxes intersect, each pair once"""
+
+		raise NotImplemented()
+
+	def get_intersection_data(self) -> Tuple[List[Pair], BatchCollisionData]:
+		"""Runs the pairs through the narrow phase, row i of the data belongs to i pair"""
+
+		pairs = self.get_pairs()
+
+		return pairs, CollisionDetection.get_batch_intersection_data(pairs)
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from core.math.vector2d import Vector2d
 
@@ -8,15 +8,38 @@ class CollisionData:
 
 	penetration depth can be set None when we can't get it
 	e.g ray doesn't have length, so we can't resolve the collision
+
+	intersection_points: points where the borders of the objects cross, it's empty when one polygon
+			is inside the other one. Ellipse pairs (except two circles) don't solve the crossings and
+			store the contact points
+	normal: unit vector that points from the first object to the second one, moving the first
+			object on -normal * penetration_depth resolves the collision
+	contact_points: the deepest points of the first and the second object
 	"""
 
 	def __init__(self, intersection_points: List[Vector2d],
-	             penetration_depth: Optional[float] = None):
+	             penetration_depth: Optional[float] = None,
+	             normal: Optional[Vector2d] = None,
+	             contact_points: Optional[Tuple[Vector2d, Vector2d]] = None):
 		self.intersection_points = intersection_points
 		self.penetration_depth = penetration_depth
+		self.normal = normal
+		self.contact_points = contact_points
+
+	def set_max_penetration_depth(self, penetration: Optional[float]) -> None:
+		if penetration is None:
+			return
 
-	def set_max_penetration_depth(self, penetration: float) -> None:
-		self.penetration_depth = max(self.penetration_depth, penetration)
+		if self.penetration_depth is None or penetration > self.penetration_depth:
+			self.penetration_depth = penetration
 
 	def add_points_of_intersection(self, points: List[Vector2d]) -> None:
 		self.intersection_points.extend(points)
+
+	def get_reversed(self) -> "CollisionData":
+		"""Returns the data for the objects in the reversed order"""
+
+		normal = self.normal.inverse() if self.normal is not None else None
+		contact_points = self.contact_points[::-1] if self.contact_points is not None else None
+
+		return CollisionData(list(self.intersection_points), self.penetration_depth, normal, contact_points)
@@ -0,0 +1,291 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.geometry.collision_detection.broad_phase import BaseBroadPhase, Pair
+from core.math.geometry.geometry_objects import Ray, Line, Segment
+
+# Fat boxes are enlarged by this value on each side
+AABB_MARGIN = 0.1
+
+
+class _Node:
+	__slots__ = ("aabb", "parent", "children", "height", "item")
+
+	def __init__(self, aabb: AABB, item: Optional["BaseGeometryObject"] = None) -> None:
+		self.aabb = aabb
+		self.parent: Optional["_Node"] = None
+		self.children: List["_Node"] = []
+		# Leaves have zero height
+		self.height = 0
+		self.item = item
+
+	def is_leaf(self) -> bool:
+		return not self.children
+
+	def refit(self) -> None:
+		first, second = self.children
+		self.aabb = first.aabb.get_union(second.aabb)
+		self.height = 1 + max(first.height, second.height)
+
+
+class DynamicAABBTree(BaseBroadPhase):
+	"""Binary tree of the bounding boxes that is changed as the objects are added, moved or removed
+
+	Leaves keep boxes enlarged by the margin (fat boxes), an object is reinserted only when its
+	box leaves the fat one, so slowly moving bodies don't change the tree every frame. A leaf is
+	inserted next to the node that enlarges the perimeters of the tree the least, then the tree
+	is balanced by rotations on the way to the root (as AVL tree), so static level geometry and
+	small bodies can be mixed
+
+	margin: should be about the distance the objects move for a few frames
+	"""
+
+	def __init__(self, margin: float = AABB_MARGIN):
+		if margin < 0:
+			raise AttributeError("Margin should be non negative, got {}".format(margin))
+
+		self.margin = margin
+		self.root: Optional[_Node] = None
+		self._leaves: Dict[int, _Node] = {}
+
+	def __len__(self) -> int:
+		return len(self._leaves)
+
+	def get_height(self) -> int:
+		return self.root.height if self.root is not None else 0
+
+	def add(self, geometry_object: "BaseGeometryObject") -> None:
+		key = id(geometry_object)
+
+		if key in self._leaves:
+			raise AttributeError("The object {} is already added".format(geometry_object))
+
+		leaf = _Node(geometry_object.aabb.get_enlarged(self.margin), geometry_object)
+		self._leaves[key] = leaf
+		self._insert_leaf(leaf)
+
+	def remove(self, geometry_object: "BaseGeometryObject") -> None:
+		leaf = self._leaves.pop(id(geometry_object), None)
+
+		if leaf is None:
+			raise AttributeError("The object {} isn't added".format(geometry_object))
+
+		self._remove_leaf(leaf)
+
+	def update(self) -> None:
+		for leaf in self._leaves.values():
+			aabb = leaf.item.aabb
+
+			if not leaf.aabb.is_box_inside(aabb):
+				self._remove_leaf(leaf)
+				leaf.aabb = aabb.get_enlarged(self.margin)
+				self._insert_leaf(leaf)
+
+	def get_pairs(self) -> List[Pair]:
+		"""The tree is descended with itself, so the subtrees that don't overlap are skipped at once"""
+
+		pairs = []
+		not_visited = [(self.root, self.root)] if self.root is not None else []
+
+		while not_visited:
+			first, second = not_visited.pop()
+
+			if first is second:
+				if not first.is_leaf():
+					left, right = first.children
+					not_visited.extend(((left, left), (right, right), (left, right)))
+
+				continue
+
+			if not first.aabb.is_intersect(second.aabb):
+				continue
+
+			if first.is_leaf() and second.is_leaf():
+				# Fat boxes can intersect while the boxes of the objects don't
+				if first.item.aabb.is_intersect(second.item.aabb):
+					pairs.append((first.item, second.item))
+			elif second.is_leaf() or (not first.is_leaf() and first.height >= second.height):
+				not_visited.extend((child, second) for child in first.children)
+			else:
+				not_visited.extend((first, child) for child in second.children)
+
+		return pairs
+
+	def query(self, aabb: AABB) -> List["BaseGeometryObject"]:
+		"""Returns objects which boxes intersect the box"""
+
+		items = []
+		not_visited = [self.root] if self.root is not None else []
+
+		while not_visited:
+			node = not_visited.pop()
+
+			if not node.aabb.is_intersect(aabb):
+				continue
+
+			if not node.is_leaf():
+				not_visited.extend(node.children)
+			elif node.item.aabb.is_intersect(aabb):
+				items.append(node.item)
+
+		return items
+
+	def query_ray(self, ray: Ray) -> List["BaseGeometryObject"]:
+		"""Returns objects which boxes are crossed by the ray (segment or line), ordered by the
+		distance from the first point of the ray to the box
+		"""
+
+		if isinstance(ray, Segment):
+			t_range = (0.0, 1.0)
+		elif isinstance(ray, Line):
+			t_range = (-math.inf, math.inf)
+		else:
+			t_range = (0.0, math.inf)
+
+		origin = ray.first_point
+		vector = ray.get_vector()
+		hits = []
+		not_visited = [self.root] if self.root is not None else []
+
+		while not_visited:
+			node = not_visited.pop()
+			aabb = node.item.aabb if node.is_leaf() else node.aabb
+			entry = _get_ray_entry(aabb, (origin.x, origin.y), (vector.x, vector.y), t_range)
+
+			if entry is None:
+				continue
+
+			if node.is_leaf():
+				hits.append((entry, node.item))
+			else:
+				not_visited.extend(node.children)
+
+		hits.sort(key=lambda hit: hit[0])
+
+		return [item for _, item in hits]
+
+	def _insert_leaf(self, leaf: _Node) -> None:
+		if self.root is None:
+			self.root = leaf
+			leaf.parent = None
+			return
+
+		aabb = leaf.aabb
+		node = self.root
+
+		while not node.is_leaf():
+			combined_perimeter = node.aabb.get_union(aabb).get_perimeter()
+			# Cost of a new parent of the node and the leaf
+			cost = 2 * combined_perimeter
+			# The leaf enlarges all the ancestors of the node it goes down to
+			inheritance_cost = 2 * (combined_perimeter - node.aabb.get_perimeter())
+
+			children_costs = []
+			for child in node.children:
+				perimeter = child.aabb.get_union(aabb).get_perimeter()
+				if not child.is_leaf():
+					perimeter -= child.aabb.get_perimeter()
+
+				children_costs.append(perimeter + inheritance_cost)
+
+			if cost < min(children_costs):
+				break
+
+			node = node.children[0] if children_costs[0] < children_costs[1] else node.children[1]
+
+		sibling = node
+		parent = _Node(sibling.aabb.get_union(aabb))
+		self._replace_child(sibling.parent, sibling, parent)
+		parent.children = [sibling, leaf]
+		sibling.parent = parent
+		leaf.parent = parent
+
+		self._fix_upwards(parent)
+
+	def _remove_leaf(self, leaf: _Node) -> None:
+		if leaf is self.root:
+			self.root = None
+			return
+
+		parent = leaf.parent
+		sibling = parent.children[0] if parent.children[1] is leaf else parent.children[1]
+		self._replace_child(parent.parent, parent, sibling)
+		leaf.parent = None
+
+		if sibling.parent is not None:
+			self._fix_upwards(sibling.parent)
+
+	def _replace_child(self, parent: Optional[_Node], old: _Node, new: _Node) -> None:
+		new.parent = parent
+
+		if parent is None:
+			self.root = new
+		else:
+			parent.children[parent.children.index(old)] = new
+
+	def _fix_upwards(self, node: Optional[_Node]) -> None:
+		while node is not None:
+			node = self._balance(node)
+			node.refit()
+			node = node.parent
+
+	def _balance(self, node: _Node) -> _Node:
+		"""Lifts the higher child if the heights of the children differ more than by one,
+		returns the node that took the place of the node
+		"""
+
+		if node.height < 2:
+			return node
+
+		first, second = node.children
+		balance = second.height - first.height
+
+		if balance > 1:
+			return self._rotate(node, 1)
+		if balance < -1:
+			return self._rotate(node, 0)
+
+		return node
+
+	def _rotate(self, node: _Node, side: int) -> _Node:
+		child = node.children[side]
+		higher, lower = sorted(child.children, key=lambda grandchild: grandchild.height, reverse=True)
+
+		self._replace_child(node.parent, node, child)
+		child.children = [node, higher]
+		node.parent = child
+		node.children[side] = lower
+		lower.parent = node
+
+		node.refit()
+		child.refit()
+
+		return child
+
+
+def _get_ray_entry(aabb: AABB, origin: Tuple[float, float], vector: Tuple[float, float],
+                   t_range: Tuple[float, float]) -> Optional[float]:
+	"""Returns t at which origin + t * vector enters the box (slab test) or None if it misses the box"""
+
+	t_min, t_max = t_range
+
+	for start, direction, min_value, max_value in ((origin[0], vector[0], aabb.min_x, aabb.max_x),
+	                                               (origin[1], vector[1], aabb.min_y, aabb.max_y)):
+		if direction == 0:
+			if not min_value <= start <= max_value:
+				return None
+			continue
+
+		first = (min_value - start) / direction
+		second = (max_value - start) / direction
+		if first > second:
+			first, second = second, first
+
+		t_min = max(t_min, first)
+		t_max = min(t_max, second)
+
+		if t_min > t_max:
+			return None
+
+	return t_min
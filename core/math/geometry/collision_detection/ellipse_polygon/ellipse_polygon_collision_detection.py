@@ -1,92 +1,120 @@
-from typing import Union, Optional, Tuple, List
+from typing import Union, Optional
 
-from core.math.average import average
-from core.math.geometry.collision_detection.line_ellipse.line_ellipse_collision_detection import \
-	get_inter_data_line_circle
-from core.math.vector2d import Vector2d
+from core.math.geometry.collision_detection.collision_data import CollisionData
+from core.math.geometry.collision_detection.ellipse_polygon.ellipse_polygon_overlap import \
+	(is_ellipse_polygon_overlap, get_ellipse_polygon_overlap)
 
 
-def get_inter_data_circle_polygon(circle: "Circle", poly: "ConvexPolygon") \
-		-> Optional[Tuple[List[Vector2d], float]]:
-	return get_inter_data_polygon(circle, poly)
+def get_inter_data_circle_convexpolygon(circle: "Circle", poly: "ConvexPolygon") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(circle, poly)
 
 
-def get_inter_data_polygon(ellipse: Union["Circle", "Ellipse"], poly: "ConvexPolygon") \
-		-> Optional[Tuple[List[Vector2d], float]]:
-	penetration_length: float = 0.0
-	points: List[Vector2d] = []
+def get_inter_data_convexpolygon_circle(poly: "ConvexPolygon", circle: "Circle") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(poly, circle)
 
-	# TODO delete the part if optimization is necessary
-	for diagonal in poly.diagonals:
-		diagonal_inter_data = get_inter_data_line_circle(diagonal, ellipse)
-		if diagonal_inter_data:
-			penetration_length = diagonal_inter_data.penetration_depth
 
-	for side in poly.sides:
-		side_inter_data = get_inter_data_line_circle(side, ellipse)
-		if side_inter_data:
-			points.extend(side_inter_data.intersection_points)
-			if penetration_length == 0.0:
-				penetration_length = average(penetration_length, side_inter_data[1])
+def get_inter_data_circle_rectangle(circle: "Circle", rect: "Rectangle") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(circle, rect)
 
-	if len(points) == 0:
-		return None
 
-	return points, penetration_length
+def get_inter_data_rectangle_circle(rect: "Rectangle", circle: "Circle") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(rect, circle)
+
+
+def get_inter_data_circle_triangle(circle: "Circle", triangle: "Triangle") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(circle, triangle)
+
+
+def get_inter_data_triangle_circle(triangle: "Triangle", circle: "Circle") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(triangle, circle)
+
+
+def get_inter_data_ellipse_convexpolygon(ellipse: "Ellipse", poly: "ConvexPolygon") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(ellipse, poly)
+
+
+def get_inter_data_convexpolygon_ellipse(poly: "ConvexPolygon", ellipse: "Ellipse") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(poly, ellipse)
+
+
+def get_inter_data_ellipse_rectangle(ellipse: "Ellipse", rect: "Rectangle") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(ellipse, rect)
+
 
+def get_inter_data_rectangle_ellipse(rect: "Rectangle", ellipse: "Ellipse") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(rect, ellipse)
 
-def get_inter_data_circle_rectangle(circle: "Circle", rect: "Rectangle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_circle_polygon(circle, rect)
 
+def get_inter_data_ellipse_triangle(ellipse: "Ellipse", triangle: "Triangle") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_polygon(ellipse, triangle)
 
-def get_inter_data_rectangle_circle(rect: "Rectangle", circle: "Circle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_circle_polygon(circle, rect)
 
+def get_inter_data_triangle_ellipse(triangle: "Triangle", ellipse: "Ellipse") -> Optional[CollisionData]:
+	return get_inter_data_polygon_ellipse(triangle, ellipse)
 
-def get_inter_data_polygon_circle(poly: "ConvexPolygon", circle: "Circle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_circle_polygon(circle, poly)
 
+def get_inter_data_circle_concavepolygon(circle: "Circle", poly: "ConcavePolygon") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_parts(circle, poly)
 
-def get_inter_data_circle_triangle(circle: "Circle", triangle: "Triangle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_circle_polygon(circle, triangle)
 
+def get_inter_data_concavepolygon_circle(poly: "ConcavePolygon", circle: "Circle") -> Optional[CollisionData]:
+	return get_inter_data_parts_ellipse(poly, circle)
 
-def get_inter_data_triangle_circle(triangle: "Triangle", circle: "Circle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_circle_polygon(circle, triangle)
 
+def get_inter_data_ellipse_concavepolygon(ellipse: "Ellipse", poly: "ConcavePolygon") -> Optional[CollisionData]:
+	return get_inter_data_ellipse_parts(ellipse, poly)
 
-# "Ellipse"
 
-def get_inter_data_ellipse_rectangle(ellipse: "Ellipse", rect: "Rectangle") -> Optional[
-	Tuple[List[Vector2d], float]]:
-	return get_inter_data_polygon(ellipse, rect)
+def get_inter_data_concavepolygon_ellipse(poly: "ConcavePolygon", ellipse: "Ellipse") -> Optional[CollisionData]:
+	return get_inter_data_parts_ellipse(poly, ellipse)
 
 
-def get_inter_data_rectangle_ellipse(rect: "Rectangle", ellipse: "Ellipse") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_polygon(ellipse, rect)
+def get_inter_data_ellipse_polygon(ellipse: Union["Circle", "Ellipse"],
+                                   poly: "ConvexPolygon") -> Optional[CollisionData]:
+	"""The intersection is checked in the unit space of the ellipse, the normal and the penetration
+	depth are the axis and the overlap of get_ellipse_polygon_overlap
+	"""
+
+	if not is_ellipse_polygon_overlap(ellipse, poly):
+		return None
+
+	overlap, normal = get_ellipse_polygon_overlap(ellipse, poly)
+	ellipse_point = ellipse.get_support_point(normal)
+	poly_point = poly.get_support_point(normal.inverse())
+
+	return CollisionData([ellipse_point, poly_point], max(overlap, 0.0), normal, (ellipse_point, poly_point))
+
+
+def get_inter_data_polygon_ellipse(poly: "ConvexPolygon",
+                                   ellipse: Union["Circle", "Ellipse"]) -> Optional[CollisionData]:
+	data = get_inter_data_ellipse_polygon(ellipse, poly)
+
+	if data is None:
+		return None
+
+	return data.get_reversed()
 
 
-def get_inter_data_ellipse_polygon(ellipse: "Ellipse", poly: "ConvexPolygon") -> Optional[
-	Tuple[List[Vector2d], float]]:
-	return get_inter_data_polygon(ellipse, poly)
+def get_inter_data_ellipse_parts(ellipse: Union["Circle", "Ellipse"],
+                                 poly: "ConcavePolygon") -> Optional[CollisionData]:
+	"""Returns collision data of the convex part of the polygon that the ellipse penetrates the deepest"""
 
+	result = None
 
-def get_inter_data_polygon_ellipse(poly: "ConvexPolygon", ellipse: "Ellipse") -> Optional[
-	Tuple[List[Vector2d], float]]:
-	return get_inter_data_polygon(ellipse, poly)
+	for part in poly.parts_tree.query(ellipse.aabb):
+		data = get_inter_data_ellipse_polygon(ellipse, part)
 
+		if data is not None and (result is None or data.penetration_depth > result.penetration_depth):
+			result = data
 
-def get_inter_data_ellipse_triangle(ellipse: "Ellipse", triangle: "Triangle") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_polygon(ellipse, triangle)
+	return result
 
 
-def get_inter_data_triangle_ellipse(triangle: "Triangle", ellipse: "Ellipse") -> Optional[
-	Tuple[Vector2d, float, float]]:
-	return get_inter_data_polygon(ellipse, triangle)
+def get_inter_data_parts_ellipse(poly: "ConcavePolygon",
+                                 ellipse: Union["Circle", "Ellipse"]) -> Optional[CollisionData]:
+	data = get_inter_data_ellipse_parts(ellipse, poly)
+
+	if data is None:
+		return None
+
+	return data.get_reversed()
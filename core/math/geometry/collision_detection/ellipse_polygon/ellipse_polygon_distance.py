@@ -1,2 +1,82 @@
-def get_distance_circle_convexpolygon(circle: "Circle", convex: "ConvexPolygon") -> float:
-	segment_throuth_center
+from typing import Union
+
+from core.math.geometry.collision_detection.ellipse_polygon.ellipse_polygon_overlap import get_ellipse_polygon_overlap
+
+
+def get_distance_circle_convexpolygon(circle: "Circle", poly: "ConvexPolygon") -> float:
+	return get_distance_ellipse_polygon(circle, poly)
+
+
+def get_distance_convexpolygon_circle(poly: "ConvexPolygon", circle: "Circle") -> float:
+	return get_distance_ellipse_polygon(circle, poly)
+
+
+def get_distance_circle_rectangle(circle: "Circle", rect: "Rectangle") -> float:
+	return get_distance_ellipse_polygon(circle, rect)
+
+
+def get_distance_rectangle_circle(rect: "Rectangle", circle: "Circle") -> float:
+	return get_distance_ellipse_polygon(circle, rect)
+
+
+def get_distance_circle_triangle(circle: "Circle", triangle: "Triangle") -> float:
+	return get_distance_ellipse_polygon(circle, triangle)
+
+
+def get_distance_triangle_circle(triangle: "Triangle", circle: "Circle") -> float:
+	return get_distance_ellipse_polygon(circle, triangle)
+
+
+def get_distance_ellipse_convexpolygon(ellipse: "Ellipse", poly: "ConvexPolygon") -> float:
+	return get_distance_ellipse_polygon(ellipse, poly)
+
+
+def get_distance_convexpolygon_ellipse(poly: "ConvexPolygon", ellipse: "Ellipse") -> float:
+	return get_distance_ellipse_polygon(ellipse, poly)
+
+
+def get_distance_ellipse_rectangle(ellipse: "Ellipse", rect: "Rectangle") -> float:
+	return get_distance_ellipse_polygon(ellipse, rect)
+
+
+def get_distance_rectangle_ellipse(rect: "Rectangle", ellipse: "Ellipse") -> float:
+	return get_distance_ellipse_polygon(ellipse, rect)
+
+
+def get_distance_ellipse_triangle(ellipse: "Ellipse", triangle: "Triangle") -> float:
+	return get_distance_ellipse_polygon(ellipse, triangle)
+
+
+def get_distance_triangle_ellipse(triangle: "Triangle", ellipse: "Ellipse") -> float:
+	return get_distance_ellipse_polygon(ellipse, triangle)
+
+
+def get_distance_circle_concavepolygon(circle: "Circle", poly: "ConcavePolygon") -> float:
+	return get_distance_ellipse_parts(circle, poly)
+
+
+def get_distance_concavepolygon_circle(poly: "ConcavePolygon", circle: "Circle") -> float:
+	return get_distance_ellipse_parts(circle, poly)
+
+
+def get_distance_ellipse_concavepolygon(ellipse: "Ellipse", poly: "ConcavePolygon") -> float:
+	return get_distance_ellipse_parts(ellipse, poly)
+
+
+def get_distance_concavepolygon_ellipse(poly: "ConcavePolygon", ellipse: "Ellipse") -> float:
+	return get_distance_ellipse_parts(ellipse, poly)
+
+
+def get_distance_ellipse_polygon(ellipse: Union["Circle", "Ellipse"], poly: "ConvexPolygon") -> float:
+	"""If the shapes intersect returns negative penetration depth"""
+
+	overlap, _ = get_ellipse_polygon_overlap(ellipse, poly)
+
+	return -overlap
+
+
+def get_distance_ellipse_parts(ellipse: Union["Circle", "Ellipse"], poly: "ConcavePolygon") -> float:
+	"""Returns the distance to the closest convex part of the polygon, if the ellipse intersects
+	some parts returns negative penetration depth of the deepest one"""
+
+	return min(get_distance_ellipse_polygon(ellipse, part) for part in poly.convex_parts)
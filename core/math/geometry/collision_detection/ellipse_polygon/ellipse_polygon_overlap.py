@@ -0,0 +1,71 @@
+import math
+from typing import Union, Tuple
+
+import numpy as np
+
+from core.math.geometry.collision_detection.ellipses.ellipses_overlap import get_min_overlap
+from core.math.geometry.point_in_polygon import is_points_inside_polygon
+from core.math.vector2d import Vector2d
+
+
+def is_ellipse_polygon_overlap(ellipse: Union["Circle", "Ellipse"], poly: "BasePolygon") -> bool:
+	"""Moves the polygon into the unit space of the ellipse, there the ellipse is the unit circle,
+	so the shapes intersect if the origin is inside the polygon or the border is closer than 1
+	"""
+
+	unit_vertices = ellipse.to_unit_space_array(poly.vertices)
+
+	if _get_closest_border_distance(unit_vertices) <= 1:
+		return True
+
+	return bool(is_points_inside_polygon(unit_vertices, np.zeros((1, 2)))[0])
+
+
+def get_ellipse_polygon_overlap(ellipse: Union["Circle", "Ellipse"],
+                                poly: "ConvexPolygon") -> Tuple[float, Vector2d]:
+	"""Finds the axis on which projections of the ellipse and the convex polygon overlap the least
+
+	Overlap on the axis is the largest of the smooth functions of the vertices. Its minimum is
+	either at a side normal, where the extreme vertex changes, or at a minimum of a vertex
+	function, the normal of the ellipse at the border point closest to the vertex is one of
+	them. These axes are the extra samples of get_min_overlap
+
+	Returns the overlap (the penetration depth or the negative distance) and the axis that points
+	from the ellipse to the polygon
+	"""
+
+	vertices = poly.vertices
+	center = ellipse.center
+
+	def get_overlap(angle: float) -> float:
+		axis = Vector2d(math.cos(angle), math.sin(angle), exact=True)
+		return center.x * axis.x + center.y * axis.y + ellipse.get_extent(axis) - \
+		       float((vertices @ (axis.x, axis.y)).min())
+
+	normals = poly.edge_normals
+	# Sides of zero length don't have normals
+	angles = [angle for angle in np.arctan2(normals[:, 1], normals[:, 0]).tolist() if not math.isnan(angle)]
+	angles.extend([angle + math.pi for angle in angles])
+
+	for x, y in vertices.tolist():
+		border_point = ellipse.get_closest_point(Vector2d(x, y, exact=True))
+
+		if x != border_point.x or y != border_point.y:
+			angle = math.atan2(y - border_point.y, x - border_point.x)
+			angles.extend((angle, angle + math.pi))
+
+	centroid = vertices.mean(axis=0)
+
+	return get_min_overlap(get_overlap, math.atan2(centroid[1] - center.y, centroid[0] - center.x), angles)
+
+
+def _get_closest_border_distance(vertices: np.ndarray) -> float:
+	"""Returns distance from the origin to the closest point of the polygon border"""
+
+	sides = np.roll(vertices, -1, axis=0) - vertices
+	squared_lengths = (sides * sides).sum(axis=1)
+	t = -(vertices * sides).sum(axis=1) / np.where(squared_lengths == 0, 1.0, squared_lengths)
+	t = np.clip(t, 0.0, 1.0)
+	points = vertices + sides * t[:, np.newaxis]
+
+	return float(np.hypot(points[:, 0], points[:, 1]).min())
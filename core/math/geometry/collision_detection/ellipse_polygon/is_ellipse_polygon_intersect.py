@@ -0,0 +1,75 @@
+from typing import Union
+
+from core.math.geometry.collision_detection.ellipse_polygon.ellipse_polygon_overlap import is_ellipse_polygon_overlap
+
+
+def is_intersect_circle_convexpolygon(circle: "Circle", poly: "ConvexPolygon") -> bool:
+	return is_intersect_ellipse_polygon(circle, poly)
+
+
+def is_intersect_convexpolygon_circle(poly: "ConvexPolygon", circle: "Circle") -> bool:
+	return is_intersect_ellipse_polygon(circle, poly)
+
+
+def is_intersect_circle_rectangle(circle: "Circle", rect: "Rectangle") -> bool:
+	return is_intersect_ellipse_polygon(circle, rect)
+
+
+def is_intersect_rectangle_circle(rect: "Rectangle", circle: "Circle") -> bool:
+	return is_intersect_ellipse_polygon(circle, rect)
+
+
+def is_intersect_circle_triangle(circle: "Circle", triangle: "Triangle") -> bool:
+	return is_intersect_ellipse_polygon(circle, triangle)
+
+
+def is_intersect_triangle_circle(triangle: "Triangle", circle: "Circle") -> bool:
+	return is_intersect_ellipse_polygon(circle, triangle)
+
+
+def is_intersect_ellipse_convexpolygon(ellipse: "Ellipse", poly: "ConvexPolygon") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, poly)
+
+
+def is_intersect_convexpolygon_ellipse(poly: "ConvexPolygon", ellipse: "Ellipse") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, poly)
+
+
+def is_intersect_ellipse_rectangle(ellipse: "Ellipse", rect: "Rectangle") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, rect)
+
+
+def is_intersect_rectangle_ellipse(rect: "Rectangle", ellipse: "Ellipse") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, rect)
+
+
+def is_intersect_ellipse_triangle(ellipse: "Ellipse", triangle: "Triangle") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, triangle)
+
+
+def is_intersect_triangle_ellipse(triangle: "Triangle", ellipse: "Ellipse") -> bool:
+	return is_intersect_ellipse_polygon(ellipse, triangle)
+
+
+def is_intersect_circle_concavepolygon(circle: "Circle", poly: "ConcavePolygon") -> bool:
+	return is_intersect_ellipse_parts(circle, poly)
+
+
+def is_intersect_concavepolygon_circle(poly: "ConcavePolygon", circle: "Circle") -> bool:
+	return is_intersect_ellipse_parts(circle, poly)
+
+
+def is_intersect_ellipse_concavepolygon(ellipse: "Ellipse", poly: "ConcavePolygon") -> bool:
+	return is_intersect_ellipse_parts(ellipse, poly)
+
+
+def is_intersect_concavepolygon_ellipse(poly: "ConcavePolygon", ellipse: "Ellipse") -> bool:
+	return is_intersect_ellipse_parts(ellipse, poly)
+
+
+def is_intersect_ellipse_polygon(ellipse: Union["Circle", "Ellipse"], poly: "ConvexPolygon") -> bool:
+	return is_ellipse_polygon_overlap(ellipse, poly)
+
+
+def is_intersect_ellipse_parts(ellipse: Union["Circle", "Ellipse"], poly: "ConcavePolygon") -> bool:
+	return any(is_ellipse_polygon_overlap(ellipse, part) for part in poly.parts_tree.query(ellipse.aabb))
@@ -1,67 +1,67 @@
-from typing import Optional, Union, Tuple
+import math
+from typing import Optional, Union
 
 from core.math.geometry.collision_detection.collision_data import CollisionData
-from core.math.geometry.collision_detection.line_ellipse.line_ellipse_collision_detection import \
-	(get_inter_data_segment_circle, get_inter_data_segment_ellipse)
-from core.math.geometry.geometry_objects import Segment
+from core.math.vector2d import Vector2d
 from .ellipses_intersection_points import *
+from .ellipses_overlap import get_ellipses_overlap
 
 
 def get_inter_data_circle_circle(first_circle: "Circle", second_circle: "Circle") -> Optional[CollisionData]:
-	distance_between_centres = (first_circle.center - second_circle.center).get_magnitude()
-	radius = first_circle.radius + second_circle.radius
-	penetration_depth = radius - distance_between_centres
+	"""Circles with the same center are pushed apart along x, as in the batched kernel"""
+
+	first_center = first_circle.center
+	second_center = second_circle.center
+	offset_x = second_center.x - first_center.x
+	offset_y = second_center.y - first_center.y
+	distance = math.hypot(offset_x, offset_y)
+	penetration_depth = first_circle.radius + second_circle.radius - distance
 
 	if penetration_depth < 0:
 		return None
-	elif penetration_depth == 0:
-		points = get_one_inter_point_circle_circle(first_circle, second_circle)
+
+	if distance == 0:
+		normal = Vector2d(1, 0, exact=True)
+	else:
+		normal = Vector2d(offset_x / distance, offset_y / distance, exact=True)
+
+	first_point = Vector2d(first_center.x + normal.x * first_circle.radius,
+	                       first_center.y + normal.y * first_circle.radius, exact=True)
+	second_point = Vector2d(second_center.x - normal.x * second_circle.radius,
+	                        second_center.y - normal.y * second_circle.radius, exact=True)
+
+	if penetration_depth == 0:
+		points = [first_point]
 	else:
 		points = get_two_inter_points_circle_circle(first_circle, second_circle)
 
-	return CollisionData(points, penetration_depth)
+	return CollisionData(points, penetration_depth, normal, (first_point, second_point))
 
 
 def get_inter_data_circle_ellipse(circle: "Circle", ellipse: "Ellipse") -> Optional[CollisionData]:
-	data = get_inter_ellipse_ellipse(circle, ellipse, get_inter_data_segment_circle,
-	                                 get_inter_data_segment_ellipse)
-	return CollisionData([data[0]], data[2])
+	return get_inter_data_ellipses(circle, ellipse)
 
 
 def get_inter_data_ellipse_circle(ellipse: "Ellipse", circle: "Circle") -> Optional[CollisionData]:
-	data = get_inter_ellipse_ellipse(circle, ellipse, get_inter_data_segment_circle,
-	                                 get_inter_data_segment_ellipse)
-
-	return CollisionData([data[1]], data[2])
+	return get_inter_data_ellipses(ellipse, circle)
 
 
 def get_inter_data_ellipse_ellipse(first_ellipse: "Ellipse", second_ellipse: "Ellipse") -> Optional[
 	CollisionData]:
-	data = get_inter_ellipse_ellipse(first_ellipse, second_ellipse, get_inter_data_segment_ellipse,
-	                                 get_inter_data_segment_ellipse)
-
-	return CollisionData([data[0]], data[2])
-
-
-def get_inter_ellipse_ellipse(first_shape: Union["Circle", "Ellipse"],
-                              second_shape: Union["Circle", "Ellipse"], segment_first_inter_func,
-                              segment_second_inter_func) -> Tuple[Vector2d, Vector2d, float]:
-	segment_through_centers = Segment(first_shape.center, second_shape.center)
-
-	circle_inter_data = segment_first_inter_func(segment_through_centers, first_shape)
-	ellipse_inter_data = segment_second_inter_func(segment_through_centers, second_shape)
+	return get_inter_data_ellipses(first_ellipse, second_ellipse)
 
-	circle_inter_point = circle_inter_data.intersection_points[0]
-	ellipse_inter_point = ellipse_inter_data.intersection_points[0]
 
-	distance_to_circle_inter_point = (circle_inter_point - first_shape.center).get_magnitude()
-	distance_to_ellipse_inter_point = (ellipse_inter_point - second_shape.center).get_magnitude()
+def get_inter_data_ellipses(first_shape: Union["Circle", "Ellipse"],
+                            second_shape: Union["Circle", "Ellipse"]) -> Optional[CollisionData]:
+	"""The normal and the penetration depth are the axis and the overlap of get_ellipses_overlap,
+	contact points are the farthest points of the shapes along the axis
+	"""
 
-	# If an ellipse and a circle intersect with each other than segment-ellipse intersection point should lay
-	# closer or at the same place as segment-circle intersection point
-	if distance_to_ellipse_inter_point > distance_to_circle_inter_point:
+	overlap, normal = get_ellipses_overlap(first_shape, second_shape)
+	if overlap < 0:
 		return None
 
-	penetration_depth = (ellipse_inter_point - circle_inter_point).get_magnitude()
+	first_point = first_shape.get_support_point(normal)
+	second_point = second_shape.get_support_point(normal.inverse())
 
-	return circle_inter_point, ellipse_inter_point, penetration_depth
+	return CollisionData([first_point, second_point], overlap, normal, (first_point, second_point))
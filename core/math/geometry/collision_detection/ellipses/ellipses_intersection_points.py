@@ -14,22 +14,27 @@ def get_one_inter_point_circle_circle(first_circle: "Circle", second_circle: "Ci
 
 def get_two_inter_points_circle_circle(first_circle: "Circle", second_circle: "Circle") \
 		-> List[Vector2d]:
+	"""Returns points where the borders of the circles cross, no points if one circle is inside
+	the other one or the circles don't intersect
+	"""
+
 	# https://planetcalc.com/8098/
 	r1 = first_circle.radius
 	r2 = second_circle.radius
-	d = r1 + r2
-
 	center1 = first_circle.center
 	center2 = second_circle.center
+	dx = center2.x - center1.x
+	dy = center2.y - center1.y
+	d = math.hypot(dx, dy)
 
-	a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * d)
-	h = math.sqrt(r1 ** 2 - a ** 2)
-	middle_point = center1.add_vector(center1.subtract_vector(center2).scale(a / d))
+	if d == 0 or d > r1 + r2 or d < abs(r1 - r2):
+		return []
 
-	p1_x = middle_point.x + h / d * (center2.y - center1.y)
-	p1_y = middle_point.x - h / d * (center2.x - center1.x)
-
-	p2_x = middle_point.x - h / d * (center2.y - center1.y)
-	p2_y = middle_point.x + h / d * (center2.x - center1.x)
+	# Distance from the first center to the chord and half of the chord
+	a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * d)
+	h = math.sqrt(max(r1 ** 2 - a ** 2, 0.0))
+	middle_x = center1.x + dx * a / d
+	middle_y = center1.y + dy * a / d
 
-	return [Vector2d(p1_x, p1_y), Vector2d(p2_x, p2_y)]
+	return [Vector2d(middle_x + h / d * dy, middle_y - h / d * dx, exact=True),
+	        Vector2d(middle_x - h / d * dy, middle_y + h / d * dx, exact=True)]
@@ -0,0 +1,88 @@
+import math
+from typing import Union, Tuple, Callable, Iterable
+
+from core.math.vector2d import Vector2d
+
+# Directions checked before the refinement, the first one goes from the first center to the second one
+ELLIPSES_OVERLAP_SAMPLES = 16
+# Count of the best samples that are refined, the overlap can have several minima
+ELLIPSES_OVERLAP_REFINED_SAMPLES = 2
+# Golden section steps around a sample, the angle error is below 1e-4 after 20 ones
+ELLIPSES_OVERLAP_ITERATIONS = 20
+
+_GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+def get_ellipses_overlap(first_shape: Union["Circle", "Ellipse"],
+                         second_shape: Union["Circle", "Ellipse"]) -> Tuple[float, Vector2d]:
+	"""Finds the axis on which projections of the shapes overlap the least
+
+	Overlap on the unit axis n is (first_center - second_center) * n + extent_1(n) + extent_2(n),
+	where the extents are half lengths of the projections. It's the penetration depth on
+	the smallest axis and the negative distance if the shapes don't intersect (separating axis
+	theorem works on any axis for convex shapes). The overlap is a smooth function of the axis
+	angle, so the best of the sampled angles are refined by the golden section search
+
+	Returns the overlap and the axis that points from the first shape to the second one
+	"""
+
+	offset_x = first_shape.center.x - second_shape.center.x
+	offset_y = first_shape.center.y - second_shape.center.y
+	center_angle = math.atan2(-offset_y, -offset_x)
+
+	def get_overlap(angle: float) -> float:
+		axis = Vector2d(math.cos(angle), math.sin(angle), exact=True)
+		return offset_x * axis.x + offset_y * axis.y + first_shape.get_extent(axis) + second_shape.get_extent(axis)
+
+	angles = []
+
+	# Overlap of crossed thin ellipses has narrow minima near their axes
+	for shape in (first_shape, second_shape):
+		rotation = math.radians(shape.get_pose()[2])
+		angles.extend(rotation + math.pi / 2 * i for i in range(4))
+
+	return get_min_overlap(get_overlap, center_angle, angles)
+
+
+def get_min_overlap(get_overlap: Callable[[float], float], start_angle: float,
+                    extra_angles: Iterable[float] = ()) -> Tuple[float, Vector2d]:
+	"""Samples the overlap on ELLIPSES_OVERLAP_SAMPLES angles from the start one and on the extra
+	angles, the best samples are refined by the golden section search
+
+	Returns the smallest found overlap and its axis
+	"""
+
+	step = 2 * math.pi / ELLIPSES_OVERLAP_SAMPLES
+	angles = [start_angle + step * i for i in range(ELLIPSES_OVERLAP_SAMPLES)]
+	angles.extend(extra_angles)
+
+	samples = sorted((get_overlap(angle), angle) for angle in angles)
+
+	return min((_refine(get_overlap, angle - step, angle + step, overlap, angle)
+	            for overlap, angle in samples[:ELLIPSES_OVERLAP_REFINED_SAMPLES]), key=lambda item: item[0])
+
+
+def _refine(get_overlap: Callable[[float], float], low: float, high: float, overlap: float,
+            angle: float) -> Tuple[float, Vector2d]:
+	"""Golden section search of the minimum between low and high"""
+
+	first_angle = high - _GOLDEN_RATIO * (high - low)
+	second_angle = low + _GOLDEN_RATIO * (high - low)
+	first_overlap = get_overlap(first_angle)
+	second_overlap = get_overlap(second_angle)
+
+	for _ in range(ELLIPSES_OVERLAP_ITERATIONS):
+		if first_overlap < second_overlap:
+			high = second_angle
+			second_angle, second_overlap = first_angle, first_overlap
+			first_angle = high - _GOLDEN_RATIO * (high - low)
+			first_overlap = get_overlap(first_angle)
+		else:
+			low = first_angle
+			first_angle, first_overlap = second_angle, second_overlap
+			second_angle = low + _GOLDEN_RATIO * (high - low)
+			second_overlap = get_overlap(second_angle)
+
+	overlap, angle = min((overlap, angle), (first_overlap, first_angle), (second_overlap, second_angle))
+
+	return overlap, Vector2d(math.cos(angle), math.sin(angle), exact=True)
@@ -0,0 +1,129 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from core.math.geometry.collision_detection.collision_data import CollisionData
+from core.math.geometry.collision_detection.gjk import gjk, get_minkowski_support, SimplexPoint, GJKResult
+from core.math.geometry.convex_hull import get_convex_hull_indexes
+from core.math.vector2d import Vector2d
+
+EPA_MAX_ITERATIONS = 32
+EPA_TOLERANCE = 1e-4
+
+# Directions that complete a degenerate simplex (the shapes touch or GJK stopped early)
+_START_DIRECTIONS = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
+
+
+def get_inter_data_convex_shapes(first_shape: "BaseShape", second_shape: "BaseShape") -> \
+		Optional[CollisionData]:
+	"""Returns collision data of two convex shapes, None if they don't intersect
+
+	GJK checks the intersection, EPA finds penetration depth, normal and contact points
+	"""
+
+	result = gjk(first_shape, second_shape)
+	if not result.is_intersect:
+		return None
+
+	return epa(first_shape, second_shape, result)
+
+
+def epa(first_shape: "BaseShape", second_shape: "BaseShape", gjk_result: GJKResult,
+        max_iterations: int = EPA_MAX_ITERATIONS) -> Optional[CollisionData]:
+	"""Uses Expanding Polytope Algorithm to find penetration of intersecting convex shapes
+
+	The polytope starts from the last GJK simplex (it contains the origin) and is expanded
+	by the support point in the direction of the side that is the closest to the origin,
+	until the side can't be moved any farther. The side gives the normal and the penetration depth
+
+	Returns None if the shapes don't have an area (the polytope can't be built)
+	"""
+
+	polytope = _get_start_polytope(first_shape, second_shape, gjk_result.simplex)
+	if polytope is None:
+		return None
+
+	for _ in range(max_iterations):
+		index, normal, distance = _get_closest_side(polytope)
+		new_point = get_minkowski_support(first_shape, second_shape, normal)
+		(x, y), _, _ = new_point
+
+		if x * normal[0] + y * normal[1] - distance <= EPA_TOLERANCE or \
+				any(point[0] == (x, y) for point in polytope):
+			break
+
+		polytope.insert(index + 1, new_point)
+	else:
+		index, normal, distance = _get_closest_side(polytope)
+
+	return _get_collision_data(polytope[index], polytope[(index + 1) % len(polytope)], normal,
+	                           max(distance, 0.0))
+
+
+def _get_start_polytope(first_shape: "BaseShape", second_shape: "BaseShape",
+                        simplex: List[SimplexPoint]) -> Optional[List[SimplexPoint]]:
+	"""Returns the points in counterclockwise order without collinear ones"""
+
+	points = list(simplex)
+	hull_indexes = get_convex_hull_indexes(np.array([point[0] for point in points], dtype=np.float64))
+
+	if len(hull_indexes) < 3:
+		points.extend(get_minkowski_support(first_shape, second_shape, direction)
+		              for direction in _START_DIRECTIONS)
+		hull_indexes = get_convex_hull_indexes(np.array([point[0] for point in points], dtype=np.float64))
+
+	if len(hull_indexes) < 3:
+		return None
+
+	return [points[i] for i in hull_indexes]
+
+
+def _get_closest_side(polytope: List[SimplexPoint]) -> Tuple[int, Tuple[float, float], float]:
+	"""Returns index of the first point of the side, its outward normal and distance to the origin"""
+
+	closest_index = 0
+	closest_normal = (0.0, 0.0)
+	closest_distance = math.inf
+	count = len(polytope)
+
+	for i in range(count):
+		ax, ay = polytope[i][0]
+		bx, by = polytope[(i + 1) % count][0]
+
+		# Outward normal of a counterclockwise side is the side rotated clockwise
+		normal_x = by - ay
+		normal_y = ax - bx
+		length = math.hypot(normal_x, normal_y)
+		if length == 0:
+			continue
+
+		normal_x /= length
+		normal_y /= length
+		distance = ax * normal_x + ay * normal_y
+
+		if distance < closest_distance:
+			closest_index = i
+			closest_normal = (normal_x, normal_y)
+			closest_distance = distance
+
+	return closest_index, closest_normal, closest_distance
+
+
+def _get_collision_data(first: SimplexPoint, second: SimplexPoint, normal: Tuple[float, float],
+                        distance: float) -> CollisionData:
+	(ax, ay), (first_ax, first_ay), (second_ax, second_ay) = first
+	(bx, by), (first_bx, first_by), (second_bx, second_by) = second
+
+	# Position of the origin projection on the side
+	side_x = bx - ax
+	side_y = by - ay
+	squared_length = side_x * side_x + side_y * side_y
+	t = ((normal[0] * distance - ax) * side_x + (normal[1] * distance - ay) * side_y) / squared_length
+	t = min(max(t, 0.0), 1.0)
+
+	first_contact = Vector2d(first_ax + (first_bx - first_ax) * t, first_ay + (first_by - first_ay) * t)
+	second_contact = Vector2d(second_ax + (second_bx - second_ax) * t, second_ay + (second_by - second_ay) * t)
+
+	# Shapes are generic here, callers that can find the border crossings add them
+	return CollisionData([], distance, Vector2d(normal[0], normal[1], exact=True), (first_contact, second_contact))
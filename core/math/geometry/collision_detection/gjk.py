@@ -0,0 +1,180 @@
+import math
+from typing import List, Tuple, Optional
+
+from core.math.vector2d import Vector2d
+
+# Point of the Minkowski difference and the support points of both shapes it was made from
+# ((x, y), (first_x, first_y), (second_x, second_y))
+SimplexPoint = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]
+
+GJK_MAX_ITERATIONS = 32
+GJK_TOLERANCE = 1e-6
+
+
+class GJKResult:
+	"""Result of the GJK query
+
+	is_intersect: either the shapes intersect
+	distance: separation distance, 0 if the shapes intersect
+	first_point, second_point: the closest points of the first and the second shape,
+							   None if the shapes intersect
+	simplex: the last simplex, if the shapes intersect it's a triangle that contains the origin
+			 and can be used as start polytope of EPA
+	"""
+
+	def __init__(self, is_intersect: bool, distance: float, first_point: Optional[Vector2d],
+	             second_point: Optional[Vector2d], simplex: List[SimplexPoint]):
+		self.is_intersect = is_intersect
+		self.distance = distance
+		self.first_point = first_point
+		self.second_point = second_point
+		self.simplex = simplex
+
+	def __bool__(self) -> bool:
+		return self.is_intersect
+
+
+def gjk(first_shape: "BaseShape", second_shape: "BaseShape", distance_query: bool = True,
+        max_iterations: int = GJK_MAX_ITERATIONS) -> GJKResult:
+	"""Uses Gilbert-Johnson-Keerthi algorithm to check if convex shapes intersect and
+	to find the distance and the closest points between them
+
+	Works with every shape that implements get_support_point. The simplex of the Minkowski
+	difference is moved to the origin, each iteration costs one support call for each shape.
+	If distance_query is False the search stops as soon as a separating direction is found,
+	distance and the closest points aren't set in this case
+	"""
+
+	direction = _get_start_direction(first_shape, second_shape)
+	simplex = [get_minkowski_support(first_shape, second_shape, direction)]
+
+	for _ in range(max_iterations):
+		closest, simplex, weights = _reduce_simplex(simplex)
+		closest_x, closest_y = closest
+		squared_distance = closest_x * closest_x + closest_y * closest_y
+
+		if squared_distance <= GJK_TOLERANCE * GJK_TOLERANCE:
+			return GJKResult(True, 0.0, None, None, simplex)
+
+		new_point = get_minkowski_support(first_shape, second_shape, (-closest_x, -closest_y))
+		(x, y), _, _ = new_point
+		projection = closest_x * x + closest_y * y
+
+		if not distance_query and projection > 0:
+			# The origin is behind the farthest point in the direction, so it's out of the difference
+			return GJKResult(False, math.sqrt(squared_distance), None, None, simplex)
+
+		# The new point doesn't move the simplex closer to the origin
+		if squared_distance - projection <= GJK_TOLERANCE * squared_distance or \
+				any(point[0] == (x, y) for point in simplex):
+			break
+
+		simplex.append(new_point)
+
+	else:
+		closest, simplex, weights = _reduce_simplex(simplex)
+		closest_x, closest_y = closest
+		squared_distance = closest_x * closest_x + closest_y * closest_y
+
+	first_point, second_point = _get_closest_points(simplex, weights)
+
+	return GJKResult(False, math.sqrt(squared_distance), first_point, second_point, simplex)
+
+
+def is_intersect_gjk(first_shape: "BaseShape", second_shape: "BaseShape") -> bool:
+	return gjk(first_shape, second_shape, distance_query=False).is_intersect
+
+
+def _get_start_direction(first_shape: "BaseShape", second_shape: "BaseShape") -> Tuple[float, float]:
+	first_point = first_shape.get_support_point(Vector2d(1, 0, exact=True))
+	second_point = second_shape.get_support_point(Vector2d(-1, 0, exact=True))
+	direction = (second_point.x - first_point.x, second_point.y - first_point.y)
+
+	if direction == (0.0, 0.0):
+		return 1.0, 0.0
+
+	return direction
+
+
+def get_minkowski_support(first_shape: "BaseShape", second_shape: "BaseShape",
+                          direction: Tuple[float, float]) -> SimplexPoint:
+	"""Gets the support point of the Minkowski difference (first - second) in the direction"""
+
+	x, y = direction
+	first_point = first_shape.get_support_point(Vector2d(x, y, exact=True))
+	second_point = second_shape.get_support_point(Vector2d(-x, -y, exact=True))
+
+	return ((first_point.x - second_point.x, first_point.y - second_point.y),
+	        (first_point.x, first_point.y), (second_point.x, second_point.y))
+
+
+def _reduce_simplex(simplex: List[SimplexPoint]) -> Tuple[Tuple[float, float], List[SimplexPoint],
+                                                          List[float]]:
+	"""Finds the point of the simplex that is the closest to the origin
+
+	Returns the point, the smallest part of the simplex that contains it and barycentric
+	weights of the point in the part
+	"""
+
+	if len(simplex) == 1:
+		return simplex[0][0], simplex, [1.0]
+
+	if len(simplex) == 2:
+		return _get_closest_on_segment(simplex[0], simplex[1])
+
+	a, b, c = simplex
+	(ax, ay), (bx, by), (cx, cy) = a[0], b[0], c[0]
+
+	# The origin is inside the triangle if it's on the same side of all the edges
+	first_cross = (bx - ax) * -ay - (by - ay) * -ax
+	second_cross = (cx - bx) * -by - (cy - by) * -bx
+	third_cross = (ax - cx) * -cy - (ay - cy) * -cx
+
+	if (first_cross >= 0 and second_cross >= 0 and third_cross >= 0) or \
+			(first_cross <= 0 and second_cross <= 0 and third_cross <= 0):
+		return (0.0, 0.0), simplex, [1 / 3, 1 / 3, 1 / 3]
+
+	best = None
+	best_squared_distance = math.inf
+
+	for first, second in ((a, b), (b, c), (c, a)):
+		result = _get_closest_on_segment(first, second)
+		x, y = result[0]
+
+		if x * x + y * y < best_squared_distance:
+			best_squared_distance = x * x + y * y
+			best = result
+
+	return best
+
+
+def _get_closest_on_segment(first: SimplexPoint, second: SimplexPoint) -> \
+		Tuple[Tuple[float, float], List[SimplexPoint], List[float]]:
+	(ax, ay), (bx, by) = first[0], second[0]
+	vector_x = bx - ax
+	vector_y = by - ay
+	squared_length = vector_x * vector_x + vector_y * vector_y
+
+	if squared_length == 0:
+		return first[0], [first], [1.0]
+
+	t = -(ax * vector_x + ay * vector_y) / squared_length
+
+	if t <= 0:
+		return first[0], [first], [1.0]
+	if t >= 1:
+		return second[0], [second], [1.0]
+
+	return (ax + vector_x * t, ay + vector_y * t), [first, second], [1 - t, t]
+
+
+def _get_closest_points(simplex: List[SimplexPoint], weights: List[float]) -> Tuple[Vector2d, Vector2d]:
+	first_x = first_y = second_x = second_y = 0.0
+
+	for (_, (x1, y1), (x2, y2)), weight in zip(simplex, weights):
+		first_x += x1 * weight
+		first_y += y1 * weight
+		second_x += x2 * weight
+		second_y += y2 * weight
+
+	return Vector2d(first_x, first_y), Vector2d(second_x, second_y)
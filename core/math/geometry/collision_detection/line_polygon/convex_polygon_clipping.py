@@ -0,0 +1,159 @@
+import math
+from typing import Optional, List, Callable, Tuple
+
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
+
+
+class ClipResult:
+	"""Part of a line that lays inside a convex polygon
+
+	The line is first_point + vector * t, entry_t <= exit_t are parameters of the part ends,
+	entry_point and exit_point are the ends. An end is on the border if the line crosses the
+	border there, it isn't if it's the start of a ray or an end of a segment inside the polygon
+
+	penetration_depth: the distance the line should be moved across itself to leave the polygon
+	"""
+
+	def __init__(self, entry_t: float, exit_t: float, entry_point: Vector2d, exit_point: Vector2d,
+	             is_entry_on_border: bool, is_exit_on_border: bool, penetration_depth: float):
+		self.entry_t = entry_t
+		self.exit_t = exit_t
+		self.entry_point = entry_point
+		self.exit_point = exit_point
+		self.is_entry_on_border = is_entry_on_border
+		self.is_exit_on_border = is_exit_on_border
+		self.penetration_depth = penetration_depth
+
+	def get_border_points(self) -> List[Vector2d]:
+		"""Returns the points where the line crosses the border, one point if the line touches it"""
+
+		points = []
+
+		if self.is_entry_on_border:
+			points.append(self.entry_point)
+
+		if self.is_exit_on_border and not (points and points[0] == self.exit_point):
+			points.append(self.exit_point)
+
+		return points
+
+
+def clip_line_convexpolygon(line: "Line", poly: "ConvexPolygon") -> Optional[ClipResult]:
+	return clip_convexpolygon(line.first_point, line.get_vector(), poly)
+
+
+def clip_ray_convexpolygon(ray: "Ray", poly: "ConvexPolygon") -> Optional[ClipResult]:
+	return clip_convexpolygon(ray.first_point, ray.get_vector(), poly, min_t=0.0)
+
+
+def clip_segment_convexpolygon(segment: "Segment", poly: "ConvexPolygon") -> Optional[ClipResult]:
+	return clip_convexpolygon(segment.first_point, segment.get_vector(), poly, min_t=0.0, max_t=1.0)
+
+
+def clip_convexpolygon(first_point: Vector2d, vector: Vector2d, poly: "ConvexPolygon",
+                       min_t: float = -math.inf, max_t: float = math.inf) -> Optional[ClipResult]:
+	"""Clips the line first_point + vector * t, min_t <= t <= max_t by the convex polygon
+
+	Signed distances from the line to the vertices grow along the border from the vertex that is
+	the farthest on the right of the line to the farthest one on the left and then go down.
+	The farthest vertices are found by ConvexPolygon.get_extreme_index, the points where the
+	distance crosses zero by binary search on both chains, so it takes O(log n). The line is moved
+	into the polygon local space, world-space vertices aren't needed
+
+	Returns None if the line doesn't touch the polygon
+	"""
+
+	length = vector.get_magnitude()
+	normal = Vector2d(-vector.y, vector.x, exact=True)
+	x, y, rotation = poly.get_pose()
+
+	start_x = first_point.x - x
+	start_y = first_point.y - y
+	vector_x = vector.x
+	vector_y = vector.y
+
+	if rotation != 0:
+		radians = math.radians(rotation)
+		cos = math.cos(radians)
+		sin = math.sin(radians)
+		start_x, start_y = start_x * cos + start_y * sin, start_y * cos - start_x * sin
+		vector_x, vector_y = vector_x * cos + vector_y * sin, vector_y * cos - vector_x * sin
+
+	points = poly.local_points
+	count = poly.points_count
+
+	def get_distance(index: int) -> float:
+		point = points[index]
+		return vector_x * (point.y - start_y) - vector_y * (point.x - start_x)
+
+	left_index = poly.get_extreme_index(normal)
+	right_index = poly.get_extreme_index(normal.inverse())
+	left_distance = get_distance(left_index)
+	right_distance = get_distance(right_index)
+	tolerance = POINTS_TOLERANCE * length
+
+	if left_distance < -tolerance or right_distance > tolerance:
+		return None
+
+	crossings = (_get_crossing(get_distance, right_index, left_index, count, 1.0),
+	             _get_crossing(get_distance, left_index, right_index, count, -1.0))
+	parameters = []
+
+	for first_index, second_index, weight in crossings:
+		first = points[first_index]
+		second = points[second_index]
+		crossing_x = first.x + (second.x - first.x) * weight - start_x
+		crossing_y = first.y + (second.y - first.y) * weight - start_y
+
+		parameters.append((crossing_x * vector_x + crossing_y * vector_y) / (length * length))
+
+	entry_t = min(parameters)
+	exit_t = max(parameters)
+	t_tolerance = POINTS_TOLERANCE / length
+
+	if exit_t < min_t - t_tolerance or entry_t > max_t + t_tolerance:
+		return None
+
+	is_entry_on_border = entry_t >= min_t
+	is_exit_on_border = exit_t <= max_t
+	entry_t = min(max(entry_t, min_t), max_t)
+	exit_t = min(max(exit_t, min_t), max_t)
+
+	return ClipResult(entry_t, exit_t, first_point.add_scaled_vector(vector, entry_t),
+	                  first_point.add_scaled_vector(vector, exit_t), is_entry_on_border, is_exit_on_border,
+	                  min(left_distance, -right_distance) / length)
+
+
+def _get_crossing(get_distance: Callable[[int], float], start: int, end: int, count: int,
+                  sign: float) -> Tuple[int, int, float]:
+	"""Finds the point where the distance crosses zero on the border from start to end, sign * distance
+	doesn't decrease on it. The point is clamped to the chain if the line only touches the polygon
+
+	Returns indexes of the side ends and the position of the point on the side
+	"""
+
+	steps = (end - start) % count
+	start_distance = sign * get_distance(start)
+	level = min(max(0.0, start_distance), sign * get_distance(end))
+
+	if start_distance >= level:
+		return start, start, 0.0
+
+	# sign * distance(start + low) < level <= sign * distance(start + high)
+	low = 0
+	high = steps
+
+	while high - low > 1:
+		middle = (low + high) // 2
+
+		if sign * get_distance((start + middle) % count) >= level:
+			high = middle
+		else:
+			low = middle
+
+	first_index = (start + low) % count
+	second_index = (start + high) % count
+	first_distance = sign * get_distance(first_index)
+	second_distance = sign * get_distance(second_index)
+
+	return first_index, second_index, (level - first_distance) / (second_distance - first_distance)
@@ -4,12 +4,14 @@ from core.math.geometry.collision_detection.lines.lines_collision_detection impo
 	get_inter_data_segment_line,
 	get_inter_data_segment_ray,
 	get_inter_data_segment_segment)
+from .convex_polygon_clipping import (clip_line_convexpolygon, clip_ray_convexpolygon,
+                                      clip_segment_convexpolygon)
 from .probable_inter_sides import (get_probable_intersect_sides_line, get_probable_intersect_sides_ray,
                                    get_probable_intersect_sides_segment)
 
 
 def is_intersect_line_convexpolygon(line: "Line", poly: "ConvexPolygon") -> bool:
-	return is_inter_line_poly(line, poly, get_probable_intersect_sides_line, get_inter_data_segment_line)
+	return clip_line_convexpolygon(line, poly) is not None
 
 
 def is_intersect_convexpolygon_line(poly: "ConvexPolygon", line: "Line") -> bool:
@@ -17,7 +19,7 @@ def is_intersect_convexpolygon_line(poly: "ConvexPolygon", line: "Line") -> bool
 
 
 def is_intersect_line_concavepolygon(line: "Line", poly: "ConcavePolygon") -> bool:
-	return is_intersect_line_convexpolygon(line, poly)
+	return is_inter_line_poly(line, poly, get_probable_intersect_sides_line, get_inter_data_segment_line)
 
 
 def is_intersect_concavepolygon_line(poly: "ConvexPolygon", line: "Line") -> bool:
@@ -41,7 +43,7 @@ def is_intersect_triangle_line(triangle: "Triangle", line: "Line") -> bool:
 
 
 def is_intersect_ray_convexpolygon(ray: "Ray", poly: "ConvexPolygon") -> bool:
-	return is_inter_line_poly(ray, poly, get_probable_intersect_sides_ray, get_inter_data_segment_ray)
+	return clip_ray_convexpolygon(ray, poly) is not None
 
 
 def is_intersect_convexpolygon_ray(poly: "ConvexPolygon", ray: "Ray") -> bool:
@@ -49,7 +51,7 @@ def is_intersect_convexpolygon_ray(poly: "ConvexPolygon", ray: "Ray") -> bool:
 
 
 def is_intersect_ray_concavepolygon(ray: "Line", poly: "ConcavePolygon") -> bool:
-	return is_intersect_ray_convexpolygon(ray, poly)
+	return is_inter_line_poly(ray, poly, get_probable_intersect_sides_ray, get_inter_data_segment_ray)
 
 
 def is_intersect_concavepolygon_ray(poly: "ConvexPolygon", ray: "Ray") -> bool:
@@ -73,8 +75,7 @@ def is_intersect_triangle_ray(triangle: "Triangle", ray: "Ray") -> bool:
 
 
 def is_intersect_segment_convexpolygon(segment: "Segment", poly: "ConvexPolygon") -> bool:
-	return is_inter_line_poly(segment, poly, get_probable_intersect_sides_segment,
-	                          get_inter_data_segment_segment)
+	return clip_segment_convexpolygon(segment, poly) is not None
 
 
 def is_intersect_convexpolygon_segment(poly: "ConvexPolygon", segment: "Segment") -> bool:
@@ -82,7 +83,8 @@ def is_intersect_convexpolygon_segment(poly: "ConvexPolygon", segment: "Segment"
 
 
 def is_intersect_segment_concavepolygon(segment: "Segment", poly: "ConcavePolygon") -> bool:
-	return is_intersect_segment_convexpolygon(segment, poly)
+	return is_inter_line_poly(segment, poly, get_probable_intersect_sides_segment,
+	                          get_inter_data_segment_segment)
 
 
 def is_intersect_concavepolygon_segment(poly: "ConvexPolygon", segment: "Segment") -> bool:
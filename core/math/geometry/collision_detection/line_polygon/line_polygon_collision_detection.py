@@ -5,10 +5,21 @@ from core.math.geometry.collision_detection.lines.lines_collision_detection impo
 	get_inter_data_segment_line,
 	get_inter_data_segment_ray,
 	get_inter_data_segment_segment)
+from .convex_polygon_clipping import (ClipResult, clip_line_convexpolygon, clip_ray_convexpolygon,
+                                      clip_segment_convexpolygon)
 from .probable_inter_sides import (get_probable_intersect_sides_line, get_probable_intersect_sides_ray,
                                    get_probable_intersect_sides_segment)
 
 
+def get_inter_data_clip(clip_result: Optional[ClipResult]) -> Optional[CollisionData]:
+	"""Converts the part of a line inside a convex polygon into collision data"""
+
+	if clip_result is None:
+		return None
+
+	return CollisionData(clip_result.get_border_points(), clip_result.penetration_depth)
+
+
 def get_inter_data_poly(line: Union["Segment", "Ray", "LIne"], poly: "BasePolygon", get_sides_func,
                         get_inter_data_func) -> Optional[CollisionData]:
 	probable_inter_sides = get_sides_func(poly, line)
@@ -28,7 +39,7 @@ def get_inter_data_poly(line: Union["Segment", "Ray", "LIne"], poly: "BasePolygo
 
 
 def get_inter_data_line_convexpolygon(line: "Segment", poly: "ConvexPolygon") -> Optional[CollisionData]:
-	return get_inter_data_poly(line, poly, get_probable_intersect_sides_line, get_inter_data_segment_line)
+	return get_inter_data_clip(clip_line_convexpolygon(line, poly))
 
 
 def get_inter_data_convexpolygon_line(poly: "ConvexPolygon", line: "Segment") -> Optional[CollisionData]:
@@ -36,7 +47,7 @@ def get_inter_data_convexpolygon_line(poly: "ConvexPolygon", line: "Segment") ->
 
 
 def get_inter_data_line_concavepolygon(line: "Segment", poly: "ConcavePolygon") -> Optional[CollisionData]:
-	return get_inter_data_line_convexpolygon(line, poly)
+	return get_inter_data_poly(line, poly, get_probable_intersect_sides_line, get_inter_data_segment_line)
 
 
 def get_inter_data_concavepolygon_line(poly: "ConcavePolygon", line: "Segment") -> Optional[CollisionData]:
@@ -60,7 +71,7 @@ def get_inter_data_triangle_line(triangle: "Triangle", line: "Segment") -> Optio
 
 
 def get_inter_data_ray_convexpolygon(ray: "Line", poly: "ConvexPolygon") -> Optional[CollisionData]:
-	return get_inter_data_poly(ray, poly, get_probable_intersect_sides_ray, get_inter_data_segment_ray)
+	return get_inter_data_clip(clip_ray_convexpolygon(ray, poly))
 
 
 def get_inter_data_convexpolygon_ray(poly: "ConvexPolygon", ray: "Line") -> Optional[CollisionData]:
@@ -68,7 +79,7 @@ def get_inter_data_convexpolygon_ray(poly: "ConvexPolygon", ray: "Line") -> Opti
 
 
 def get_inter_data_ray_concavepolygon(ray: "Line", poly: "ConcavePolygon") -> Optional[CollisionData]:
-	return get_inter_data_ray_convexpolygon(ray, poly)
+	return get_inter_data_poly(ray, poly, get_probable_intersect_sides_ray, get_inter_data_segment_ray)
 
 
 def get_inter_data_concavepolygon_ray(poly: "ConcavePolygon", ray: "Line") -> Optional[CollisionData]:
@@ -93,8 +104,7 @@ def get_inter_data_triangle_ray(triangle: "Triangle", ray: "Line") -> Optional[C
 
 def get_inter_data_segment_convexpolygon(segment: "Segment", poly: "ConvexPolygon") -> Optional[
 	CollisionData]:
-	return get_inter_data_poly(segment, poly, get_probable_intersect_sides_segment,
-	                           get_inter_data_segment_segment)
+	return get_inter_data_clip(clip_segment_convexpolygon(segment, poly))
 
 
 def get_inter_data_convexpolygon_segment(poly: "ConvexPolygon", segment: "Segment") -> Optional[
@@ -104,7 +114,8 @@ def get_inter_data_convexpolygon_segment(poly: "ConvexPolygon", segment: "Segmen
 
 def get_inter_data_segment_concavepolygon(segment: "Segment", poly: "ConcavePolygon") -> Optional[
 	CollisionData]:
-	return get_inter_data_segment_convexpolygon(segment, poly)
+	return get_inter_data_poly(segment, poly, get_probable_intersect_sides_segment,
+	                           get_inter_data_segment_segment)
 
 
 def get_inter_data_concavepolygon_segment(poly: "ConcavePolygon", segment: "Segment") -> Optional[
@@ -1,66 +1,43 @@
 from typing import List, Union
 
+from core.math.vector2d import POINTS_TOLERANCE
 
-def get_probable_intersect_sides_line(poly: Union["BasePolygon"], line: "Line") -> List["Segment"]:
-	lines = []
-
-	if line.is_horizontal():
-		upper_border = max(line.first_point.y, line.second_point.y)
-		lower_border = min(line.first_point.y, line.second_point.y)
-
-		for side in poly.sides:
-			if lower_border <= side.first_point.y <= upper_border or lower_border <= side.second_point.y <= \
-					upper_border:
-				lines.append(side)
-
-
-	elif line.is_vertical():
-		left_border = min(line.first_point.x, line.second_point.x)
-		right_border = max(line.first_point.x, line.second_point.x)
 
-		for side in poly.sides:
-			if left_border <= side.first_point.x <= right_border or left_border <= side.second_point.x <= \
-					right_border:
-				lines.append(side)
-
-	return lines
+def get_probable_intersect_sides_line(poly: Union["BasePolygon"], line: "Line") -> List["Segment"]:
+	return get_probable_intersect_sides(poly, line)
 
 
 def get_probable_intersect_sides_ray(poly: Union["BasePolygon"], ray: "Ray") -> List["Segment"]:
-	lines = []
-	ray_start = ray.first_point
-	ray_direction = ray.get_direction()
-	ray_direction = ray_direction.scale()
+	return get_probable_intersect_sides(poly, ray)
 
-	left_border = min(ray_start.x, ray_direction.x)
-	right_border = max(ray_start.x, ray_direction.x)
 
-	upper_border = max(ray_start.y, ray_direction.y)
-	lower_border = min(ray_start.y, ray_direction.y)
+def get_probable_intersect_sides_segment(poly: Union["BasePolygon"], segment: "Segment") -> List["Segment"]:
+	return get_probable_intersect_sides(poly, segment)
 
-	for side in poly.sides:
-		if left_border <= side.first_point.x <= right_border or left_border <= side.second_point.x <= \
-				right_border:
-			if lower_border <= side.first_point.y <= upper_border or lower_border <= side.second_point.y <= \
-					upper_border:
-				lines.append(side)
 
-	return lines
+def get_probable_intersect_sides(poly: Union["BasePolygon"], line: Union["Line", "Ray", "Segment"]) -> \
+		List["Segment"]:
+	"""Returns sides which ends lay on different sides of the line (or on it) and which
+	bounding boxes intersect the bounding box of the line (it's infinite for lines and rays)
+	"""
 
+	sides = []
+	aabb = line.aabb
+	first_point = line.first_point
+	vector = line.get_vector()
+	vertices = poly.vertices.tolist()
+	tolerance = POINTS_TOLERANCE * vector.get_magnitude()
 
-def get_probable_intersect_sides_segment(poly: Union["BasePolygon"], segment: "Segment") -> List["Segment"]:
-	lines = []
-	left_border = min(segment.first_point.x, segment.second_point.x)
-	right_border = max(segment.first_point.x, segment.second_point.x)
+	distances = [vector.x * (y - first_point.y) - vector.y * (x - first_point.x) for x, y in vertices]
+
+	for i, side in enumerate(poly.sides):
+		first_distance = distances[i]
+		second_distance = distances[(i + 1) % len(distances)]
 
-	upper_border = max(segment.first_point.y, segment.second_point.y)
-	lower_border = min(segment.first_point.y, segment.second_point.y)
+		if min(first_distance, second_distance) > tolerance or max(first_distance, second_distance) < -tolerance:
+			continue
 
-	for side in poly.sides:
-		if left_border <= side.first_point.x <= right_border or left_border <= side.second_point.x <= \
-				right_border:
-			if lower_border <= side.first_point.y <= upper_border or lower_border <= side.second_point.y <= \
-					upper_border:
-				lines.append(side)
+		if side.aabb.is_intersect(aabb):
+			sides.append(side)
 
-	return lines
+	return sides
@@ -1 +1,126 @@
-def line_sweep_algorithm()
+from typing import List, Dict, Set, Tuple
+
+from core.math.geometry.collision_detection.broad_phase import BaseBroadPhase, Pair
+from core.math.vector2d import POINTS_TOLERANCE
+
+
+class _Endpoint:
+	__slots__ = ("value", "is_min", "key")
+
+	def __init__(self, value: float, is_min: bool, key: int):
+		self.value = value
+		self.is_min = is_min
+		self.key = key
+
+	def is_before(self, other: "_Endpoint") -> bool:
+		# Min goes first if the values are equal, so touching boxes overlap
+		return self.value < other.value or (self.value == other.value and self.is_min and not other.is_min)
+
+
+class SweepAndPrune(BaseBroadPhase):
+	"""Keeps min and max ends of the bounding boxes on one axis sorted
+
+	Objects move a little between the frames, so the order is restored by insertion sort that
+	takes O(n + swaps). When a min end passes a max end the intervals of the objects start or stop
+	overlapping, so the overlapping intervals are tracked by the swaps. The other axis is checked
+	when the pairs are requested
+
+	axis: 0 sorts by x, 1 by y. Choose the axis on which the objects are spread more
+	"""
+
+	def __init__(self, axis: int = 0):
+		if axis not in (0, 1):
+			raise AttributeError("Axis should be 0 (x) or 1 (y), got {}".format(axis))
+
+		self.axis = axis
+		self._endpoints: List[_Endpoint] = []
+		self._objects: Dict[int, "BaseGeometryObject"] = {}
+		# Keys of the objects which intervals on the axis overlap, the smaller key goes first
+		self._overlaps: Set[Tuple[int, int]] = set()
+
+	def __len__(self) -> int:
+		return len(self._objects)
+
+	def add(self, geometry_object: "BaseGeometryObject") -> None:
+		key = id(geometry_object)
+
+		if key in self._objects:
+			raise AttributeError("The object {} is already added".format(geometry_object))
+
+		self._objects[key] = geometry_object
+		min_value, max_value = self._get_interval(geometry_object)
+
+		# New ends are sorted from the end of the list, as if they moved there from the right
+		self._endpoints.append(_Endpoint(min_value, True, key))
+		self._endpoints.append(_Endpoint(max_value, False, key))
+		self._sort()
+
+	def remove(self, geometry_object: "BaseGeometryObject") -> None:
+		key = id(geometry_object)
+
+		if self._objects.pop(key, None) is None:
+			raise AttributeError("The object {} isn't added".format(geometry_object))
+
+		self._endpoints = [endpoint for endpoint in self._endpoints if endpoint.key != key]
+		self._overlaps = {pair for pair in self._overlaps if key not in pair}
+
+	def update(self) -> None:
+		intervals = {key: self._get_interval(geometry_object) for key, geometry_object in self._objects.items()}
+
+		for endpoint in self._endpoints:
+			min_value, max_value = intervals[endpoint.key]
+			endpoint.value = min_value if endpoint.is_min else max_value
+
+		self._sort()
+
+	def get_pairs(self) -> List[Pair]:
+		pairs = []
+
+		for first_key, second_key in self._overlaps:
+			first_object = self._objects[first_key]
+			second_object = self._objects[second_key]
+
+			if first_object.aabb.is_intersect(second_object.aabb):
+				pairs.append((first_object, second_object))
+
+		return pairs
+
+	def _get_interval(self, geometry_object: "BaseGeometryObject") -> Tuple[float, float]:
+		"""Intervals are enlarged by half of the tolerance, as AABB.is_intersect considers
+		boxes that are closer than it intersecting
+		"""
+
+		aabb = geometry_object.aabb
+		margin = POINTS_TOLERANCE / 2
+
+		if self.axis == 0:
+			return aabb.min_x - margin, aabb.max_x + margin
+
+		return aabb.min_y - margin, aabb.max_y + margin
+
+	def _sort(self) -> None:
+		endpoints = self._endpoints
+
+		for i in range(1, len(endpoints)):
+			endpoint = endpoints[i]
+			j = i - 1
+
+			while j >= 0 and endpoint.is_before(endpoints[j]):
+				self._on_swap(endpoint, endpoints[j])
+				endpoints[j + 1] = endpoints[j]
+				j -= 1
+
+			endpoints[j + 1] = endpoint
+
+	def _on_swap(self, moved: _Endpoint, passed: _Endpoint) -> None:
+		"""The moved endpoint goes to the left of the passed one"""
+
+		if moved.is_min == passed.is_min:
+			return
+
+		pair = (moved.key, passed.key) if moved.key < passed.key else (passed.key, moved.key)
+
+		if moved.is_min:
+			self._overlaps.add(pair)
+		else:
+			self._overlaps.discard(pair)
@@ -77,15 +77,17 @@ def get_penetr_line_line_coeff(first_line: "Line", second_line: "Line") -> Optio
 
 def get_penetr_coeff(first_segment: Union["Line", "Segment"],
                      second_segment: Union["Line", "Segment"]) -> Optional[Tuple[float, float]]:
-	x1 = first_segment.first_point.x
-	x2 = first_segment.second_point.x
-	y1 = first_segment.first_point.y
-	y2 = first_segment.second_point.y
-
-	x3 = second_segment.first_point.x
-	x4 = second_segment.second_point.x
-	y3 = second_segment.first_point.y
-	y4 = second_segment.second_point.y
+	return get_penetr_coeff_by_points(first_segment.first_point.x, first_segment.first_point.y,
+	                                  first_segment.second_point.x, first_segment.second_point.y,
+	                                  second_segment.first_point.x, second_segment.first_point.y,
+	                                  second_segment.second_point.x, second_segment.second_point.y)
+
+
+def get_penetr_coeff_by_points(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float, x4: float,
+                               y4: float) -> Optional[Tuple[float, float]]:
+	"""Returns t and u of the intersection point of the lines through (x1, y1), (x2, y2) and
+	(x3, y3), (x4, y4): first + t * (second - first) of the both lines, None if they are parallel
+	"""
 
 	denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
 
@@ -28,40 +28,213 @@ from .polygons.concave_polygons_distance import *
 from .polygons.convex_polygons_distance import *
 from .polygons.concave_convex_distance import *
 
+from .batch_collision_detection import *
+
+from core.math.geometry.geometry_objects import BaseGeometryObject
 from core.math.vector2d import Vector2d
 from .collision_data import CollisionData
+from .batch_collision_detection import BatchCollisionData
+
+from typing import List, Optional, Tuple, Dict, Callable, Sequence, Union
+
+import numpy as np
+
+
+PairFunctions = Dict[Tuple[type, type], Callable]
 
-from typing import List, Optional, Tuple
 
 class CollisionDetection:
+    """Dispatches collision queries to the functions of the shapes pair
+
+    Functions are registered at import by their names: get_inter_data_<first>_<second>,
+    get_distance_<first>_<second> and is_intersect_<first>_<second>, where first and second
+    are lowercased class names. Swapped variants are added if a module doesn't define them,
+    a pair of subclasses (e.g. Rectangle) without own function uses the function of the closest
+    base classes, it's resolved on the first call and cached
+
+    Intersection queries go through the prefilter first: pairs which bounding boxes or bounding
+    circles don't intersect are rejected without calling the pair function. stats counts the
+    pairs culled by each stage and the pairs that reached the narrow phase
+
+    Batch functions get_batch_inter_data_<first>_<second> take two lists of objects and return
+    BatchCollisionData, they are used by get_batch_intersection_data
+    """
+
+    stats: Dict[str, int] = {"aabb": 0, "bounding_circle": 0, "narrow_phase": 0}
+
+    _inter_data_functions: PairFunctions = {}
+    _distance_functions: PairFunctions = {}
+    _is_intersect_functions: PairFunctions = {}
+    _batch_inter_data_functions: PairFunctions = {}
 
     @classmethod
     def get_intersection_data(cls, first_geometry_object: "BaseGeometryObject",
-                              second_geometry_object: "BaseGeometryObject") -> CollisionData:
-        """Returns an intersection point of the lines, t and u
+                              second_geometry_object: "BaseGeometryObject") -> Optional[CollisionData]:
+        """Returns collision data of the objects or None if they don't intersect"""
+
+        func = cls._get_function(cls._inter_data_functions, first_geometry_object, second_geometry_object)
+        if not cls.prefilter(first_geometry_object, second_geometry_object):
+            return None
+
+        return func(first_geometry_object, second_geometry_object)
 
-        t, u represent where an intersection point falls (first and second segment) 0.0 ≤ t, u ≤ 1.0
+    @classmethod
+    def get_batch_intersection_data(cls, pairs: Union[Sequence[Tuple["BaseGeometryObject", "BaseGeometryObject"]],
+                                                      np.ndarray],
+                                    objects: Optional[Sequence["BaseGeometryObject"]] = None) -> BatchCollisionData:
+        """Returns collision data of many pairs, row i of the result belongs to pairs[i]
+
+        pairs: list of object pairs or (K, 2) array of indexes into objects
+
+        Pairs are grouped by their types, a group with a batch function is computed at once
+        without the prefilter, pairs of other groups go through get_intersection_data
         """
 
-        function_to_call = 'get_inter_data_'
-        class_name1 = type(first_geometry_object).__name__.lower()
-        class_name2 = type(second_geometry_object).__name__.lower()
+        if objects is not None:
+            pairs = [(objects[first], objects[second]) for first, second in np.asarray(pairs).tolist()]
 
-        function_to_call += class_name1 + "_" + class_name2
-        try:
-            func = globals()[function_to_call]
-        except KeyError:
-            raise TypeError(
-                "Function that gets intersection data of " + class_name1 + ' and ' + class_name2 + ' could not be found')
+        data = BatchCollisionData.empty(len(pairs))
+        groups: Dict[Tuple[type, type], List[int]] = {}
 
-        return func(first_geometry_object, second_geometry_object)
+        for i, (first_geometry_object, second_geometry_object) in enumerate(pairs):
+            groups.setdefault((type(first_geometry_object), type(second_geometry_object)), []).append(i)
+
+        for indexes in groups.values():
+            try:
+                func = cls._get_function(cls._batch_inter_data_functions, *pairs[indexes[0]])
+            except TypeError:
+                for i in indexes:
+                    data.set_collision_data(i, cls.get_intersection_data(*pairs[i]))
+
+                continue
+
+            data.set_rows(np.array(indexes), func([pairs[i][0] for i in indexes], [pairs[i][1] for i in indexes]))
+
+        return data
 
     @classmethod
     def get_distance_length(cls, first_geometry_object: "BaseGeometryObject",
-                               second_geometry_object: "BaseGeometryObject") -> Optional[float]:
-        function_to_call = 'get_distance_'
-        function_to_call += type(first_geometry_object).__name__.lower()
-        function_to_call += "_" + type(second_geometry_object).__name__.lower()
+                            second_geometry_object: "BaseGeometryObject") -> Optional[float]:
+        func = cls._get_function(cls._distance_functions, first_geometry_object, second_geometry_object)
+        return func(first_geometry_object, second_geometry_object)
+
+    @classmethod
+    def is_intersect(cls, first_geometry_object: "BaseGeometryObject",
+                     second_geometry_object: "BaseGeometryObject") -> bool:
+        func = cls._get_function(cls._is_intersect_functions, first_geometry_object, second_geometry_object)
+        if not cls.prefilter(first_geometry_object, second_geometry_object):
+            return False
+
+        return func(first_geometry_object, second_geometry_object)
+
+    @classmethod
+    def prefilter(cls, first_geometry_object: "BaseGeometryObject",
+                  second_geometry_object: "BaseGeometryObject") -> bool:
+        """Returns False if the objects can't intersect, updates stats"""
+
+        if not first_geometry_object.aabb.is_intersect(second_geometry_object.aabb):
+            cls.stats["aabb"] += 1
+            return False
+
+        if not first_geometry_object.bounding_circle.is_intersect(second_geometry_object.bounding_circle):
+            cls.stats["bounding_circle"] += 1
+            return False
+
+        cls.stats["narrow_phase"] += 1
+        return True
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        for stage in cls.stats:
+            cls.stats[stage] = 0
+
+    @classmethod
+    def register_functions(cls, functions: Dict[str, Callable]) -> None:
+        """Registers functions which names match the pattern (see class docstring)"""
+
+        types = {geometry_type.__name__.lower(): geometry_type for geometry_type in get_geometry_types()}
+        registries = (("get_inter_data_", cls._inter_data_functions),
+                      ("get_distance_", cls._distance_functions),
+                      ("is_intersect_", cls._is_intersect_functions),
+                      ("get_batch_inter_data_", cls._batch_inter_data_functions))
+
+        for name, func in functions.items():
+            for prefix, registry in registries:
+                if not name.startswith(prefix) or not callable(func):
+                    continue
+
+                type_names = name[len(prefix):].split("_")
+                if len(type_names) == 2 and type_names[0] in types and type_names[1] in types:
+                    registry[(types[type_names[0]], types[type_names[1]])] = func
+
+        cls._add_swapped_functions(cls._inter_data_functions, get_reversed_inter_data_function)
+        cls._add_swapped_functions(cls._distance_functions, get_swapped_function)
+        cls._add_swapped_functions(cls._is_intersect_functions, get_swapped_function)
+        cls._add_swapped_functions(cls._batch_inter_data_functions, get_reversed_batch_inter_data_function)
+
+    @staticmethod
+    def _add_swapped_functions(registry: PairFunctions, get_swapped: Callable[[Callable], Callable]) -> None:
+        for (first_type, second_type), func in list(registry.items()):
+            if (second_type, first_type) not in registry:
+                registry[(second_type, first_type)] = get_swapped(func)
+
+    @staticmethod
+    def _get_function(registry: PairFunctions, first_geometry_object: "BaseGeometryObject",
+                      second_geometry_object: "BaseGeometryObject") -> Callable:
+        pair = (type(first_geometry_object), type(second_geometry_object))
+
+        try:
+            return registry[pair]
+        except KeyError:
+            pass
+
+        for first_type in pair[0].__mro__:
+            for second_type in pair[1].__mro__:
+                func = registry.get((first_type, second_type))
+
+                if func is not None:
+                    registry[pair] = func
+                    return func
+
+        raise TypeError("Function for " + pair[0].__name__ + ' and ' + pair[1].__name__ + ' could not be found')
+
+
+def get_geometry_types() -> List[type]:
+    types = []
+    not_visited = [BaseGeometryObject]
+
+    while not_visited:
+        geometry_type = not_visited.pop()
+        types.append(geometry_type)
+        not_visited.extend(geometry_type.__subclasses__())
+
+    return types
+
+
+def get_swapped_function(func: Callable) -> Callable:
+    def swapped_function(first_geometry_object, second_geometry_object):
+        return func(second_geometry_object, first_geometry_object)
+
+    return swapped_function
+
+
+def get_reversed_inter_data_function(func: Callable) -> Callable:
+    def reversed_function(first_geometry_object, second_geometry_object) -> Optional[CollisionData]:
+        data = func(second_geometry_object, first_geometry_object)
+
+        if isinstance(data, CollisionData):
+            return data.get_reversed()
+
+        return data
+
+    return reversed_function
+
+
+def get_reversed_batch_inter_data_function(func: Callable) -> Callable:
+    def reversed_function(first_geometry_objects, second_geometry_objects) -> BatchCollisionData:
+        return func(second_geometry_objects, first_geometry_objects).get_reversed()
+
+    return reversed_function
+
 
-        func = getattr(cls, function_to_call)
-        return func(cls, first_geometry_object, second_geometry_object)
+CollisionDetection.register_functions(globals())
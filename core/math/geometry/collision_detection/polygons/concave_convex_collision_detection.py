@@ -1,34 +1,36 @@
 from typing import Optional
 
 from core.math.geometry.collision_detection.collision_data import CollisionData
-from .concave_polygons_collision_detection import get_inter_data_concavepolygon_concavepolygon
+from .concave_polygons_collision_detection import get_inter_data_parts
 
 
 def get_inter_data_concavepolygon_convexpolygon(concave: "ConcavePolygon", convex: "ConvexPolygon") -> \
 Optional[CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, convex)
+	return get_inter_data_parts(((part, convex) for part in concave.parts_tree.query(convex.aabb)),
+	                            concave, convex)
 
 
 def get_inter_data_convexpolygon_concavepolygon(convex: "ConvexPolygon", concave: "ConcavePolygon") -> \
 Optional[CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, convex)
+	return get_inter_data_parts(((convex, part) for part in concave.parts_tree.query(convex.aabb)),
+	                            convex, concave)
 
 
 def get_inter_data_concavepolygon_rectangle(concave: "ConcavePolygon", rect: "Rectancle") -> Optional[
 	CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, rect)
+	return get_inter_data_concavepolygon_convexpolygon(concave, rect)
 
 
 def get_inter_data_rectangle_concavepolygon(rect: "Rectancle", concave: "ConcavePolygon") -> Optional[
 	CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, rect)
+	return get_inter_data_convexpolygon_concavepolygon(rect, concave)
 
 
 def get_inter_data_concavepolygon_triangle(concave: "ConcavePolygon", triangle: "Triangle") -> Optional[
 	CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, triangle)
+	return get_inter_data_concavepolygon_convexpolygon(concave, triangle)
 
 
 def get_inter_data_triangle_concavepolygon(triangle: "Triangle", concave: "ConcavePolygon") -> Optional[
 	CollisionData]:
-	return get_inter_data_concavepolygon_concavepolygon(concave, triangle)
+	return get_inter_data_convexpolygon_concavepolygon(triangle, concave)
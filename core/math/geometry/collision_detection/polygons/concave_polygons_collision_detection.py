@@ -1,23 +1,30 @@
-from typing import Optional
+from typing import Optional, Iterable, Tuple
 
-from core.math.average import average
 from core.math.geometry.collision_detection.collision_data import CollisionData
-from core.math.geometry.collision_detection.line_polygon.line_polygon_collision_detection import \
-	get_inter_data_segment_concavepolygon
+from core.math.geometry.collision_detection.epa import get_inter_data_convex_shapes
+from .polygons_intersection_points import get_polygons_intersection_points
 
 
 def get_inter_data_concavepolygon_concavepolygon(first_poly: "ConcavePolygon",
                                                  second_poly: "ConcavePolygon") -> Optional[CollisionData]:
-	penetration_length: float = 0.0
-	points = []
+	return get_inter_data_parts(first_poly.parts_tree.query_pairs(second_poly.parts_tree), first_poly, second_poly)
 
-	for side in first_poly.sides:
-		side_inter_data = get_inter_data_segment_concavepolygon(side, second_poly)
-		if side_inter_data:
-			points.extend(side_inter_data.intersection_points)
-			penetration_length = average(penetration_length, side_inter_data.penetration_depth)
 
-	if len(points) == 0:
-		return None
+def get_inter_data_parts(parts_pairs: Iterable[Tuple["ConvexPolygon", "ConvexPolygon"]], first_poly: "BasePolygon",
+                         second_poly: "BasePolygon") -> Optional[CollisionData]:
+	"""Returns collision data of the pair of convex parts that penetrate the deepest, with the
+	points where the sides of the whole polygons cross
+	"""
 
-	return CollisionData(points, penetration_length)
+	result = None
+
+	for first_part, second_part in parts_pairs:
+		data = get_inter_data_convex_shapes(first_part, second_part)
+
+		if data is not None and (result is None or data.penetration_depth > result.penetration_depth):
+			result = data
+
+	if result is not None:
+		result.add_points_of_intersection(get_polygons_intersection_points(first_poly, second_poly))
+
+	return result
@@ -1,15 +1,16 @@
-from .is_concave_polygons_intersect import is_intersect_concavepolygon_concavepolygon
+from typing import Iterable, Tuple
+
+from .convex_polygons_distance import get_dist_convex_polygons
 
 
 def get_distance_concavepolygon_concavepolygon(first_polygon: "ConcavePolygon",
                                                second_polygon: "ConcavePolygon") -> float:
-	center_vector = second_polygon.centroid - first_polygon.centroid
-	first_closest_point = first_polygon.get_support_point(center_vector)
-	second_closest_point = second_polygon.get_support_point(center_vector.inverse())
+	return get_distance_parts((first_part, second_part) for first_part in first_polygon.convex_parts
+	                          for second_part in second_polygon.convex_parts)
 
-	distance = (second_closest_point - first_closest_point).get_magnitude()
 
-	if is_intersect_concavepolygon_concavepolygon(first_polygon, second_polygon):
-		return -distance
+def get_distance_parts(parts_pairs: Iterable[Tuple["ConvexPolygon", "ConvexPolygon"]]) -> float:
+	"""Returns the distance between the closest pair of convex parts, if some parts intersect
+	returns negative penetration depth of the deepest pair"""
 
-	return distance
+	return min(get_dist_convex_polygons(first_part, second_part) for first_part, second_part in parts_pairs)
@@ -1,38 +1,25 @@
 from typing import Optional, Tuple, List
 
 from core.math.geometry.collision_detection.collision_data import CollisionData
+from core.math.geometry.collision_detection.epa import get_inter_data_convex_shapes
 from core.math.geometry.collision_detection.line_polygon.line_polygon_collision_detection import \
 	get_inter_data_segment_convexpolygon
 from core.math.vector2d import Vector2d
+from .polygons_intersection_points import get_polygons_intersection_points
 
 
 def get_inter_data_convexpolygon_convexpolygon(first_poly: "ConvexPolygon",
                                                second_poly: "ConvexPolygon") -> Optional[CollisionData]:
-	penetration_length: float = 0.0
-	points: List[Vector2d] = []
+	data = get_inter_data_convex_shapes(first_poly, second_poly)
+	if data is not None:
+		data.add_points_of_intersection(get_polygons_intersection_points(first_poly, second_poly))
 
-	# TODO delete the part if optimization is necessary
-	for diagonal in first_poly.diagonals:
-		diagonal_inter_data = get_inter_data_segment_convexpolygon(diagonal, second_poly)
-		if diagonal_inter_data:
-			penetration_length = diagonal_inter_data[1]
-
-	for side in first_poly.sides:
-		side_inter_data = get_inter_data_segment_convexpolygon(side, second_poly)
-		if side_inter_data:
-			points.extend(side_inter_data[0])
-			if penetration_length == 0.0:
-				penetration_length = side_inter_data[1]
-
-	if len(points) == 0:
-		return None
-
-	return CollisionData(points, penetration_length)
+	return data
 
 
 def get_inter_data_convexpolygon_rectangle(poly: "ConvexPolygon", rect: "Rectangle") -> Optional[
 	CollisionData]:
-	return get_inter_data_convexpolygon_convexpolygon(rect, poly)
+	return get_inter_data_convexpolygon_convexpolygon(poly, rect)
 
 
 def get_inter_data_rectangle_convexpolygon(rect: "Rectangle", poly: "ConvexPolygon") -> Optional[
@@ -47,7 +34,7 @@ def get_inter_data_convexpolygon_triangle(poly: "ConvexPolygon", triangle: "Tria
 
 def get_inter_data_triangle_convexpolygon(triangle: "Triangle", poly: "ConvexPolygon") -> Optional[
 	CollisionData]:
-	return get_inter_data_convexpolygon_convexpolygon(poly, triangle)
+	return get_inter_data_convexpolygon_convexpolygon(triangle, poly)
 
 
 def get_inter_data_rectangle_rectangle(first_rect: "Rectangle", second_rect: "Rectangle") -> \
@@ -60,7 +47,7 @@ def get_inter_data_rectangle_triangle(rect: "Rectangle", triangle: "Triangle") -
 
 
 def get_inter_data_triangle_rectangle(triangle: "Triangle", rect: "Rectangle") -> Optional[CollisionData]:
-	return get_inter_data_convexpolygon_convexpolygon(rect, triangle)
+	return get_inter_data_convexpolygon_convexpolygon(triangle, rect)
 
 
 def get_inter_data_triangle_triangle(first_triangle: "Triangle",
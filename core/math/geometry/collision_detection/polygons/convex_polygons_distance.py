@@ -1,9 +1,5 @@
-from core.math.geometry.collision_detection.polygons.get_closest_polygons_point import \
-	get_closest_support_point
-from core.math.geometry.collision_detection.polygons.minkowski_difference_of_polygons import \
-	polygons_difference
-from core.math.geometry.convex_hull import create_convex_hull
-from core.math.vector2d import Vector2d
+from core.math.geometry.collision_detection.epa import epa
+from core.math.geometry.collision_detection.gjk import gjk
 
 
 def get_distance_convexpolygon_convexpolygon(first_polygon: "ConvexPolygon",
@@ -40,15 +36,15 @@ def get_distance_triangle_rectangle(triangle: "Triangle", rectangle: "Rectangle"
 
 
 def get_dist_convex_polygons(first_polygon: "ConvexPolygon", second_polygon: "ConvexPolygon") -> float:
-	"""Uses the Gilbert-Johnson-Keerthi Algorithm to get penetration depth and intersection points"""
+	"""Uses the Gilbert-Johnson-Keerthi Algorithm to get the distance, if the polygons intersect
+	returns negative penetration depth found by EPA"""
 
-	new_polygon_points = polygons_difference(first_polygon, second_polygon)
-	convex_hull = create_convex_hull(new_polygon_points)
+	result = gjk(first_polygon, second_polygon)
+	if not result.is_intersect:
+		return result.distance
 
-	closest_point = get_closest_support_point(convex_hull, Vector2d(0, 0))
-	penetration = (closest_point - Vector2d(0, 0)).get_magnitude()
+	data = epa(first_polygon, second_polygon, result)
+	if data is None:
+		return 0.0
 
-	if convex_hull.is_point_belongs(Vector2d(0, 0)):
-		return -penetration
-
-	return penetration
+	return -data.penetration_depth
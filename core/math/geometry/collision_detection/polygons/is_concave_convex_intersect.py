@@ -1,5 +1,4 @@
 from core.math.geometry.collision_detection.separated_axis import is_intersect_convex_concave
-from .is_convex_polygons_intersect import is_intersect_rect_poly
 
 
 def is_intersect_concavepolygon_convexpolygon(concave: "ConcavePolygon", convex: "ConvexPolygon") -> bool:
@@ -11,11 +10,11 @@ def is_intersect_convexpolygon_concavepolygon(convex: "ConvexPolygon", concave:
 
 
 def is_intersect_concavepolygon_rectangle(concave: "ConcavePolygon", rect: "Rectangle") -> bool:
-	return is_intersect_rect_poly(rect, concave)
+	return is_intersect_convex_concave(rect, concave)
 
 
 def is_intersect_rectangle_concavepolygon(rect: "Rectangle", concave: "ConcavePolygon") -> bool:
-	return is_intersect_rect_poly(rect, concave)
+	return is_intersect_convex_concave(rect, concave)
 
 
 def is_intersect_concavepolygon_triangle(concave: "ConcavePolygon", triangle: "Triangle") -> bool:
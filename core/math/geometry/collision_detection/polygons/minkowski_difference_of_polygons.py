@@ -1,14 +1,91 @@
-from typing import List, Set
+from typing import List
 
+import numpy as np
+
+from core.math.geometry.geometry_objects import ConvexPolygon
 from core.math.vector2d import Vector2d
 
 
-def polygons_difference(first_polygon_points: List[Vector2d], second_polygons_points: List[Vector2d]) -> Set[
-	Vector2d]:
-	new_points = set()
+def polygons_difference(first_polygon_points: List[Vector2d], second_polygons_points: List[Vector2d]) -> \
+		List[Vector2d]:
+	"""Returns points of the Minkowski difference, duplicated points are collapsed
+	(see Vector2d.get_grid_key)"""
+
+	new_points = {}
 
 	for first_point in first_polygon_points:
+		first_x = first_point.x
+		first_y = first_point.y
+
 		for second_point in second_polygons_points:
-			new_points.add(first_point - second_point)
+			new_point = Vector2d(first_x - second_point.x, first_y - second_point.y)
+			new_points.setdefault(new_point.get_grid_key(), new_point)
+
+	return list(new_points.values())
+
+
+def convex_polygons_difference(first_polygon: "ConvexPolygon", second_polygon: "ConvexPolygon") -> \
+		ConvexPolygon:
+	"""Returns the Minkowski difference of two convex polygons in O(n + m)
+
+	The difference is the sum of the first polygon and the inverted second one. Sides of both
+	polygons are merged by their angle starting from the lowest vertexes, each step adds one
+	vertex of the result, so there is no need in the hull of all n * m points
+	"""
+
+	first_vertices = _get_lowest_first(_get_counterclockwise(first_polygon.vertices))
+	# Inversion is rotation by 180 degrees, so the order stays counterclockwise
+	second_vertices = _get_lowest_first(-_get_counterclockwise(second_polygon.vertices))
+
+	first_sides = (np.roll(first_vertices, -1, axis=0) - first_vertices).tolist()
+	second_sides = (np.roll(second_vertices, -1, axis=0) - second_vertices).tolist()
+	first_vertices = first_vertices.tolist()
+	second_vertices = second_vertices.tolist()
+
+	first_count = len(first_vertices)
+	second_count = len(second_vertices)
+	points = []
+	i = j = 0
+
+	while i < first_count or j < second_count:
+		first_x, first_y = first_vertices[i % first_count]
+		second_x, second_y = second_vertices[j % second_count]
+		points.append(Vector2d(first_x + second_x, first_y + second_y))
+
+		if i == first_count:
+			j += 1
+			continue
+		if j == second_count:
+			i += 1
+			continue
+
+		first_side = first_sides[i]
+		second_side = second_sides[j]
+		cross_product = first_side[0] * second_side[1] - first_side[1] * second_side[0]
+
+		# Take the side with the smaller angle, parallel sides are taken together
+		if cross_product >= 0:
+			i += 1
+		if cross_product <= 0:
+			j += 1
+
+	return ConvexPolygon(points)
+
+
+def _get_counterclockwise(vertices: np.ndarray) -> np.ndarray:
+	x = vertices[:, 0]
+	y = vertices[:, 1]
+	signed_area = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+
+	if signed_area < 0:
+		return vertices[::-1]
+
+	return vertices
+
+
+def _get_lowest_first(vertices: np.ndarray) -> np.ndarray:
+	"""Rolls the vertices to start from the one with min y (and min x)"""
+
+	lowest_index = int(np.lexsort((vertices[:, 0], vertices[:, 1]))[0])
 
-	return new_points
+	return np.roll(vertices, -lowest_index, axis=0)
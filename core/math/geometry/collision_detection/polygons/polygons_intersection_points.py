@@ -0,0 +1,20 @@
+from typing import List
+
+from core.math.geometry.segments_intersection import iterate_segments_intersections
+from core.math.vector2d import Vector2d, get_unique_points
+
+
+def get_polygons_intersection_points(first_poly: "BasePolygon", second_poly: "BasePolygon") -> List[Vector2d]:
+	"""Returns the points where the sides of the polygons cross, it's empty when one polygon
+	is inside the other one
+	"""
+
+	sides = [((side.first_point.x, side.first_point.y), (side.second_point.x, side.second_point.y))
+	         for side in first_poly.sides + second_poly.sides]
+	first_sides_count = first_poly.sides_count
+
+	# Sides of one polygon meet at its vertices, only crossings of the sides of different polygons count
+	points = (Vector2d(x, y, exact=True) for i, j, (x, y) in iterate_segments_intersections(sides)
+	          if i < first_sides_count <= j)
+
+	return get_unique_points(points)
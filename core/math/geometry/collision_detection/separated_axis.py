@@ -1,73 +1,107 @@
-from typing import Tuple
+from typing import Tuple, Dict, Optional, Hashable
+
+import numpy as np
 
 from core.math.vector2d import Vector2d
 
+# The last separating axis of each pair of polygons, the next check of the pair projects
+# on it first. Objects that are apart in one frame usually are apart in the next one,
+# so most checks end after one projection
+_separating_axes: Dict[Hashable, np.ndarray] = {}
+SEPARATING_AXES_CACHE_SIZE = 4096
+
+
+def is_intersect_convex_convex(first_polygon: "ConvexPolygon", second_polygon: "ConvexPolygon",
+                               pair_key: Optional[Hashable] = None) -> bool:
+	"""Uses separated axis theorem to determinate ether two polygons are colliding or not
+
+	pair_key identifies the pair in the separating axes cache, ids of the polygons by default
+	"""
 
-def is_intersect_convex_convex(first_polygon: "ConvexPolygon", second_polygon: "ConvexPolygon") -> bool:
-	"""Uses separated axis theorem to determinate ether two polygons are colliding or not"""
+	if pair_key is None:
+		pair_key = (id(first_polygon), id(second_polygon))
 
-	if check_shadows(first_polygon, second_polygon) and check_shadows(second_polygon, first_polygon):
+	axis = _separating_axes.get(pair_key)
+	if axis is not None and is_separating_axis(first_polygon.vertices, second_polygon.vertices, axis):
+		return False
+
+	axis = find_separating_axis(first_polygon, second_polygon)
+
+	if axis is None:
+		_separating_axes.pop(pair_key, None)
 		return True
 
+	if len(_separating_axes) >= SEPARATING_AXES_CACHE_SIZE:
+		_separating_axes.clear()
+
+	_separating_axes[pair_key] = axis
 	return False
 
 
 def is_intersect_convex_concave(convex: "ConvexPolygon", concave: "ConcavePolygon") -> bool:
-	"""Uses separated axis theorem to determinate ether two polygons are colliding or not"""
-	triangulated_concave = concave.triangles
+	"""Uses separated axis theorem to determinate ether two polygons are colliding or not,
+	the concave polygon collides if one of its convex parts does. Only the parts which
+	bounding boxes intersect the box of the convex polygon are checked"""
 
-	for concave_part in triangulated_concave:
-		if not check_shadows(concave_part, convex) or not check_shadows(convex, concave_part):
-			return False
+	for concave_part in concave.parts_tree.query(convex.aabb):
+		if is_intersect_convex_convex(concave_part, convex):
+			return True
 
-	return True
+	return False
 
 
 def is_intersect_concave_concave(first_poly: "ConcavePolygon", second_poly: "ConcavePolygon") -> bool:
-	"""Uses separated axis theorem to determinate ether two polygons are colliding or not"""
-	first_parts = first_poly.triangles
-	second_poly = second_poly.triangles
+	"""Uses separated axis theorem to determinate ether two polygons are colliding or not,
+	only the pairs of convex parts which bounding boxes intersect are checked"""
 
-	for first_part in first_parts:
-		for second_part in second_poly:
-			if not check_shadows(first_part, second_part) or not check_shadows(second_part, first_part):
-				return False
+	for first_part, second_part in first_poly.parts_tree.query_pairs(second_poly.parts_tree):
+		if is_intersect_convex_convex(first_part, second_part):
+			return True
 
-	return True
+	return False
 
 
-def check_shadows(first: "BaseGeometryObject", second: "BaseGeometryObject", get_first_shadow_func,
-                  get_second_shadow_func) -> bool:
-	polygons = (first, second)
+def find_separating_axis(first_polygon: "BasePolygon", second_polygon: "BasePolygon") -> Optional[np.ndarray]:
+	"""Returns normal of a side that separates the polygons or None if they intersect
 
-	for poly in polygons:
-		for side in first.sides:
-			normal = side.get_perpendicular()
-			normal_vector = normal.get_vector()
+	Normals of the first polygon are checked before normals of the second one is calculated
+	"""
 
-			first_min_shadow, first_max_shadow = get_first_shadow_func(first, normal_vector)
-			second_min_shadow, second_max_shadow = get_second_shadow_func(second, normal_vector)
+	first_vertices = first_polygon.vertices
+	second_vertices = second_polygon.vertices
 
-			if not (second_max_shadow >= first_min_shadow and first_max_shadow >= second_min_shadow):
-				return False
+	for polygon in (first_polygon, second_polygon):
+		normals = polygon.edge_normals
 
-	return True
+		# Shadows of all the vertices on all the normals at once, (vertices, normals) shape
+		first_shadows = first_vertices @ normals.T
+		second_shadows = second_vertices @ normals.T
 
+		is_separated = (first_shadows.max(axis=0) < second_shadows.min(axis=0)) | \
+		               (second_shadows.max(axis=0) < first_shadows.min(axis=0))
 
-def get_shadow_circle(circle: "")
+		if is_separated.any():
+			return normals[int(np.argmax(is_separated))]
 
+	return None
 
-def get_shadow_polygon(poly: "BasePolygon", normal: Vector2d) -> Tuple[float, float]:
-	min_shadow = float("inf")
-	max_shadow = -float("inf")
-	for point in poly.points:
-		product = normal.dot_product(point)
 
-		min_shadow = min(min_shadow, product)
-		max_shadow = max(min_shadow, product)
+def is_separating_axis(first_vertices: np.ndarray, second_vertices: np.ndarray, axis: np.ndarray) -> bool:
+	first_min_shadow, first_max_shadow = get_shadow(first_vertices, axis)
+	second_min_shadow, second_max_shadow = get_shadow(second_vertices, axis)
+
+	return first_max_shadow < second_min_shadow or second_max_shadow < first_min_shadow
+
 
-	return min_shadow, max_shadow
+def get_shadow(vertices: np.ndarray, axis: np.ndarray) -> Tuple[float, float]:
+	shadows = vertices @ axis
+
+	return float(shadows.min()), float(shadows.max())
+
+
+def get_shadow_polygon(poly: "BasePolygon", normal: Vector2d) -> Tuple[float, float]:
+	return get_shadow(poly.vertices, np.array((normal.x, normal.y)))
 
 
-def get_distance_line_polygon(line: "Line", poly: "BasePolygon"):
-	raise NotImplemented()
+def clear_separating_axes() -> None:
+	_separating_axes.clear()
@@ -0,0 +1,193 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.math.geometry.collision_detection.broad_phase import BaseBroadPhase, Pair
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
+
+# Large primes that mix cell coordinates into a hash
+_HASH_X = 73856093
+_HASH_Y = 19349663
+
+
+class SpatialHashGrid(BaseBroadPhase):
+	"""Buckets bounding boxes by the cell of their center in the uniform grid
+
+	Works best when the objects have similar size (particles, circles of the same radius),
+	then only the neighbour cells are checked and a rebuild takes O(n). Cells are hashed into
+	a table twice as large as the count of the objects, so the grid isn't bounded
+
+	Boxes are stored in flat arrays: (N, 4) bounds, indexes of the boxes ordered by the bucket
+	and the start of each bucket in the order. rebuild takes the bounds array directly, e.g. of
+	particles that aren't geometry objects, update reads the bounds of the added objects. Adding
+	and removing objects is O(1), the grid is rebuilt by update or before the next query
+
+	cell_size: if None, the size of the largest box is used. Smaller cells still give correct
+	           results, but more cells are checked for each box
+	"""
+
+	def __init__(self, cell_size: Optional[float] = None):
+		if cell_size is not None and cell_size <= 0:
+			raise AttributeError("Cell size should be positive, got {}".format(cell_size))
+
+		self.cell_size = cell_size
+		self._objects: List["BaseGeometryObject"] = []
+		# Key of an object -> its index in the objects
+		self._indexes: Dict[int, int] = {}
+		# Objects were added or removed after the last update
+		self._is_changed = False
+		self._bounds = np.empty((0, 4))
+		self._cell_size = 1.0
+		self._reach = 1
+		self._max_half_size = 0.0
+		self._cells = np.empty((0, 2), dtype=np.int64)
+		self._order = np.empty(0, dtype=np.intp)
+		self._bucket_starts = np.zeros(2, dtype=np.intp)
+
+	def __len__(self) -> int:
+		self._update_if_changed()
+
+		return len(self._bounds)
+
+	def add(self, geometry_object: "BaseGeometryObject") -> None:
+		key = id(geometry_object)
+
+		if key in self._indexes:
+			raise AttributeError("The object {} is already added".format(geometry_object))
+
+		aabb = geometry_object.aabb
+
+		if not all(math.isfinite(value) for value in (aabb.min_x, aabb.min_y, aabb.max_x, aabb.max_y)):
+			raise AttributeError("The grid can't store objects with infinite bounds (lines, rays)")
+
+		self._indexes[key] = len(self._objects)
+		self._objects.append(geometry_object)
+		self._is_changed = True
+
+	def remove(self, geometry_object: "BaseGeometryObject") -> None:
+		index = self._indexes.pop(id(geometry_object), None)
+
+		if index is None:
+			raise AttributeError("The object {} isn't added".format(geometry_object))
+
+		# The last object takes the place of the removed one
+		last = self._objects.pop()
+		if last is not geometry_object:
+			self._objects[index] = last
+			self._indexes[id(last)] = index
+
+		self._is_changed = True
+
+	def update(self) -> None:
+		bounds = np.empty((len(self._objects), 4))
+
+		for i, geometry_object in enumerate(self._objects):
+			aabb = geometry_object.aabb
+			bounds[i] = (aabb.min_x, aabb.min_y, aabb.max_x, aabb.max_y)
+
+		self.rebuild(bounds)
+
+	def rebuild(self, bounds: np.ndarray) -> None:
+		"""Buckets (N, 4) array of boxes (min_x, min_y, max_x, max_y)"""
+
+		bounds = np.ascontiguousarray(bounds, dtype=np.float64).reshape(-1, 4)
+		sizes = bounds[:, 2:] - bounds[:, :2]
+		max_size = float(sizes.max()) if len(bounds) else 0.0
+
+		self._bounds = bounds
+		self._is_changed = False
+		self._max_half_size = max_size / 2
+		self._cell_size = self.cell_size or max(max_size, POINTS_TOLERANCE)
+		# Boxes intersect if their centers are closer than the largest size on both axes
+		self._reach = max(1, math.ceil((max_size + POINTS_TOLERANCE) / self._cell_size))
+
+		centers = (bounds[:, :2] + bounds[:, 2:]) / 2
+		self._cells = np.floor(centers / self._cell_size).astype(np.int64)
+
+		table_size = 1 << max(1, (2 * len(bounds)).bit_length())
+		buckets = self._get_buckets(self._cells[:, 0], self._cells[:, 1], table_size)
+
+		self._order = np.argsort(buckets, kind="stable")
+		self._bucket_starts = np.zeros(table_size + 1, dtype=np.intp)
+		np.cumsum(np.bincount(buckets, minlength=table_size), out=self._bucket_starts[1:])
+
+	def get_pairs(self) -> List[Pair]:
+		return [(self._objects[first], self._objects[second]) for first, second in self.get_index_pairs().tolist()]
+
+	def get_index_pairs(self) -> np.ndarray:
+		"""Returns (K, 2) array of indexes of the intersecting boxes, the first index is smaller"""
+
+		self._update_if_changed()
+
+		count = len(self._bounds)
+		if count < 2:
+			return np.empty((0, 2), dtype=np.intp)
+
+		indexes = np.arange(count)
+		pairs = []
+
+		for dx in range(-self._reach, self._reach + 1):
+			for dy in range(-self._reach, self._reach + 1):
+				firsts, seconds = self._get_bucket_members(indexes, self._cells[:, 0] + dx, self._cells[:, 1] + dy)
+				is_pair = firsts < seconds
+				pairs.append(np.column_stack((firsts[is_pair], seconds[is_pair])))
+
+		pairs = np.concatenate(pairs)
+		first_bounds = self._bounds[pairs[:, 0]]
+		second_bounds = self._bounds[pairs[:, 1]]
+		is_intersect = ((first_bounds[:, :2] <= second_bounds[:, 2:] + POINTS_TOLERANCE) &
+		                (second_bounds[:, :2] <= first_bounds[:, 2:] + POINTS_TOLERANCE)).all(axis=1)
+
+		# Different cells can share a bucket, so a pair can be found twice
+		codes = np.unique(pairs[is_intersect, 0] * count + pairs[is_intersect, 1])
+
+		return np.column_stack((codes // count, codes % count))
+
+	def query_radius(self, center: Vector2d, radius: float) -> List["BaseGeometryObject"]:
+		return [self._objects[i] for i in self.query_radius_indexes(center, radius).tolist()]
+
+	def query_radius_indexes(self, center: Vector2d, radius: float) -> np.ndarray:
+		"""Returns sorted indexes of the boxes that are closer to the center than the radius"""
+
+		self._update_if_changed()
+
+		if len(self._bounds) == 0:
+			return np.empty(0, dtype=np.intp)
+
+		reach = radius + self._max_half_size
+		min_x, min_y, max_x, max_y = (math.floor(value / self._cell_size) for value in
+		                              (center.x - reach, center.y - reach, center.x + reach, center.y + reach))
+
+		cells_x, cells_y = np.meshgrid(np.arange(min_x, max_x + 1, dtype=np.int64),
+		                               np.arange(min_y, max_y + 1, dtype=np.int64))
+		cells_x = cells_x.ravel()
+		cells_y = cells_y.ravel()
+		_, candidates = self._get_bucket_members(np.zeros(len(cells_x), dtype=np.intp), cells_x, cells_y)
+
+		bounds = self._bounds[candidates]
+		distance_x = np.maximum(np.maximum(bounds[:, 0] - center.x, center.x - bounds[:, 2]), 0)
+		distance_y = np.maximum(np.maximum(bounds[:, 1] - center.y, center.y - bounds[:, 3]), 0)
+
+		return np.unique(candidates[distance_x * distance_x + distance_y * distance_y <= radius * radius])
+
+	def _update_if_changed(self) -> None:
+		if self._is_changed:
+			self.update()
+
+	def _get_bucket_members(self, owners: np.ndarray, cells_x: np.ndarray, cells_y: np.ndarray):
+		"""For each cell returns pairs (the owner of the cell, a box of the cell bucket)"""
+
+		table_size = len(self._bucket_starts) - 1
+		buckets = self._get_buckets(cells_x, cells_y, table_size)
+		starts = self._bucket_starts[buckets]
+		counts = self._bucket_starts[buckets + 1] - starts
+
+		# Position of each member in its bucket
+		offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+		return np.repeat(owners, counts), self._order[np.repeat(starts, counts) + offsets]
+
+	@staticmethod
+	def _get_buckets(cells_x: np.ndarray, cells_y: np.ndarray, table_size: int) -> np.ndarray:
+		return ((cells_x * _HASH_X) ^ (cells_y * _HASH_Y)) & (table_size - 1)
@@ -1,64 +1,127 @@
-from typing import List, Set
+from typing import List, Iterable, Union, Sequence
 
-from core.math.geometry.geometry_objects import ConvexPolygon, Line
-from core.math.vector2d import Vector2d
+import numpy as np
 
+from core.math.geometry.geometry_objects import ConvexPolygon
+from core.math.vector2d import Vector2d, get_unique_points
 
-def create_convex_hull(points: Set[Vector2d]) -> ConvexPolygon:
-	"""Uses Graham scan algorithm to create a convex hull form the given points"""
-	points = list(points)
+Points = Union[Sequence[Vector2d], np.ndarray]
 
-	lower_point = get_lower_point(points)
-	points = sort_clockwise(points, lower_point)
 
-	convex_hull_points = [lower_point]
-	points_count = len(points)
+def create_convex_hull(points: Iterable[Vector2d]) -> ConvexPolygon:
+	"""Creates a convex hull polygon from the given points (see get_convex_hull_indexes)"""
 
-	# make the list of points starts from the lower_point
-	lower_point_index = int()
+	points = get_unique_points(points)
+	hull_points = []
 
-	for i in range(points_count):
-		if points[i] == lower_point:
-			lower_point_index = i
+	for i in get_convex_hull_indexes(points):
+		# Points from neighbouring grid cells can still be equal
+		if not hull_points or hull_points[-1] != points[i]:
+			hull_points.append(points[i])
 
-	points = points[lower_point_index + 1:] + points[: lower_point_index]
+	if len(hull_points) > 1 and hull_points[0] == hull_points[-1]:
+		hull_points.pop()
 
-	for i in range(points_count):
-		last_last_point = convex_hull_points[-2]
-		last_point = convex_hull_points[-1]
+	if len(hull_points) < 3:
+		raise AttributeError("Can't create a convex hull of the points that lay on one line")
 
-		next_point = points[i]
+	return ConvexPolygon(hull_points)
 
-		first_line = last_point - last_last_point
-		second_line = next_point - last_point
 
-		cross_product = first_line.cross(second_line)
-		if cross_product >= 0:
-			del convex_hull_points[-1]
+def get_convex_hull_indexes(points: Points) -> List[int]:
+	"""Uses Andrew's monotone chain algorithm to find the convex hull of the points
 
-		convex_hull_points.append(next_point)
+	points: list of Vector2d or (N, 2) array of coordinates
 
-	return ConvexPolygon(convex_hull_points)
+	Returns indexes of the hull vertices in counterclockwise order starting from the point
+	with min x (and min y). Duplicates and points that lay on the hull sides are skipped, so
+	if all the points are the same or lay on one line the result has less than 3 indexes
+	"""
 
+	coordinates = to_coordinates(points)
+	order = np.lexsort((coordinates[:, 1], coordinates[:, 0]))
 
-def sort_clockwise(points: List[Vector2d], lower_point: Vector2d = None) -> List[Vector2d]:
-	if not lower_point:
-		lower_point = get_lower_point(points)
+	return _monotone_chain(coordinates, order)
 
-	points.sort(key=lambda point: Line(lower_point, point).get_slope())
 
-	return points
+def get_convex_hulls_indexes(point_sets: Iterable[Points]) -> List[List[int]]:
+	"""Finds convex hulls of many point sets, the points of all sets are sorted in one call
 
+	Returns list of hull indexes (see get_convex_hull_indexes) for each set, the indexes
+	point to the set's points
+	"""
 
-def get_lower_point(points: List[Vector2d]) -> Vector2d:
-	lower_point = points[0]
+	sets_coordinates = [to_coordinates(points) for points in point_sets]
+	if not sets_coordinates:
+		return []
 
-	for point in points:
+	coordinates = np.concatenate(sets_coordinates)
+	set_ids = np.repeat(np.arange(len(sets_coordinates)), [len(points) for points in sets_coordinates])
+	offsets = np.cumsum([0] + [len(points) for points in sets_coordinates])
 
-		if point.y < lower_point.y:
-			lower_point = point
+	# Sort by set, then by x and y, so every set gets a continuous sorted slice
+	order = np.lexsort((coordinates[:, 1], coordinates[:, 0], set_ids))
+	hulls = []
 
-		elif point.y == lower_point.y and point.x < lower_point.x:
-			lower_point = point
+	for set_id, set_coordinates in enumerate(sets_coordinates):
+		set_order = order[offsets[set_id]:offsets[set_id + 1]] - offsets[set_id]
+		hulls.append(_monotone_chain(set_coordinates, set_order))
 
-	return lower_point
+	return hulls
+
+
+def to_coordinates(points: Points) -> np.ndarray:
+	"""Returns (N, 2) float array of the points coordinates"""
+
+	if isinstance(points, np.ndarray):
+		coordinates = np.asarray(points, dtype=np.float64)
+
+		if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+			raise AttributeError("Points array should have (N, 2) shape, got {}".format(coordinates.shape))
+
+		return coordinates
+
+	return np.array([(point.x, point.y) for point in points], dtype=np.float64).reshape(-1, 2)
+
+
+def _monotone_chain(coordinates: np.ndarray, order: np.ndarray) -> List[int]:
+	"""Builds the hull from the points sorted by x and y, returns indexes of the hull points"""
+
+	if len(order) == 0:
+		return []
+
+	# Drop duplicates, they are neighbours after sorting
+	sorted_coordinates = coordinates[order]
+	is_unique = np.ones(len(order), dtype=bool)
+	is_unique[1:] = np.any(sorted_coordinates[1:] != sorted_coordinates[:-1], axis=1)
+	order = order[is_unique].tolist()
+
+	if len(order) < 3:
+		return order
+
+	x = coordinates[:, 0].tolist()
+	y = coordinates[:, 1].tolist()
+
+	def build_chain(indexes: Iterable[int]) -> List[int]:
+		chain = []
+
+		for i in indexes:
+			# Pop the last point while it doesn't make a left turn (collinear points are popped too)
+			while len(chain) >= 2:
+				origin = chain[-2]
+				last = chain[-1]
+
+				if (x[last] - x[origin]) * (y[i] - y[origin]) - (y[last] - y[origin]) * (x[i] - x[origin]) > 0:
+					break
+
+				chain.pop()
+
+			chain.append(i)
+
+		return chain
+
+	lower_chain = build_chain(order)
+	upper_chain = build_chain(reversed(order))
+
+	# The last point of each chain is the first point of the other one
+	return lower_chain[:-1] + upper_chain[:-1]
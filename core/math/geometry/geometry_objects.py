@@ -1,11 +1,21 @@
+import bisect
 import math
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union, Sequence
 
-from core.math.vector2d import Vector2d
+import numpy as np
+
+from core.math.geometry.bounding_volumes import AABB, BoundingCircle, BoundingVolumeTree
+from core.math.geometry.point_in_polygon import is_points_inside_polygon, is_points_inside_convex_polygon
+from core.math.geometry.polygon_decomposition import get_convex_parts_indexes, get_ear_clipping_triangles
+from core.math.geometry.segments_intersection import iterate_segments_intersections
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
 
 PI = 3.1416
 
+# Iterations of Ellipse.get_closest_point, the error is below 1e-6 of the larger radius after 6 ones
+ELLIPSE_CLOSEST_POINT_ITERATIONS = 6
+
 
 class BaseGeometryObject(ABC):
 
@@ -16,43 +26,139 @@ class BaseGeometryObject(ABC):
 
 class Ray(BaseGeometryObject):
 	"""Represents a line that starts at first_point and goes through the second_point into the
-	infinity"""
+	infinity
+
+	Derived values (vector, direction, slope, y intercept ...) are calculated on the first request
+	and cached, the cache is cleared when one of the points is set. If you change coordinates of
+	the points in place call invalidate_cache. Don't change vectors returned by the getters
+	"""
 
 	def __init__(self, first_point: Vector2d, second_point: Vector2d):
 
 		if first_point == second_point:
 			raise AttributeError("First and second point can't have the same coordinates")
 
-		self.first_point = first_point
-		self.second_point = second_point
+		self._first_point = first_point
+		self._second_point = second_point
+
+		self.invalidate_cache()
+
+	@property
+	def first_point(self) -> Vector2d:
+		return self._first_point
+
+	@first_point.setter
+	def first_point(self, point: Vector2d) -> None:
+		self._first_point = point
+		self.invalidate_cache()
+
+	@property
+	def second_point(self) -> Vector2d:
+		return self._second_point
+
+	@second_point.setter
+	def second_point(self, point: Vector2d) -> None:
+		self._second_point = point
+		self.invalidate_cache()
+
+	def invalidate_cache(self) -> None:
+		self._vector: Optional[Vector2d] = None
+		self._direction: Optional[Vector2d] = None
+		self._squared_length: Optional[float] = None
+		self._slope: Optional[float] = None
+		self._y_intercept: Optional[float] = None
+		self._bounds: Optional[Tuple[float, float, float, float]] = None
+		self._aabb: Optional[AABB] = None
+		self._bounding_circle: Optional[BoundingCircle] = None
+
+	@property
+	def aabb(self) -> AABB:
+		if self._aabb is None:
+			self._aabb = self.get_aabb()
+
+		return self._aabb
+
+	@property
+	def bounding_circle(self) -> BoundingCircle:
+		if self._bounding_circle is None:
+			self._bounding_circle = self.get_bounding_circle()
+
+		return self._bounding_circle
 
 	def get_direction(self) -> Vector2d:
-		return (self.second_point - self.first_point).normalize()
+		if self._direction is None:
+			self._direction = self.get_vector().normalize()
+
+		return self._direction
 
 	def get_vector(self) -> Vector2d:
-		return self.second_point - self.first_point
+		if self._vector is None:
+			self._vector = self._second_point - self._first_point
+
+		return self._vector
+
+	def get_squared_length(self) -> float:
+		"""Squared length of the vector between first and second points"""
+
+		if self._squared_length is None:
+			self._squared_length = self.get_vector().get_squared_magnitude()
+
+		return self._squared_length
+
+	def get_bounds(self) -> Tuple[float, float, float, float]:
+		"""Returns (min_x, max_x, min_y, max_y) of the first and second points"""
+
+		if self._bounds is None:
+			first_point = self._first_point
+			second_point = self._second_point
+
+			self._bounds = (min(first_point.x, second_point.x), max(first_point.x, second_point.x),
+			                min(first_point.y, second_point.y), max(first_point.y, second_point.y))
+
+		return self._bounds
+
+	def get_aabb(self) -> AABB:
+		"""The box is infinite in the directions the ray goes to"""
+
+		x = self._first_point.x
+		y = self._first_point.y
+		vector = self.get_vector()
+
+		return AABB(x if vector.x >= 0 else -math.inf, y if vector.y >= 0 else -math.inf,
+		            x if vector.x <= 0 else math.inf, y if vector.y <= 0 else math.inf)
+
+	def get_bounding_circle(self) -> BoundingCircle:
+		return BoundingCircle(self._first_point, math.inf)
 
 	def is_vertical(self):
-		return self.second_point.x - self.first_point.x == 0
+		return self.get_vector().x == 0
 
 	def is_horizontal(self):
-		return self.second_point.y - self.first_point.y == 0
+		return self.get_vector().y == 0
 
 	def get_slope(self) -> float:
-		numerator = self.second_point.y - self.first_point.y
-		dominator = self.second_point.x - self.first_point.x
+		if self._slope is None:
+			vector = self.get_vector()
 
-		if dominator == 0:
-			return 100000
+			if vector.x == 0:
+				self._slope = 100000
+			else:
+				self._slope = vector.y / vector.x
 
-		return numerator / dominator
+		return self._slope
 
-	def get_y_intercept(self, slope: float) -> float:
-		return self.first_point.y - self.first_point.x * slope
+	def get_y_intercept(self, slope: Optional[float] = None) -> float:
+		if slope is not None:
+			return self._first_point.y - self._first_point.x * slope
+
+		if self._y_intercept is None:
+			self._y_intercept = self._first_point.y - self._first_point.x * self.get_slope()
+
+		return self._y_intercept
 
 	def is_point_belongs(self, point) -> bool:
 		slope = self.get_slope()
-		b = self.get_y_intercept(slope)
+		b = self.get_y_intercept()
 
 		# The point should lay on the line and have the same direction as a ray
 		ray_direction = self.get_direction()
@@ -70,16 +176,25 @@ class Ray(BaseGeometryObject):
 
 		return distance
 
-	def get_closest_point(self, point: Vector2d) -> Vector2d:
-		# Get a point by projecting the segment from the first point to the given onto a Line
-		# it it does not belong to the Ray than it placed behind the first point
-		from_first_point_to_point = point - self.first_point
-		this_line = self.first_point - self.second_point
+	def get_projection_coefficient(self, point: Vector2d) -> float:
+		"""Returns t of the point projection onto the line: first_point + t * (second_point - first_point)"""
+
+		vector = self.get_vector()
+		first_point = self._first_point
 
-		closest_point = self.first_point + from_first_point_to_point.project_on(this_line)
+		return ((point.x - first_point.x) * vector.x + (point.y - first_point.y) * vector.y) / \
+		       self.get_squared_length()
 
-		if self.is_point_belongs(closest_point):
-			return closest_point
+	def get_point_by_coefficient(self, t: float) -> Vector2d:
+		return self._first_point.add_scaled_vector(self.get_vector(), t)
+
+	def get_closest_point(self, point: Vector2d) -> Vector2d:
+		# Project the point onto the Line, if the projection is placed behind the first point
+		# than it does not belong to the Ray
+		t = self.get_projection_coefficient(point)
+
+		if t >= 0:
+			return self.get_point_by_coefficient(t)
 
 		return self.first_point
 
@@ -88,14 +203,14 @@ class Ray(BaseGeometryObject):
 		           self.second_point.get_perpendicular_vector())
 
 	def get_cos_of_angle(self, other: "Ray"):
-		this_vector = self.second_point - self.first_point
-		other_vector = other.second_point - other.first_point
+		this_vector = self.get_vector()
+		other_vector = other.get_vector()
 
 		return this_vector.get_cos_of_angle(other_vector)
 
 	def get_angle(self, other: "Ray"):
-		this_vector = self.first_point - self.second_point
-		other_vector = other.second_point - other.first_point
+		this_vector = self.get_vector().inverse()
+		other_vector = other.get_vector()
 
 		return this_vector.get_angle(other_vector)
 
@@ -105,7 +220,7 @@ class Line(Ray):
 
 	def is_point_belongs(self, point) -> bool:
 		slope = self.get_slope()
-		b = self.get_y_intercept(slope)
+		b = self.get_y_intercept()
 
 		if math.isclose(point.y, point.x * slope + b, abs_tol=0.01):
 			return True
@@ -113,16 +228,25 @@ class Line(Ray):
 		return False
 
 	def get_closest_point(self, point: Vector2d) -> Vector2d:
-		from_first_point_to_point = point - self.first_point
-		this_line = self.first_point - self.second_point
-
-		closest_point = self.first_point + from_first_point_to_point.project_on(this_line)
-		return closest_point
+		return self.get_point_by_coefficient(self.get_projection_coefficient(point))
 
 	def get_perpendicular(self) -> "Line":
 		return Line(self.first_point.get_perpendicular_vector(),
 		            self.second_point.get_perpendicular_vector())
 
+	def get_aabb(self) -> AABB:
+		"""The box is finite only across vertical and horizontal lines"""
+
+		if self.is_vertical():
+			x = self._first_point.x
+			return AABB(x, -math.inf, x, math.inf)
+
+		if self.is_horizontal():
+			y = self._first_point.y
+			return AABB(-math.inf, y, math.inf, y)
+
+		return AABB(-math.inf, -math.inf, math.inf, math.inf)
+
 
 class Segment(Line):
 	"""Represents a line that is placed between the first and the second points"""
@@ -131,15 +255,12 @@ class Segment(Line):
 		return self.get_length()
 
 	def get_length(self) -> float:
-		return (self.second_point - self.first_point).get_magnitude()
+		return math.sqrt(self.get_squared_length())
 
 	def is_point_belongs(self, point: Vector2d) -> bool:
 		slope = self.get_slope()
-		b = self.get_y_intercept(slope)
-		min_x = min(self.first_point.x, self.second_point.x)
-		max_x = max(self.first_point.x, self.second_point.x)
-		min_y = min(self.first_point.y, self.second_point.y)
-		max_y = max(self.first_point.y, self.second_point.y)
+		b = self.get_y_intercept()
+		min_x, max_x, min_y, max_y = self.get_bounds()
 
 		if math.isclose(point.y, point.x * slope + b, abs_tol=0.01) and min_x <= point.x <= \
 				max_x and min_y <= point.y <= max_y:
@@ -148,21 +269,24 @@ class Segment(Line):
 		return False
 
 	def get_closest_point(self, point: Vector2d) -> Vector2d:
-		from_first_point_to_point = point - self.first_point
-		this_line = self.first_point - self.second_point
-		closest_point = self.first_point + from_first_point_to_point.project_on(this_line)
+		# Project the point onto the Line, if the projection is placed outside the segment
+		# than the closest point is one of the ends
+		t = self.get_projection_coefficient(point)
 
-		if self.is_point_belongs(closest_point):
-			return closest_point
+		if t <= 0:
+			return self.first_point
+		if t >= 1:
+			return self.second_point
 
-		from_second_point_to_point = point - self.second_point
+		return self.get_point_by_coefficient(t)
 
-		distance_from_start = from_first_point_to_point.get_magnitude()
-		distance_from_end = from_second_point_to_point.get_magnitude()
-		if distance_from_start > distance_from_end:
-			return self.second_point
+	def get_aabb(self) -> AABB:
+		min_x, max_x, min_y, max_y = self.get_bounds()
 
-		return self.first_point
+		return AABB(min_x, min_y, max_x, max_y)
+
+	def get_bounding_circle(self) -> BoundingCircle:
+		return BoundingCircle(self.get_middle_point(), self.get_length() / 2)
 
 	def get_middle_point(self) -> Vector2d:
 		x = self.first_point.x / 2 + self.second_point.x / 2
@@ -176,6 +300,21 @@ class Segment(Line):
 
 
 class BaseShape(BaseGeometryObject):
+	"""Base class of shapes
+
+	Shapes keep their geometry in local space, set_pose places it into the world: the geometry
+	is rotated (degrees) around the local origin and then moved to the position. World-space
+	values (points, center ...) are cached and recalculated only after the pose was changed,
+	shapes with the identity pose use the local geometry directly
+
+	Bounding box and bounding circle are cached the same way, if you change the geometry in
+	place (e.g. radius) call invalidate_cache
+	"""
+
+	# (x, y, rotation)
+	_pose: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+	_aabb: Optional[AABB] = None
+	_bounding_circle: Optional[BoundingCircle] = None
 
 	@abstractmethod
 	def get_area(self) -> float:
@@ -193,13 +332,93 @@ class BaseShape(BaseGeometryObject):
 	def get_support_point(self, direction: Vector2d):
 		"""Gets a point with the biggest dot product on the direction vector"""
 
+	@abstractmethod
+	def get_aabb(self) -> AABB:
+		"""Calculates the world-space axis aligned bounding box"""
+
+	@abstractmethod
+	def get_bounding_circle(self) -> BoundingCircle:
+		"""Calculates the world-space circle that contains the shape"""
+
+	@property
+	def aabb(self) -> AABB:
+		if self._aabb is None:
+			self._aabb = self.get_aabb()
+
+		return self._aabb
+
+	@property
+	def bounding_circle(self) -> BoundingCircle:
+		if self._bounding_circle is None:
+			self._bounding_circle = self.get_bounding_circle()
+
+		return self._bounding_circle
+
+	def set_pose(self, position: Vector2d, rotation: float = 0.0) -> None:
+		pose = (position.x, position.y, rotation)
+
+		if pose == self._pose:
+			return
+
+		self._pose = pose
+		self.on_pose_changed()
+
+	def get_pose(self) -> Tuple[float, float, float]:
+		return self._pose
+
+	def is_identity_pose(self) -> bool:
+		return self._pose == (0.0, 0.0, 0.0)
+
+	def invalidate_cache(self) -> None:
+		self.on_pose_changed()
+
+	def on_pose_changed(self) -> None:
+		"""Called after the pose was changed, drops world-space values"""
+
+		self._aabb = None
+		self._bounding_circle = None
+
+	def to_world(self, point: Vector2d) -> Vector2d:
+		"""Transforms the point from local into world space"""
+
+		x, y, rotation = self._pose
+
+		if rotation == 0:
+			return Vector2d(point.x + x, point.y + y)
+
+		radians = math.radians(rotation)
+		cos = math.cos(radians)
+		sin = math.sin(radians)
+
+		return Vector2d(point.x * cos - point.y * sin + x, point.x * sin + point.y * cos + y)
+
 
 class Circle(BaseShape):
 	"""Represent circle shape that you can use to create object"""
 
 	def __init__(self, center: Vector2d, radius: float) -> None:
 		self.radius = radius
-		self.center = center
+		self.local_center = center
+		self._center: Optional[Vector2d] = None
+
+	@property
+	def center(self) -> Vector2d:
+		if self.is_identity_pose():
+			return self.local_center
+
+		if self._center is None:
+			self._center = self.to_world(self.local_center)
+
+		return self._center
+
+	@center.setter
+	def center(self, center: Vector2d) -> None:
+		self.local_center = center
+		self.invalidate_cache()
+
+	def on_pose_changed(self) -> None:
+		super().on_pose_changed()
+		self._center = None
 
 	def get_area(self) -> float:
 		return PI * self.radius * self.radius
@@ -213,6 +432,15 @@ class Circle(BaseShape):
 	def get_diameter(self) -> float:
 		return self.radius * 2
 
+	def get_aabb(self) -> AABB:
+		center = self.center
+
+		return AABB(center.x - self.radius, center.y - self.radius, center.x + self.radius,
+		            center.y + self.radius)
+
+	def get_bounding_circle(self) -> BoundingCircle:
+		return BoundingCircle(self.center, self.radius)
+
 	def is_point_belongs(self, point) -> bool:
 		distance_to_center = (self.center - point).get_magnitude()
 
@@ -229,13 +457,93 @@ class Circle(BaseShape):
 
 		return point
 
+	def get_extent(self, direction: Vector2d) -> float:
+		return self.radius
+
+	def get_extents(self, directions: np.ndarray) -> np.ndarray:
+		return np.full(len(directions), float(self.radius))
+
+	def get_closest_point(self, point: Vector2d) -> Vector2d:
+		"""Returns the point of the border that is the closest to the point"""
+
+		center = self.center
+		x = point.x - center.x
+		y = point.y - center.y
+		distance = math.hypot(x, y)
+
+		if distance == 0:
+			return Vector2d(center.x + self.radius, center.y, exact=True)
+
+		return Vector2d(center.x + x * self.radius / distance, center.y + y * self.radius / distance, exact=True)
+
+	def to_unit_space_array(self, points: np.ndarray) -> np.ndarray:
+		"""Transforms (N, 2) array of world points into the space where the circle is the unit one"""
+
+		center = self.center
+
+		return (points - (center.x, center.y)) / self.radius
+
 
 class Ellipse(BaseShape):
 
 	def __init__(self, center: Vector2d, horizontal_radius: float, vertical_radius: float) -> None:
-		self.horizontal_radius = horizontal_radius
-		self.vertical_radius = vertical_radius
-		self.center = center
+		"""Radii are along local axes, the ellipse is rotated by the pose
+
+		Points are moved into the unit space (the ellipse becomes the unit circle centered at
+		the origin) by the inverse rotation and the inverse scale, the inverse scale is cached
+		"""
+
+		self._horizontal_radius = horizontal_radius
+		self._vertical_radius = vertical_radius
+		self._inverse_scale: Optional[Tuple[float, float]] = None
+		self.local_center = center
+		self._center: Optional[Vector2d] = None
+
+	@property
+	def horizontal_radius(self) -> float:
+		return self._horizontal_radius
+
+	@horizontal_radius.setter
+	def horizontal_radius(self, radius: float) -> None:
+		self._horizontal_radius = radius
+		self._inverse_scale = None
+		self.invalidate_cache()
+
+	@property
+	def vertical_radius(self) -> float:
+		return self._vertical_radius
+
+	@vertical_radius.setter
+	def vertical_radius(self, radius: float) -> None:
+		self._vertical_radius = radius
+		self._inverse_scale = None
+		self.invalidate_cache()
+
+	@property
+	def inverse_scale(self) -> Tuple[float, float]:
+		if self._inverse_scale is None:
+			self._inverse_scale = (1 / self._horizontal_radius, 1 / self._vertical_radius)
+
+		return self._inverse_scale
+
+	@property
+	def center(self) -> Vector2d:
+		if self.is_identity_pose():
+			return self.local_center
+
+		if self._center is None:
+			self._center = self.to_world(self.local_center)
+
+		return self._center
+
+	@center.setter
+	def center(self, center: Vector2d) -> None:
+		self.local_center = center
+		self.invalidate_cache()
+
+	def on_pose_changed(self) -> None:
+		super().on_pose_changed()
+		self._center = None
 
 	def get_max_radius(self) -> float:
 		return max(self.horizontal_radius, self.vertical_radius)
@@ -252,25 +560,186 @@ class Ellipse(BaseShape):
 	def get_width(self) -> float:
 		return self.horizontal_radius * 2
 
+	def get_aabb(self) -> AABB:
+		center = self.center
+		half_width = self.horizontal_radius
+		half_height = self.vertical_radius
+		rotation = self._pose[2]
+
+		if rotation != 0:
+			radians = math.radians(rotation)
+			cos = math.cos(radians)
+			sin = math.sin(radians)
+			half_width = math.hypot(self.horizontal_radius * cos, self.vertical_radius * sin)
+			half_height = math.hypot(self.horizontal_radius * sin, self.vertical_radius * cos)
+
+		return AABB(center.x - half_width, center.y - half_height, center.x + half_width,
+		            center.y + half_height)
+
+	def get_bounding_circle(self) -> BoundingCircle:
+		return BoundingCircle(self.center, self.get_max_radius())
+
+	def get_support_point(self, direction: Vector2d) -> Vector2d:
+		# Point of the ellipse x^2 / a^2 + y^2 / b^2 = 1 with the normal (dx, dy) is
+		# (a^2 * dx, b^2 * dy) / sqrt(a^2 * dx^2 + b^2 * dy^2), the radii are along local axes
+		dx = direction.x
+		dy = direction.y
+		rotation = self._pose[2]
+
+		if rotation != 0:
+			radians = math.radians(rotation)
+			cos = math.cos(radians)
+			sin = math.sin(radians)
+			dx, dy = dx * cos + dy * sin, dy * cos - dx * sin
+
+		squared_horizontal = self.horizontal_radius * self.horizontal_radius
+		squared_vertical = self.vertical_radius * self.vertical_radius
+		denominator = math.sqrt(squared_horizontal * dx * dx + squared_vertical * dy * dy)
+
+		if denominator == 0:
+			return self.center
+
+		local_point = Vector2d(self.local_center.x + squared_horizontal * dx / denominator,
+		                       self.local_center.y + squared_vertical * dy / denominator, exact=True)
+
+		return self.to_world(local_point)
+
+	def get_extent(self, direction: Vector2d) -> float:
+		"""Returns half length of the ellipse projection on the unit direction"""
+
+		dx, dy = self._to_local_direction(direction.x, direction.y)
+
+		return math.hypot(self.horizontal_radius * dx, self.vertical_radius * dy)
+
+	def get_extents(self, directions: np.ndarray) -> np.ndarray:
+		"""Vectorized get_extent, directions is (N, 2) array of unit vectors"""
+
+		radians = math.radians(self._pose[2])
+		cos = math.cos(radians)
+		sin = math.sin(radians)
+		dx = directions[:, 0] * cos + directions[:, 1] * sin
+		dy = directions[:, 1] * cos - directions[:, 0] * sin
+
+		return np.hypot(self.horizontal_radius * dx, self.vertical_radius * dy)
+
+	def to_unit_space(self, point: Vector2d) -> Vector2d:
+		x, y = self._to_local_direction(point.x - self.center.x, point.y - self.center.y)
+		inverse_horizontal, inverse_vertical = self.inverse_scale
+
+		return Vector2d(x * inverse_horizontal, y * inverse_vertical, exact=True)
+
+	def from_unit_space(self, point: Vector2d) -> Vector2d:
+		rotation = self._pose[2]
+		x = point.x * self.horizontal_radius
+		y = point.y * self.vertical_radius
+
+		if rotation != 0:
+			radians = math.radians(rotation)
+			cos = math.cos(radians)
+			sin = math.sin(radians)
+			x, y = x * cos - y * sin, x * sin + y * cos
+
+		return Vector2d(x + self.center.x, y + self.center.y, exact=True)
+
+	def to_unit_space_array(self, points: np.ndarray) -> np.ndarray:
+		"""Transforms (N, 2) array of world points into the unit space"""
+
+		center = self.center
+		points = points - (center.x, center.y)
+		rotation = self._pose[2]
+
+		if rotation != 0:
+			radians = math.radians(rotation)
+			cos = math.cos(radians)
+			sin = math.sin(radians)
+			points = points @ np.array(((cos, -sin), (sin, cos)))
+
+		return points * self.inverse_scale
+
+	def get_closest_point(self, point: Vector2d) -> Vector2d:
+		"""Returns the point of the border that is the closest to the point
+
+		The point is moved into the local space, where the border point is found by a fixed
+		count of iterations over the unit circle parameter (cos t, sin t), each iteration
+		approximates the ellipse near the current point by a circle of its curvature
+		"""
+
+		x, y = self._to_local_direction(point.x - self.center.x, point.y - self.center.y)
+		a = self.horizontal_radius
+		b = self.vertical_radius
+		px = abs(x)
+		py = abs(y)
+
+		if px == 0 and py == 0:
+			unit_x, unit_y = (0.0, 1.0) if b <= a else (1.0, 0.0)
+		else:
+			unit_x = unit_y = math.sqrt(0.5)
+
+			for _ in range(ELLIPSE_CLOSEST_POINT_ITERATIONS):
+				# Center of the curvature of the current point
+				evolute_x = (a * a - b * b) * unit_x ** 3 / a
+				evolute_y = (b * b - a * a) * unit_y ** 3 / b
+
+				curvature_radius = math.hypot(a * unit_x - evolute_x, b * unit_y - evolute_y)
+				distance = math.hypot(px - evolute_x, py - evolute_y)
+				if distance == 0:
+					break
+
+				unit_x = min(max((px - evolute_x) * curvature_radius / distance + evolute_x, 0.0), a) / a
+				unit_y = min(max((py - evolute_y) * curvature_radius / distance + evolute_y, 0.0), b) / b
+				length = math.hypot(unit_x, unit_y)
+				unit_x /= length
+				unit_y /= length
+
+		return self.from_unit_space(Vector2d(math.copysign(unit_x, x), math.copysign(unit_y, y), exact=True))
+
+	def get_distance_to_point(self, point: Vector2d) -> float:
+		"""Returns distance from the border to the point, it's negative if the point is inside"""
+
+		closest_point = self.get_closest_point(point)
+		distance = math.hypot(point.x - closest_point.x, point.y - closest_point.y)
+
+		if self.to_unit_space(point).get_squared_magnitude() < 1:
+			return -distance
+
+		return distance
+
 	def is_point_belongs(self, point) -> bool:
-		# Use equation of ellipse to determinate either the point belongs to the ellipse
-		left = point.x ** 2 / self.horizontal_radius ** 2
-		right = point.y ** 2 / self.vertical_radius ** 2
-		res = left + right
+		res = self.to_unit_space(point).get_squared_magnitude()
 
 		if math.isclose(res, 1, abs_tol=0.01) or res < 1:
 			return True
 
 		return False
 
+	def _to_local_direction(self, x: float, y: float) -> Tuple[float, float]:
+		rotation = self._pose[2]
+
+		if rotation == 0:
+			return x, y
+
+		radians = math.radians(rotation)
+		cos = math.cos(radians)
+		sin = math.sin(radians)
+
+		return x * cos + y * sin, y * cos - x * sin
+
 
 class BasePolygon(BaseShape, ABC):
 
-	def __init__(self, points: List[Vector2d]) -> None:
+	def __init__(self, points: Union[List[Vector2d], np.ndarray]) -> None:
 		"""Creates a polygon from a list of points. Should be specified at least 3 points
 
-		points (List[Vector2d]): list of points that represent border of the shape
+		points (List[Vector2d] or (N, 2) array): list of points that represent border of the shape
 								 should be specified in the order they connect to each other
+
+		Only the points are stored on creation, the most distant points, triangles, sides,
+		centroid and diagonals are calculated on the first access and cached. If you change
+		the points in place call invalidate_cache
+
+		The points are local, points property returns them transformed by the pose. The same
+		points are available as contiguous (N, 2) float array (vertices) and sides as pairs
+		of vertex indexes (edges), area, centroid, support point ... are calculated on the arrays
 		"""
 
 		if len(points) < 3:
@@ -278,18 +747,157 @@ class BasePolygon(BaseShape, ABC):
 				"ConvexPolygon should have at least 3 points, you specified: " + str(len(points)))
 
 		self.points = points
-		self.points_count = len(self.points)
 
-		self.the_most_distant_points = self.get_the_most_distant_points()
+	@property
+	def points(self) -> List[Vector2d]:
+		if self._points is None:
+			self._points = self.get_world_points()
+
+		return self._points
+
+	@points.setter
+	def points(self, points: Union[List[Vector2d], np.ndarray]) -> None:
+		local_vertices = None
+
+		if isinstance(points, np.ndarray):
+			if points.ndim != 2 or points.shape[1] != 2:
+				raise AttributeError("Vertices array should have (N, 2) shape, got {}".format(points.shape))
+
+			local_vertices = np.ascontiguousarray(points, dtype=np.float64)
+			points = [Vector2d(x, y) for x, y in local_vertices.tolist()]
+
+		self.local_points = points
+		self.points_count = len(points)
+
+		self.invalidate_cache()
+		self._local_vertices = local_vertices
+
+	@property
+	def local_vertices(self) -> np.ndarray:
+		if self._local_vertices is None:
+			self._local_vertices = np.array([(point.x, point.y) for point in self.local_points],
+			                                dtype=np.float64)
+
+		return self._local_vertices
+
+	@property
+	def vertices(self) -> np.ndarray:
+		"""World-space points as (N, 2) array"""
+
+		if self._vertices is None:
+			self._vertices = self.get_world_vertices()
+
+		return self._vertices
+
+	@property
+	def edges(self) -> np.ndarray:
+		"""(N, 2) array of vertex indexes, i side goes from edges[i, 0] to edges[i, 1] vertex"""
+
+		if self._edges is None:
+			indexes = np.arange(self.points_count)
+			self._edges = np.column_stack((indexes, np.roll(indexes, -1)))
+
+		return self._edges
+
+	@property
+	def edge_normals(self) -> np.ndarray:
+		"""(N, 2) array of unit normals of the sides, i normal is perpendicular to i side"""
+
+		if self._edge_normals is None:
+			vertices = self.vertices
+			sides = np.roll(vertices, -1, axis=0) - vertices
+			normals = np.column_stack((sides[:, 1], -sides[:, 0]))
+			self._edge_normals = normals / np.hypot(normals[:, 0], normals[:, 1])[:, np.newaxis]
+
+		return self._edge_normals
+
+	def invalidate_cache(self) -> None:
+		self._local_vertices: Optional[np.ndarray] = None
+		self._edges: Optional[np.ndarray] = None
+		self.on_pose_changed()
+
+	def on_pose_changed(self) -> None:
+		super().on_pose_changed()
+		self._points: Optional[List[Vector2d]] = None
+		self._vertices: Optional[np.ndarray] = None
+		self._edge_normals: Optional[np.ndarray] = None
+		self._the_most_distant_points: Optional[Tuple[Vector2d, Vector2d, Vector2d, Vector2d]] = None
+		self._triangles: Optional[List["Triangle"]] = None
+		self._sides: Optional[List[Segment]] = None
+		self._centroid: Optional[Vector2d] = None
+		self._diagonals: Optional[List[Segment]] = None
+
+	def get_world_vertices(self) -> np.ndarray:
+		if self.is_identity_pose():
+			return self.local_vertices
+
+		x, y, rotation = self._pose
+		radians = math.radians(rotation)
+		cos = math.cos(radians)
+		sin = math.sin(radians)
+
+		# Rows are points, so the rotation matrix is transposed
+		return self.local_vertices @ np.array([[cos, sin], [-sin, cos]]) + (x, y)
 
-		self.triangles = self.triangulate(points[0])
+	def get_aabb(self) -> AABB:
+		vertices = self.vertices
+		min_x, min_y = vertices.min(axis=0).tolist()
+		max_x, max_y = vertices.max(axis=0).tolist()
 
-		self.sides = self.get_sides()
-		self.sides_count = len(self.sides)
+		return AABB(min_x, min_y, max_x, max_y)
 
-		self.centroid = self.get_centroid()
+	def get_bounding_circle(self) -> BoundingCircle:
+		"""The circle is centered in the bounding box, it isn't the smallest one"""
 
-		self.diagonals = self.get_diagonals()
+		center = self.aabb.get_center()
+		offsets = self.vertices - (center.x, center.y)
+
+		return BoundingCircle(center, float(np.hypot(offsets[:, 0], offsets[:, 1]).max()))
+
+	def get_world_points(self) -> List[Vector2d]:
+		if self.is_identity_pose():
+			return self.local_points
+
+		return [Vector2d(x, y) for x, y in self.vertices.tolist()]
+
+	@property
+	def the_most_distant_points(self) -> Tuple[Vector2d, Vector2d, Vector2d, Vector2d]:
+		if self._the_most_distant_points is None:
+			self._the_most_distant_points = self.get_the_most_distant_points()
+
+		return self._the_most_distant_points
+
+	@property
+	def triangles(self) -> List["Triangle"]:
+		if self._triangles is None:
+			self._triangles = self.triangulate(self.points[0])
+
+		return self._triangles
+
+	@property
+	def sides(self) -> List[Segment]:
+		if self._sides is None:
+			self._sides = self.get_sides()
+
+		return self._sides
+
+	@property
+	def sides_count(self) -> int:
+		return self.points_count
+
+	@property
+	def centroid(self) -> Vector2d:
+		if self._centroid is None:
+			self._centroid = self.get_centroid()
+
+		return self._centroid
+
+	@property
+	def diagonals(self) -> List[Segment]:
+		if self._diagonals is None:
+			self._diagonals = self.get_diagonals()
+
+		return self._diagonals
 
 	def get_the_most_distant_points(self) -> Tuple[Vector2d, Vector2d, Vector2d, Vector2d]:
 		"""Return tuple of four the most distant points (x, y coordinates) starting from max x
@@ -297,55 +905,27 @@ class BasePolygon(BaseShape, ABC):
 
 		(max_x_point, max_y_point, min_x_point, min_y_point)
 		"""
-		max_x = -math.inf
-		min_x = math.inf
-		max_y = -math.inf
-		min_y = math.inf
-		max_x_point, max_y_point, min_x_point, min_y_point = Vector2d(
-			0, 0), Vector2d(
-			0, 0), Vector2d(
-			0, 0), Vector2d(
-			0, 0)
-
-		for point in self.points:
-			if max_x < point.x:
-				max_x = point.x
-				max_x_point = point
-
-			elif min_x > point.x:
-				min_x = point.x
-				min_x_point = point
 
-			if max_y < point.y:
-				max_y = point.y
-				max_y_point = point
+		vertices = self.vertices
+		points = self.points
 
-			elif min_y > point.y:
-				min_y = point.y
-				min_y_point = point
-
-		return max_x_point, max_y_point, min_x_point, min_y_point
+		return points[int(np.argmax(vertices[:, 0]))], points[int(np.argmax(vertices[:, 1]))], \
+		       points[int(np.argmin(vertices[:, 0]))], points[int(np.argmin(vertices[:, 1]))]
 
 	def triangulate(self, point: Vector2d) -> List['Triangle']:
+		"""Splits the polygon into triangles that share the point (fan triangulation)"""
+
 		vertex_index = self.get_vertex_index(point)
 		triangles = []
 
 		for i in range(self.points_count):
-			is_this_vertex = i == vertex_index
-
-			previous_index = (vertex_index - 1)
-			if previous_index < 0:
-				previous_index = self.points_count - 1
-			is_previous_vertex = i == previous_index
-
-			next_index = (vertex_index + 1)
-			if previous_index > self.points_count - 1:
-				next_index = 0
-			is_next_vertex = i == next_index
-			if vertex_index is not None and (is_this_vertex or is_previous_vertex or is_next_vertex):
+			next_index = (i + 1) % self.points_count
+
+			# Sides that contain the vertex don't create triangles
+			if vertex_index is not None and vertex_index in (i, next_index):
 				continue
 
-			triangle_points = [point, self.points[i], self.points[i + 1]]
+			triangle_points = [point, self.points[i], self.points[next_index]]
 			triangles.append(Triangle(triangle_points))
 
 		return triangles
@@ -365,34 +945,24 @@ class BasePolygon(BaseShape, ABC):
 
 	def get_centroid(self) -> Vector2d:
 		# https://en.wikipedia.org/wiki/Polygon
-		centroid = Vector2d(0, 0)
-		signed_area = 0.0
-
-		for i in range(self.points_count - 1):
-			x0 = self.points[i].x
-			y0 = self.points[i].y
-			x1 = self.points[i + 1].x
-			y1 = self.points[i + 1].y
-
-			temp_area = x0 * y1 - x1 * y0
-			signed_area += temp_area
-			centroid.x += (x0 + x1) * temp_area
-			centroid.y += (y0 + y1) * temp_area
-
-		x0 = self.points[self.points_count - 1].x
-		y0 = self.points[self.points_count - 1].y
-		x1 = self.points[0].x
-		y1 = self.points[0].y
-		temp_area = x0 * y1 - x1 * y0
-		signed_area += temp_area
-		centroid.x += (x0 + x1) * temp_area
-		centroid.y += (y0 + y1) * temp_area
-
-		signed_area *= 0.5
-		centroid.x /= (6.0 * signed_area)
-		centroid.y /= (6.0 * signed_area)
-
-		return centroid
+		x, y, cross_products = self._get_shoelace_terms()
+		next_x = np.roll(x, -1)
+		next_y = np.roll(y, -1)
+
+		signed_area = 0.5 * cross_products.sum()
+		centroid_x = ((x + next_x) * cross_products).sum() / (6.0 * signed_area)
+		centroid_y = ((y + next_y) * cross_products).sum() / (6.0 * signed_area)
+
+		return Vector2d(centroid_x, centroid_y)
+
+	def _get_shoelace_terms(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+		"""Returns x, y of the vertices and cross products of each vertex with the next one"""
+
+		vertices = self.vertices
+		x = vertices[:, 0]
+		y = vertices[:, 1]
+
+		return x, y, x * np.roll(y, -1) - np.roll(x, -1) * y
 
 	def get_diagonals(self) -> List[Segment]:
 		diagonals: List[Segment] = []
@@ -411,20 +981,11 @@ class BasePolygon(BaseShape, ABC):
 		return area
 
 	def get_area(self) -> float:
-		# To get an area of a polygon you need to get array of points in counterclockwise order
-		# and multiply x of each point on y of the next point, then do the same with y and x
-		# get the sum and divide on 2
-
-		res = 0
-		reversed_sides = self.sides[::-1]
+		# Shoelace formula: a half of the sum of cross products of each vertex with the next one,
+		# the sign depends on the points order
+		_, _, cross_products = self._get_shoelace_terms()
 
-		for side in reversed_sides:
-			res += side.second_point.x * side.first_point.y
-
-		for side in reversed_sides:
-			res += side.second_point.y * side.first_point.x
-
-		return 0.5 * res
+		return 0.5 * abs(cross_products.sum())
 
 	def get_height(self) -> float:
 		max_x_point, max_y_point, min_x_point, min_y_point = self.the_most_distant_points
@@ -449,42 +1010,36 @@ class BasePolygon(BaseShape, ABC):
 		return None
 
 	def is_point_belongs(self, point) -> bool:
-		# Draw a horizontal ray that starts the point, if count of times the ray intersects with
-		# a polygon sides is even than the point located inside the polygon
+		return bool(self.is_points_belong(np.array(((point.x, point.y),)))[0])
 
-		hor_line = Ray(point, point.x + 1)
-		data = hor_line.get_intersection_data(self)
-		if not data:
-			return False
-
-		inter_points = data[0]
+	def is_points_belong(self, points: Union[Sequence[Vector2d], np.ndarray]) -> np.ndarray:
+		"""Checks many points at once, points are list of Vector2d or (M, 2) array,
+		returns (M,) bool array (see point_in_polygon.is_points_inside_polygon)
+		"""
 
-		if len(inter_points) % 2 == 1:
-			return True
+		if not isinstance(points, np.ndarray):
+			points = np.array([(point.x, point.y) for point in points], dtype=np.float64)
 
-		return False
+		return is_points_inside_polygon(self.vertices, points)
 
-	def is_concave(self):
+	def is_concave(self) -> bool:
 		"""To determinate ether a polygon is concave we will calculate
-		cross product for each pair of vectors and if all the results are
+		cross product for each pair of adjacent sides and if all the results are
 		greater or all are smaller than zero than it will be convex poly
 		"""
 
-		cross_products = []
-
-		for i in range(self.sides_count - 1):
-			first_vector = self.sides[i].get_vector()
-			second_vector = self.sides[i + 1].get_vector()
-
-			cross_products.append(first_vector.cross(second_vector))
+		vertices = self.vertices
+		sides = np.roll(vertices, -1, axis=0) - vertices
+		next_sides = np.roll(sides, -1, axis=0)
 
-		sign = cross_products[0]
+		cross_products = sides[:, 0] * next_sides[:, 1] - sides[:, 1] * next_sides[:, 0]
 
-		for cp in cross_products:
-			if cp * sign < 0:
-				return True
+		# A vertex that is closer than the tolerance to the line between its neighbours
+		# is considered collinear with them, the distance is |cross product| / |chord|
+		chords = np.hypot(sides[:, 0] + next_sides[:, 0], sides[:, 1] + next_sides[:, 1])
+		cross_products = cross_products[np.abs(cross_products) > POINTS_TOLERANCE * chords]
 
-		return False
+		return bool(np.any(cross_products > 0) and np.any(cross_products < 0))
 
 	def get_side_with_point(self, point: Vector2d) -> List[Line]:
 		sides_with_point = []
@@ -495,51 +1050,252 @@ class BasePolygon(BaseShape, ABC):
 		return sides_with_point
 
 	def get_support_point(self, direction: Vector2d) -> Vector2d:
-		support_point = None
-		max_product = -1
+		products = self.vertices @ (direction.x, direction.y)
 
-		for point in self.points:
-			product = direction.dot_product(point)
+		return self.points[int(np.argmax(products))]
 
-			if product > max_product:
-				max_product = product
-				support_point = point
 
-		return support_point
+class ConvexPolygon(BasePolygon):
+	"""Polygon without interior angles > 180 degrees
 
+	Support point search climbs from the vertex found by the previous search (or the given
+	one) to the neighbours with bigger dot product, so repeated queries with close directions
+	(e.g. from frame to frame) take a few steps. get_extreme_index makes binary search instead,
+	it takes O(log n) for any direction
+	"""
 
-class ConvexPolygon(BasePolygon):
+	# Index of the last found support point, the next search starts from it
+	_support_index = 0
 
-	def __init__(self, points: List[Vector2d]):
+	def __init__(self, points: Union[List[Vector2d], np.ndarray]):
 		super().__init__(points)
 
 		if self.is_concave():
 			raise AttributeError("Convex polygon can't have interior angles > 180 degrees")
 
+	def invalidate_cache(self) -> None:
+		super().invalidate_cache()
+		self._normal_angles: Optional[Tuple[List[float], List[int]]] = None
+		self._counterclockwise_vertices: Optional[np.ndarray] = None
+
+	@property
+	def counterclockwise_vertices(self) -> np.ndarray:
+		"""Local vertices in counterclockwise order"""
+
+		if self._counterclockwise_vertices is None:
+			vertices = self.local_vertices
+			next_vertices = np.roll(vertices, -1, axis=0)
+
+			if (vertices[:, 0] * next_vertices[:, 1] - vertices[:, 1] * next_vertices[:, 0]).sum() < 0:
+				vertices = np.ascontiguousarray(vertices[::-1])
+
+			self._counterclockwise_vertices = vertices
+
+		return self._counterclockwise_vertices
+
+	def is_points_belong(self, points: Union[Sequence[Vector2d], np.ndarray]) -> np.ndarray:
+		"""Checks many points at once by the wedge test in O(log n) for each point
+		(see point_in_polygon.is_points_inside_convex_polygon), the points are moved into
+		local space instead of transforming the vertices
+		"""
+
+		if not isinstance(points, np.ndarray):
+			points = np.array([(point.x, point.y) for point in points], dtype=np.float64)
+
+		if not self.is_identity_pose():
+			x, y, rotation = self._pose
+			radians = math.radians(rotation)
+			cos = math.cos(radians)
+			sin = math.sin(radians)
+			points = (points - (x, y)) @ np.array([[cos, -sin], [sin, cos]])
+
+		return is_points_inside_convex_polygon(self.counterclockwise_vertices, points)
+
+	@property
+	def normal_angles(self) -> Tuple[List[float], List[int]]:
+		"""Angles of the local outward normals of the sides in counterclockwise order and indexes
+		of the sides first vertices. Angles grow from the first one, the last one is less than
+		the first one + 2pi, sides with zero length are skipped
+		"""
+
+		if self._normal_angles is None:
+			self._normal_angles = self.get_normal_angles()
+
+		return self._normal_angles
+
+	def get_normal_angles(self) -> Tuple[List[float], List[int]]:
+		vertices = self.local_vertices
+		order = list(range(self.points_count))
+
+		next_vertices = np.roll(vertices, -1, axis=0)
+		if (vertices[:, 0] * next_vertices[:, 1] - vertices[:, 1] * next_vertices[:, 0]).sum() < 0:
+			order.reverse()
+
+		coordinates = vertices.tolist()
+		angles = []
+		indexes = []
+
+		for i, j in zip(order, order[1:] + order[:1]):
+			dx = coordinates[j][0] - coordinates[i][0]
+			dy = coordinates[j][1] - coordinates[i][1]
+
+			if dx == 0 and dy == 0:
+				continue
+
+			# Outward normal of a counterclockwise side is the side rotated clockwise
+			angle = math.atan2(-dx, dy)
+
+			if angles:
+				# The normal turns less than pi on a vertex, bigger drop means that atan2
+				# wrapped around. Almost collinear sides can turn a bit back, it's ignored
+				if angle < angles[-1] - math.pi:
+					angle += 2 * math.pi
+
+				angle = max(angle, angles[-1])
+
+			angles.append(angle)
+			indexes.append(i)
+
+		return angles, indexes
+
+	def get_extreme_index(self, direction: Vector2d) -> int:
+		"""Returns index of a vertex with the biggest dot product on the direction vector
+
+		The vertex lays between the sides which normals surround the direction, they are found
+		by binary search over normal_angles
+		"""
+
+		angles, indexes = self.normal_angles
+		angle = math.atan2(direction.y, direction.x) - math.radians(self._pose[2])
+		angle = angles[0] + (angle - angles[0]) % (2 * math.pi)
+
+		return indexes[bisect.bisect_right(angles, angle) % len(indexes)]
+
+	def get_support_index(self, direction: Vector2d, start_index: Optional[int] = None) -> int:
+		"""Returns index of a vertex with the biggest dot product on the direction vector"""
+
+		points = self.points
+		count = self.points_count
+		dx = direction.x
+		dy = direction.y
+
+		index = (self._support_index if start_index is None else start_index) % count
+		product = points[index].x * dx + points[index].y * dy
+
+		# Products along the border of a convex polygon grow up to the support point and then
+		# go down, so climb to the side that doesn't decrease. Equal products are passed,
+		# because the start point can be inside a side that is perpendicular to the direction
+		for step in (1, -1):
+			steps = 0
+
+			while steps < count:
+				next_index = (index + step) % count
+				next_product = points[next_index].x * dx + points[next_index].y * dy
+
+				if next_product < product:
+					break
+
+				index = next_index
+				product = next_product
+				steps += 1
+
+			if steps:
+				break
+
+		self._support_index = index
+
+		return index
+
+	def get_support_point(self, direction: Vector2d, start_index: Optional[int] = None) -> Vector2d:
+		return self.points[self.get_support_index(direction, start_index)]
+
 
 class ConcavePolygon(BasePolygon):
+	"""Polygon with at least one interior angle > 180 degrees
+
+	The polygon is split into convex parts on creation (see polygon_decomposition), the parts
+	are kept in a bounding volume tree, so collision checks go only through the parts which boxes
+	overlap. The parts are created in local space and get the pose of the polygon
+	"""
 
-	def __init__(self, points: List[Vector2d]):
+	def __init__(self, points: Union[List[Vector2d], np.ndarray]):
 		super().__init__(points)
 
 		if not self.is_concave():
 			raise AttributeError("Concave polygon should have at least one interior angle > 180 degrees")
 
 		self.check_self_inter_poly()
+		self._convex_parts = self.get_convex_parts()
+
+	def invalidate_cache(self) -> None:
+		super().invalidate_cache()
+		self._convex_parts: Optional[List[ConvexPolygon]] = None
+		self._parts_tree: Optional[BoundingVolumeTree] = None
+
+	def on_pose_changed(self) -> None:
+		super().on_pose_changed()
+		self._is_parts_posed = False
+		self._is_parts_tree_fitted = False
+
+	@property
+	def convex_parts(self) -> List[ConvexPolygon]:
+		if self._convex_parts is None:
+			self._convex_parts = self.get_convex_parts()
+			self._is_parts_posed = False
+
+		if not self._is_parts_posed:
+			x, y, rotation = self._pose
+			position = Vector2d(x, y, exact=True)
+
+			for part in self._convex_parts:
+				part.set_pose(position, rotation)
+
+			self._is_parts_posed = True
+
+		return self._convex_parts
+
+	@property
+	def parts_tree(self) -> BoundingVolumeTree:
+		parts = self.convex_parts
+
+		if self._parts_tree is None:
+			self._parts_tree = BoundingVolumeTree(parts)
+		elif not self._is_parts_tree_fitted:
+			self._parts_tree.refit()
+
+		self._is_parts_tree_fitted = True
+
+		return self._parts_tree
+
+	def get_convex_parts(self) -> List[ConvexPolygon]:
+		"""Splits the polygon into convex parts in local space"""
+
+		return [ConvexPolygon([self.local_points[i] for i in indexes])
+		        for indexes in get_convex_parts_indexes(self.local_vertices)]
 
 	def check_self_inter_poly(self):
+		"""Raises AttributeError if sides that aren't neighbours intersect or touch, the sides are
+		checked by the sweep, so it takes O((n + k) log n) for k intersecting pairs of sides
+		"""
+
+		points = self.local_vertices.tolist()
+		count = self.points_count
+		sides = [(points[i], points[(i + 1) % count]) for i in range(count)]
 
-		for i in range(self.sides_count - 1):
-			is_inter = self.sides[i].get_intersection_data(self.sides[i + 1])
-			if is_inter:
+		for first, second, _ in iterate_segments_intersections(sides):
+			# Neighbours share a vertex, the last side is the neighbour of the first one
+			if second - first not in (1, count - 1):
 				raise AttributeError("Self-intersecting polygons are disallowed")
 
-		is_inter = self.sides[0].get_intersection_data(self.sides[self.sides_count - 1])
-		if is_inter:
-			raise AttributeError("Self-intersecting polygons are disallowed")
+	def triangulate(self, point: Optional[Vector2d] = None) -> List['Triangle']:
+		"""Splits the polygon into triangles by ear clipping, the point isn't used, fan
+		triangulation doesn't work for concave polygons
+		"""
 
-	def triangulate(self, point: Vector2d) -> List['Triangle']:
-		raise NotImplemented()
+		points = self.points
+
+		return [Triangle([points[i] for i in triangle])
+		        for triangle in get_ear_clipping_triangles(self.local_vertices)]
 
 
 class Rectangle(ConvexPolygon):
@@ -568,10 +1324,16 @@ class Rectangle(ConvexPolygon):
 		return self.height * self.width
 
 	def get_height(self) -> float:
-		return self.height
+		if self._pose[2] == 0:
+			return self.height
+
+		return super().get_height()
 
 	def get_width(self) -> float:
-		return self.width
+		if self._pose[2] == 0:
+			return self.width
+
+		return super().get_width()
 
 
 class Triangle(ConvexPolygon):
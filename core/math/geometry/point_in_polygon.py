@@ -0,0 +1,105 @@
+import numpy as np
+
+from core.math.vector2d import POINTS_TOLERANCE
+
+# Count of points tested at once by the crossing test, it keeps (points, sides) arrays small
+CROSSING_TEST_CHUNK_SIZE = 1024
+
+
+def is_points_inside_polygon(vertices: np.ndarray, points: np.ndarray,
+                             tolerance: float = POINTS_TOLERANCE) -> np.ndarray:
+	"""Crossing number test of many points, works with any simple polygon
+
+	vertices: (N, 2) array of the polygon vertices in any order
+	points: (M, 2) array of the points
+
+	A horizontal ray is cast from each point, the point is inside if the ray crosses the
+	border odd number of times. Points that are closer to the border than the tolerance are
+	inside too. Returns (M,) bool array
+	"""
+
+	points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+	result = np.empty(len(points), dtype=bool)
+
+	for start in range(0, len(points), CROSSING_TEST_CHUNK_SIZE):
+		chunk = points[start:start + CROSSING_TEST_CHUNK_SIZE]
+		result[start:start + CROSSING_TEST_CHUNK_SIZE] = _is_points_inside_polygon(vertices, chunk, tolerance)
+
+	return result
+
+
+def is_points_inside_convex_polygon(vertices: np.ndarray, points: np.ndarray,
+                                    tolerance: float = POINTS_TOLERANCE) -> np.ndarray:
+	"""Wedge test of many points, takes O(log n) for each point
+
+	vertices: (N, 2) array of the convex polygon vertices in counterclockwise order
+	points: (M, 2) array of the points
+
+	The polygon is split into a fan of triangles from the first vertex, the triangle of each
+	point is found by binary search over the fan sides, then the point is checked against the
+	polygon side of the triangle. Points that are closer to the border than the tolerance are
+	inside too. Returns (M,) bool array
+	"""
+
+	points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+	count = len(vertices)
+	apex = vertices[0]
+	fan = vertices - apex
+	offsets = points - apex
+
+	def get_cross(vectors: np.ndarray, other_vectors: np.ndarray) -> np.ndarray:
+		return vectors[..., 0] * other_vectors[..., 1] - vectors[..., 1] * other_vectors[..., 0]
+
+	fan_lengths = np.hypot(fan[:, 0], fan[:, 1])
+
+	# The point should be between the first and the last fan sides
+	is_inside = (get_cross(fan[1], offsets) >= -tolerance * fan_lengths[1]) & \
+	            (get_cross(fan[count - 1], offsets) <= tolerance * fan_lengths[count - 1])
+
+	# cross(fan[low], offset) >= 0 > cross(fan[high], offset)
+	low = np.ones(len(points), dtype=np.intp)
+	high = np.full(len(points), count - 1, dtype=np.intp)
+
+	while True:
+		is_searched = high - low > 1
+		if not is_searched.any():
+			break
+
+		middle = (low + high) // 2
+		is_left = get_cross(fan[middle], offsets) >= 0
+		low = np.where(is_searched & is_left, middle, low)
+		high = np.where(is_searched & ~is_left, middle, high)
+
+	sides = vertices[low + 1] - vertices[low]
+	side_lengths = np.hypot(sides[:, 0], sides[:, 1])
+
+	return is_inside & (get_cross(sides, points - vertices[low]) >= -tolerance * side_lengths)
+
+
+def _is_points_inside_polygon(vertices: np.ndarray, points: np.ndarray, tolerance: float) -> np.ndarray:
+	# (points, sides) arrays
+	x = points[:, 0:1]
+	y = points[:, 1:2]
+	first_x = vertices[:, 0]
+	first_y = vertices[:, 1]
+	second_x = np.roll(first_x, -1)
+	second_y = np.roll(first_y, -1)
+
+	# Sides that cross the horizontal line of the point, the upper end isn't counted
+	# so the ray that goes through a vertex crosses only one of its sides
+	is_crossing = (first_y > y) != (second_y > y)
+	height = np.where(second_y == first_y, 1.0, second_y - first_y)
+	crossing_x = first_x + (y - first_y) * (second_x - first_x) / height
+	is_inside = np.count_nonzero(is_crossing & (x < crossing_x), axis=1) % 2 == 1
+
+	# Distances to the sides for the points on the border
+	side_x = second_x - first_x
+	side_y = second_y - first_y
+	squared_lengths = side_x * side_x + side_y * side_y
+	t = ((x - first_x) * side_x + (y - first_y) * side_y) / np.where(squared_lengths == 0, 1.0, squared_lengths)
+	t = np.clip(t, 0.0, 1.0)
+	distance_x = first_x + side_x * t - x
+	distance_y = first_y + side_y * t - y
+	is_on_border = (distance_x * distance_x + distance_y * distance_y).min(axis=1) <= tolerance * tolerance
+
+	return is_inside | is_on_border
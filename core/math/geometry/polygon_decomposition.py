@@ -0,0 +1,154 @@
+from typing import List, Tuple, Dict
+
+import numpy as np
+
+# Cross products smaller than the tolerance are considered zero (collinear points)
+CROSS_TOLERANCE = 1e-9
+
+
+def get_convex_parts_indexes(coordinates: np.ndarray) -> List[List[int]]:
+	"""Splits a simple polygon into convex parts, coordinates is (N, 2) array of the vertices
+
+	The polygon is triangulated by ear clipping and then the triangles are merged while the
+	merged polygon stays convex (Hertel-Mehlhorn), it gives at most 4 times more parts than
+	the minimal decomposition
+
+	Returns lists of vertex indexes of the parts in counterclockwise order
+	"""
+
+	return merge_triangles(coordinates, get_ear_clipping_triangles(coordinates))
+
+
+def get_ear_clipping_triangles(coordinates: np.ndarray) -> List[Tuple[int, int, int]]:
+	"""Triangulates a simple polygon by cutting off ears, takes O(n^2)
+
+	Ear is a convex vertex which triangle with its neighbours doesn't contain other vertices.
+	Returns vertex indexes of the triangles in counterclockwise order, vertices that are
+	collinear with their neighbours are cut off without triangles
+	"""
+
+	points = coordinates.tolist()
+	remaining = list(range(len(points)))
+
+	if _get_signed_area(points) < 0:
+		remaining.reverse()
+
+	triangles = []
+	i = 0
+	steps_without_ear = 0
+
+	while len(remaining) > 3:
+		if steps_without_ear > len(remaining):
+			raise AttributeError("Can't triangulate the polygon, it's self-intersecting")
+
+		count = len(remaining)
+		previous = remaining[(i - 1) % count]
+		current = remaining[i % count]
+		following = remaining[(i + 1) % count]
+		cross = _get_cross(points[previous], points[current], points[following])
+
+		if abs(cross) <= CROSS_TOLERANCE:
+			del remaining[i % count]
+			steps_without_ear = 0
+			continue
+
+		if cross > 0 and not _is_any_point_inside(points, remaining, previous, current, following):
+			triangles.append((previous, current, following))
+			del remaining[i % count]
+			steps_without_ear = 0
+			continue
+
+		i += 1
+		steps_without_ear += 1
+
+	if len(remaining) == 3 and abs(_get_cross(*(points[j] for j in remaining))) > CROSS_TOLERANCE:
+		triangles.append(tuple(remaining))
+
+	return triangles
+
+
+def merge_triangles(coordinates: np.ndarray, triangles: List[Tuple[int, int, int]]) -> List[List[int]]:
+	"""Removes diagonals between the counterclockwise triangles while the polygons on both sides
+	of a diagonal can be merged into a convex one
+	"""
+
+	points = coordinates.tolist()
+	parts: Dict[int, List[int]] = {}
+	# Directed side -> id of the part that has it
+	owners: Dict[Tuple[int, int], int] = {}
+
+	for part_id, triangle in enumerate(triangles):
+		parts[part_id] = list(triangle)
+
+		for j in range(3):
+			owners[(triangle[j], triangle[(j + 1) % 3])] = part_id
+
+	diagonals = [(a, b) for a, b in owners if a < b and (b, a) in owners]
+
+	for a, b in diagonals:
+		first_id = owners[(a, b)]
+		second_id = owners[(b, a)]
+
+		# first part goes b ... a, second one a ... b
+		first = _rotate_to(parts[first_id], b)
+		second = _rotate_to(parts[second_id], a)
+
+		if not (_is_convex_vertex(points, first[-2], a, second[1]) and
+		        _is_convex_vertex(points, second[-2], b, first[1])):
+			continue
+
+		merged = first + second[1:-1]
+		parts[first_id] = merged
+		del parts[second_id]
+		del owners[(a, b)]
+		del owners[(b, a)]
+
+		for j in range(len(second) - 1):
+			owners[(second[j], second[j + 1])] = first_id
+
+	return list(parts.values())
+
+
+def _rotate_to(indexes: List[int], start: int) -> List[int]:
+	position = indexes.index(start)
+
+	return indexes[position:] + indexes[:position]
+
+
+def _is_convex_vertex(points: List[List[float]], previous: int, current: int, following: int) -> bool:
+	return _get_cross(points[previous], points[current], points[following]) >= -CROSS_TOLERANCE
+
+
+def _is_any_point_inside(points: List[List[float]], remaining: List[int], first: int, second: int,
+                         third: int) -> bool:
+	a = points[first]
+	b = points[second]
+	c = points[third]
+
+	for index in remaining:
+		if index == first or index == second or index == third:
+			continue
+
+		point = points[index]
+
+		# Points on the triangle sides block the ear too, otherwise the cut could touch the border
+		if _get_cross(a, b, point) >= 0 and _get_cross(b, c, point) >= 0 and _get_cross(c, a, point) >= 0:
+			if point != a and point != b and point != c:
+				return True
+
+	return False
+
+
+def _get_cross(a: List[float], b: List[float], c: List[float]) -> float:
+	return (b[0] - a[0]) * (c[1] - b[1]) - (b[1] - a[1]) * (c[0] - b[0])
+
+
+def _get_signed_area(points: List[List[float]]) -> float:
+	area = 0.0
+
+	for i in range(len(points)):
+		x1, y1 = points[i - 1]
+		x2, y2 = points[i]
+		area += x1 * y2 - x2 * y1
+
+	return area / 2
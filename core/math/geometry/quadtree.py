@@ -0,0 +1,287 @@
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.vector2d import Vector2d
+
+# Leaf is split when it has more items
+QUADTREE_CAPACITY = 8
+# Leaves of this depth aren't split, e.g. if many items have the same position
+QUADTREE_MAX_DEPTH = 16
+
+
+class _QuadNode:
+	__slots__ = ("aabb", "parent", "children", "items", "count")
+
+	def __init__(self, aabb: AABB, parent: Optional["_QuadNode"] = None) -> None:
+		self.aabb = aabb
+		self.parent = parent
+		self.children: List["_QuadNode"] = []
+		# Key of an item -> (item, x, y), only leaves keep items
+		self.items: Dict[int, Tuple[Any, float, float]] = {}
+		# Count of the items in the subtree
+		self.count = 0
+
+	def is_leaf(self) -> bool:
+		return not self.children
+
+	def get_depth(self) -> int:
+		depth = 0
+		node = self.parent
+
+		while node is not None:
+			depth += 1
+			node = node.parent
+
+		return depth
+
+	def get_child(self, x: float, y: float) -> "_QuadNode":
+		# Borders of the children are used, so the child box always contains the point
+		children = self.children
+
+		return children[(x >= children[1].aabb.min_x) + 2 * (y >= children[2].aabb.min_y)]
+
+	def get_squared_distance(self, x: float, y: float) -> float:
+		aabb = self.aabb
+		dx = max(aabb.min_x - x, 0, x - aabb.max_x)
+		dy = max(aabb.min_y - y, 0, y - aabb.max_y)
+
+		return dx * dx + dy * dy
+
+
+class QuadTree:
+	"""Index of the positions of items (e.g. entities), a leaf is split into four quadrants when
+	it has more items than the capacity and children are merged back when they have less
+
+	Items are moved incrementally: if a new position is inside the leaf of the item only the
+	position is changed. The root grows when a position is outside of it, so the box is only an
+	initial guess (e.g. size of the scene). Items are compared by identity
+	"""
+
+	def __init__(self, aabb: AABB, capacity: int = QUADTREE_CAPACITY, max_depth: int = QUADTREE_MAX_DEPTH):
+		if capacity < 1:
+			raise AttributeError("Capacity should be positive, got {}".format(capacity))
+
+		if not all(math.isfinite(value) for value in (aabb.min_x, aabb.min_y, aabb.max_x, aabb.max_y)):
+			raise AttributeError("Bounds of the tree should be finite, got {}".format(aabb))
+
+		if aabb.get_width() <= 0 or aabb.get_height() <= 0:
+			raise AttributeError("Bounds of the tree should have positive size, got {}".format(aabb))
+
+		self.capacity = capacity
+		self.max_depth = max_depth
+		self.root = _QuadNode(aabb)
+		self._leaves: Dict[int, _QuadNode] = {}
+
+	def __len__(self) -> int:
+		return len(self._leaves)
+
+	def __contains__(self, item: Any) -> bool:
+		return id(item) in self._leaves
+
+	def insert(self, item: Any, position: Vector2d) -> None:
+		key = id(item)
+
+		if key in self._leaves:
+			raise AttributeError("The item {} is already added".format(item))
+
+		self._insert(key, item, position.x, position.y)
+
+	def remove(self, item: Any) -> None:
+		leaf = self._leaves.pop(id(item), None)
+
+		if leaf is None:
+			raise AttributeError("The item {} isn't added".format(item))
+
+		del leaf.items[id(item)]
+		self._on_removed(leaf)
+
+	def move(self, item: Any, position: Vector2d) -> None:
+		key = id(item)
+		leaf = self._leaves.get(key)
+
+		if leaf is None:
+			raise AttributeError("The item {} isn't added".format(item))
+
+		if leaf.aabb.is_point_inside(position):
+			leaf.items[key] = (item, position.x, position.y)
+			return
+
+		del leaf.items[key]
+		self._on_removed(leaf)
+		self._insert(key, item, position.x, position.y)
+
+	def get_position(self, item: Any) -> Vector2d:
+		_, x, y = self._leaves[id(item)].items[id(item)]
+
+		return Vector2d(x, y, exact=True)
+
+	def query_rect(self, aabb: AABB) -> List[Any]:
+		"""Returns items which positions are inside the box"""
+
+		items = []
+		not_visited = [self.root]
+
+		while not_visited:
+			node = not_visited.pop()
+
+			if not node.count or not node.aabb.is_intersect(aabb):
+				continue
+
+			not_visited.extend(node.children)
+			items.extend(item for item, x, y in node.items.values()
+			             if aabb.min_x <= x <= aabb.max_x and aabb.min_y <= y <= aabb.max_y)
+
+		return items
+
+	def query_radius(self, center: Vector2d, radius: float) -> List[Any]:
+		"""Returns items which positions are not further from the center than the radius"""
+
+		squared_radius = radius * radius
+		items = []
+		not_visited = [self.root]
+
+		while not_visited:
+			node = not_visited.pop()
+
+			if not node.count or node.get_squared_distance(center.x, center.y) > squared_radius:
+				continue
+
+			not_visited.extend(node.children)
+			items.extend(item for item, x, y in node.items.values()
+			             if (x - center.x) ** 2 + (y - center.y) ** 2 <= squared_radius)
+
+		return items
+
+	def k_nearest(self, point: Vector2d, k: int) -> List[Any]:
+		"""Returns k items closest to the point, ordered by the distance
+
+		Nodes and items are taken from one heap by the distance, so only the nodes that are
+		closer than k-th item are opened
+		"""
+
+		items = []
+		# (squared distance, order, node or None, item), order breaks the ties
+		heap = [(0.0, 0, self.root, None)]
+		order = 1
+
+		while heap and len(items) < k:
+			_, _, node, item = heapq.heappop(heap)
+
+			if node is None:
+				items.append(item)
+				continue
+
+			for child in node.children:
+				if child.count:
+					heapq.heappush(heap, (child.get_squared_distance(point.x, point.y), order, child, None))
+					order += 1
+
+			for item, x, y in node.items.values():
+				heapq.heappush(heap, ((x - point.x) ** 2 + (y - point.y) ** 2, order, None, item))
+				order += 1
+
+		return items
+
+	def _insert(self, key: int, item: Any, x: float, y: float) -> None:
+		if not (math.isfinite(x) and math.isfinite(y)):
+			raise AttributeError("Position should be finite, got ({}, {})".format(x, y))
+
+		while not self.root.aabb.is_point_inside(Vector2d(x, y, exact=True)):
+			self._grow(x, y)
+
+		node = self.root
+		node.count += 1
+
+		while not node.is_leaf():
+			node = node.get_child(x, y)
+			node.count += 1
+
+		node.items[key] = (item, x, y)
+		self._leaves[key] = node
+
+		if len(node.items) > self.capacity and node.get_depth() < self.max_depth:
+			self._split(node)
+
+	def _split(self, node: _QuadNode) -> None:
+		aabb = node.aabb
+		node.children = _get_quadrants(node, (aabb.min_x, (aabb.min_x + aabb.max_x) / 2, aabb.max_x),
+		                               (aabb.min_y, (aabb.min_y + aabb.max_y) / 2, aabb.max_y))
+
+		items = node.items
+		node.items = {}
+
+		for key, (item, x, y) in items.items():
+			child = node.get_child(x, y)
+			child.items[key] = (item, x, y)
+			child.count += 1
+			self._leaves[key] = child
+
+		# All the items can go to one quadrant
+		for child in node.children:
+			if len(child.items) > self.capacity and child.get_depth() < self.max_depth:
+				self._split(child)
+
+	def _on_removed(self, leaf: _QuadNode) -> None:
+		"""Updates counts up to the root and merges the highest node that fits the capacity"""
+
+		mergeable = None
+		node = leaf
+
+		while node is not None:
+			node.count -= 1
+
+			if not node.is_leaf() and node.count <= self.capacity:
+				mergeable = node
+
+			node = node.parent
+
+		if mergeable is not None:
+			self._merge(mergeable)
+
+	def _merge(self, node: _QuadNode) -> None:
+		not_visited = list(node.children)
+		node.children = []
+
+		while not_visited:
+			child = not_visited.pop()
+			not_visited.extend(child.children)
+
+			for key, value in child.items.items():
+				node.items[key] = value
+				self._leaves[key] = node
+
+	def _grow(self, x: float, y: float) -> None:
+		"""Doubles the root toward the point, the old root becomes a quadrant of the new one"""
+
+		old_root = self.root
+		aabb = old_root.aabb
+		is_left = x < aabb.min_x
+		is_lower = y < aabb.min_y
+
+		if is_left:
+			borders_x = (aabb.min_x - aabb.get_width(), aabb.min_x, aabb.max_x)
+		else:
+			borders_x = (aabb.min_x, aabb.max_x, aabb.max_x + aabb.get_width())
+
+		if is_lower:
+			borders_y = (aabb.min_y - aabb.get_height(), aabb.min_y, aabb.max_y)
+		else:
+			borders_y = (aabb.min_y, aabb.max_y, aabb.max_y + aabb.get_height())
+
+		self.root = _QuadNode(AABB(borders_x[0], borders_y[0], borders_x[2], borders_y[2]))
+		self.root.count = old_root.count
+
+		if old_root.count:
+			self.root.children = _get_quadrants(self.root, borders_x, borders_y)
+			self.root.children[is_left + 2 * is_lower] = old_root
+			old_root.parent = self.root
+
+
+def _get_quadrants(parent: _QuadNode, borders_x: Tuple[float, float, float],
+                   borders_y: Tuple[float, float, float]) -> List[_QuadNode]:
+	"""Order of the quadrants matches _QuadNode.get_child"""
+
+	return [_QuadNode(AABB(borders_x[i], borders_y[j], borders_x[i + 1], borders_y[j + 1]), parent)
+	        for j in (0, 1) for i in (0, 1)]
@@ -0,0 +1,175 @@
+import heapq
+import math
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from core.math.geometry.collision_detection.lines.lines_penetr_coeff import get_penetr_coeff_by_points
+from core.math.vector2d import Vector2d
+
+# Segments that pass closer than it to a point go through the point
+SWEEP_TOLERANCE = 1e-9
+
+Point = Tuple[float, float]
+
+
+def get_segments_intersections(segments: Sequence["Segment"]) -> List[Tuple[int, int, Vector2d]]:
+	"""Returns (i, j, point) for each pair of segments that intersect or touch, i < j, the point is
+	one of the common points of the segments (the first one in the sweep order)
+	"""
+
+	ends = [((segment.first_point.x, segment.first_point.y), (segment.second_point.x, segment.second_point.y))
+	        for segment in segments]
+
+	return [(i, j, Vector2d(x, y, exact=True)) for i, j, (x, y) in iterate_segments_intersections(ends)]
+
+
+def iterate_segments_intersections(segments: Sequence[Tuple[Point, Point]]) -> Iterator[Tuple[int, int, Point]]:
+	"""Yields (i, j, point) for each pair of intersecting segments given by their ends, each pair once
+
+	Bentley-Ottmann sweep, takes O((n + k) log n) for n segments and k intersecting pairs, the
+	pairs are yielded as they are found, so a caller that needs only the first one can stop
+	"""
+
+	return _SegmentsSweep(segments).iterate()
+
+
+class _SegmentsSweep:
+	"""The sweep line goes along x, events are ends of the segments and intersection points
+	ordered by x, then by y. Status keeps the segments that cross the sweep line ordered by y,
+	only the segments that become neighbours in the status are checked for intersection
+	"""
+
+	def __init__(self, segments: Sequence[Tuple[Point, Point]]) -> None:
+		# Ends of the segments, the left (lower for vertical) end goes first
+		self.segments: List[Tuple[Point, Point]] = []
+		self.starts: Dict[Point, List[int]] = {}
+		self.events: List[Point] = []
+		self.scheduled: Set[Point] = set()
+		self.status: List[int] = []
+		self.reported: Set[Tuple[int, int]] = set()
+
+		for i, (first, second) in enumerate(segments):
+			first = (float(first[0]), float(first[1]))
+			second = (float(second[0]), float(second[1]))
+			left, right = (first, second) if first <= second else (second, first)
+
+			self.segments.append((left, right))
+			self.starts.setdefault(left, []).append(i)
+			self._add_event(left)
+			self._add_event(right)
+
+	def iterate(self) -> Iterator[Tuple[int, int, Point]]:
+		status = self.status
+
+		while self.events:
+			point = heapq.heappop(self.events)
+			start, end = self._find_through(point)
+			through = status[start:end] + self.starts.get(point, [])
+
+			for first_index, first in enumerate(through):
+				for second in through[first_index + 1:]:
+					pair = (first, second) if first < second else (second, first)
+
+					if pair not in self.reported:
+						self.reported.add(pair)
+						yield pair[0], pair[1], point
+
+			# Segments that go on after the point are ordered by y right after it
+			continuing = sorted((i for i in through if self._is_after(self.segments[i][1], point)),
+			                    key=self._get_slope)
+			status[start:end] = continuing
+
+			if continuing:
+				if start > 0:
+					self._check_neighbours(status[start - 1], continuing[0], point)
+				if start + len(continuing) < len(status):
+					self._check_neighbours(continuing[-1], status[start + len(continuing)], point)
+			elif 0 < start < len(status):
+				self._check_neighbours(status[start - 1], status[start], point)
+
+	def _add_event(self, point: Point) -> None:
+		if point not in self.scheduled:
+			self.scheduled.add(point)
+			heapq.heappush(self.events, point)
+
+	def _find_through(self, point: Point) -> Tuple[int, int]:
+		"""Returns the range of the status segments that go through the point, the segments
+		are neighbours in the status, as they have the same y at the sweep line
+		"""
+
+		status = self.status
+		x, y = point
+		low = 0
+		high = len(status)
+
+		while low < high:
+			middle = (low + high) // 2
+			if self._get_y(status[middle], x, y) < y - SWEEP_TOLERANCE:
+				low = middle + 1
+			else:
+				high = middle
+
+		# Y of steep segments is less precise, so the range is searched on both sides
+		start = low
+		while start > 0 and self._is_through(status[start - 1], point):
+			start -= 1
+
+		end = low
+		while end < len(status) and self._is_through(status[end], point):
+			end += 1
+
+		return start, end
+
+	def _get_y(self, index: int, x: float, y: float) -> float:
+		"""Y of the segment at the sweep line, vertical segments are at y of the event point"""
+
+		(x1, y1), (x2, y2) = self.segments[index]
+
+		if x1 == x2:
+			return min(max(y, y1), y2)
+
+		return y1 + (x - x1) * (y2 - y1) / (x2 - x1)
+
+	def _get_slope(self, index: int) -> float:
+		# Vertical segments go above the others after their lower end
+		(x1, y1), (x2, y2) = self.segments[index]
+
+		return (y2 - y1) / (x2 - x1) if x1 != x2 else math.inf
+
+	def _is_through(self, index: int, point: Point) -> bool:
+		(x1, y1), (x2, y2) = self.segments[index]
+		dx = x2 - x1
+		dy = y2 - y1
+		squared_length = dx * dx + dy * dy
+		t = 0.0 if squared_length == 0 else ((point[0] - x1) * dx + (point[1] - y1) * dy) / squared_length
+		t = min(max(t, 0.0), 1.0)
+
+		return math.hypot(x1 + t * dx - point[0], y1 + t * dy - point[1]) <= SWEEP_TOLERANCE
+
+	@staticmethod
+	def _is_after(first: Point, second: Point) -> bool:
+		"""Whether the first point comes after the second one in the sweep order"""
+
+		return first[0] > second[0] + SWEEP_TOLERANCE or \
+		       (abs(first[0] - second[0]) <= SWEEP_TOLERANCE and first[1] > second[1] + SWEEP_TOLERANCE)
+
+	def _check_neighbours(self, first: int, second: int, point: Point) -> None:
+		"""Schedules the intersection of the segments if it's after the point. Collinear
+		segments are skipped, their common part starts at an end of one of them
+		"""
+
+		(x1, y1), (x2, y2) = self.segments[first]
+		(x3, y3), (x4, y4) = self.segments[second]
+		coefficients = get_penetr_coeff_by_points(x1, y1, x2, y2, x3, y3, x4, y4)
+
+		if coefficients is None:
+			return
+
+		t, u = coefficients
+		if not (-SWEEP_TOLERANCE <= t <= 1 + SWEEP_TOLERANCE and -SWEEP_TOLERANCE <= u <= 1 + SWEEP_TOLERANCE):
+			return
+
+		t = min(max(t, 0.0), 1.0)
+		intersection = (x1 + t * (x2 - x1), y1 + t * (y2 - y1))
+
+		if self._is_after(intersection, point):
+			self._add_event(intersection)
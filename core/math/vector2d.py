@@ -1,40 +1,57 @@
 import math
+from typing import Iterable, List, Tuple
+
+# Vectors which coordinates differ less than the tolerance are considered equal
+POINTS_TOLERANCE = 0.01
 
 
 class Vector2d:
 	"""Represent vector in 2D space
 
 	Provide all essential methods, in order to work with 2D vectors
+
+	By default coordinates are rounded to 4 digits after the point, it keeps results
+	of geometry calculations stable. Vectors created with exact=True skip the rounding,
+	the mode is inherited by all vectors that are derived from the vector (scale, add_vector ...)
+
+	Methods that start with "i" (iadd, iscale, iadd_scaled, inormalize ...) change
+	the vector in place and return it, they don't allocate new objects so use them in loops
+	that are executed every frame
 	"""
 
-	def __init__(self, x: float, y: float):
-		self.x = round(float(x), 4)
-		self.y = round(float(y), 4)
+	__slots__ = ("x", "y", "exact")
+
+	def __init__(self, x: float, y: float, exact: bool = False):
+		self.exact = exact
+
+		if exact:
+			self.x = float(x)
+			self.y = float(y)
+		else:
+			self.x = round(float(x), 4)
+			self.y = round(float(y), 4)
 
 	def scale(self, scalar: float) -> "Vector2d":
-		return Vector2d(self.x * scalar, self.y * scalar)
+		return Vector2d(self.x * scalar, self.y * scalar, self.exact)
 
 	def copy(self):
-		return Vector2d(self.x, self.y)
+		return Vector2d(self.x, self.y, self.exact)
 
 	def add_vector(self, another_vector: "Vector2d") -> "Vector2d":
-		return Vector2d(self.x + another_vector.x, self.y + another_vector.y)
+		return Vector2d(self.x + another_vector.x, self.y + another_vector.y, self.exact)
 
 	def __add__(self, another_vector: "Vector2d") -> "Vector2d":
 		return self.add_vector(another_vector)
 
 	def __iadd__(self, another_vector: "Vector2d") -> "Vector2d":
-		self.x += another_vector.x
-		self.y += another_vector.y
-
-		return self
+		return self.iadd(another_vector)
 
 	def project_on(self, another_vector: "Vector2d"):
 		projection_len = self.dot_product(another_vector)
 		another_vector_squared_len = another_vector.get_squared_magnitude()
 		scalar = projection_len / another_vector_squared_len
 
-		return another_vector.scale(scalar)
+		return Vector2d(another_vector.x * scalar, another_vector.y * scalar, self.exact)
 
 	def get_cos_of_angle(self, other: "Vector2d") -> float:
 		numerator = self.dot_product(other)
@@ -49,22 +66,20 @@ class Vector2d:
 		return math.degrees(angle_radians)
 
 	def get_perpendicular_vector(self):
-		return Vector2d(self.y, -self.x)
+		return Vector2d(self.y, -self.x, self.exact)
 
 	def add_scaled_vector(self, another_vector: "Vector2d", scalar: float) -> "Vector2d":
-		return Vector2d(self.x + (another_vector.x * scalar), self.y + (another_vector.y * scalar))
+		return Vector2d(self.x + (another_vector.x * scalar), self.y + (another_vector.y * scalar),
+		                self.exact)
 
 	def subtract_vector(self, another_vector: "Vector2d") -> "Vector2d":
-		return Vector2d(self.x - another_vector.x, self.y - another_vector.y)
+		return Vector2d(self.x - another_vector.x, self.y - another_vector.y, self.exact)
 
 	def __sub__(self, another_vector: "Vector2d") -> "Vector2d":
 		return self.subtract_vector(another_vector)
 
 	def __isub__(self, another_vector: "Vector2d") -> "Vector2d":
-		self.x -= another_vector.x
-		self.y -= another_vector.y
-
-		return self
+		return self.isubtract(another_vector)
 
 	def cross(self, other: "Vector2d") -> float:
 		"""Cross product (vector product) of vectors
@@ -90,7 +105,7 @@ class Vector2d:
 		return self.x * self.x + self.y * self.y
 
 	def inverse(self) -> "Vector2d":
-		return Vector2d(-self.x, -self.y)
+		return Vector2d(-self.x, -self.y, self.exact)
 
 	def __neg__(self) -> "Vector2d":
 		return self.inverse()
@@ -106,21 +121,85 @@ class Vector2d:
 			normalized_x = self.x / magnitude
 			normalized_y = self.y / magnitude
 
-		return Vector2d(normalized_x, normalized_y)
+		return Vector2d(normalized_x, normalized_y, self.exact)
+
+	#########################
+	# In place operations
+	#########################
+
+	def set(self, x: float, y: float) -> "Vector2d":
+		if self.exact:
+			self.x = x
+			self.y = y
+		else:
+			self.x = round(x, 4)
+			self.y = round(y, 4)
+
+		return self
+
+	def set_vector(self, another_vector: "Vector2d") -> "Vector2d":
+		return self.set(another_vector.x, another_vector.y)
+
+	def iadd(self, another_vector: "Vector2d") -> "Vector2d":
+		return self.set(self.x + another_vector.x, self.y + another_vector.y)
+
+	def isubtract(self, another_vector: "Vector2d") -> "Vector2d":
+		return self.set(self.x - another_vector.x, self.y - another_vector.y)
+
+	def iscale(self, scalar: float) -> "Vector2d":
+		return self.set(self.x * scalar, self.y * scalar)
+
+	def iadd_scaled(self, another_vector: "Vector2d", scalar: float) -> "Vector2d":
+		return self.set(self.x + another_vector.x * scalar, self.y + another_vector.y * scalar)
+
+	def iinverse(self) -> "Vector2d":
+		return self.set(-self.x, -self.y)
+
+	def inormalize(self) -> "Vector2d":
+		magnitude = math.sqrt(self.x * self.x + self.y * self.y)
+
+		if magnitude == 0:
+			return self.set(0.0, 0.0)
+
+		return self.set(self.x / magnitude, self.y / magnitude)
 
 	def __eq__(self, other: object) -> bool:
 
 		if not isinstance(other, Vector2d):
 			return NotImplemented
 
-		if math.isclose(self.x, other.x, abs_tol=0.01) and \
-				math.isclose(self.y, other.y, abs_tol=0.01):
+		if math.isclose(self.x, other.x, abs_tol=POINTS_TOLERANCE) and \
+				math.isclose(self.y, other.y, abs_tol=POINTS_TOLERANCE):
 			return True
 
 		return False
 
+	# Equality uses tolerance, so there isn't a hash that is consistent with it,
+	# use get_grid_key to put vectors into sets or dictionaries
+	__hash__ = None
+
+	def get_grid_key(self, cell_size: float = POINTS_TOLERANCE) -> Tuple[int, int]:
+		"""Returns hashable coordinates of the grid cell the vector falls into
+
+		Vectors with the same key are equal, but equal vectors that lay near a cell border
+		can get different keys
+		"""
+
+		return round(self.x / cell_size), round(self.y / cell_size)
+
 	def __str__(self) -> str:
 		return f"({self.x}; {self.y})"
 
 	def __repr__(self) -> str:
 		return f"Vector2d({self.x}, {self.y})"
+
+
+def get_unique_points(points: Iterable[Vector2d], cell_size: float = POINTS_TOLERANCE) -> List[Vector2d]:
+	"""Removes duplicates (points with the same grid key) keeping the order of the first occurrences"""
+
+	unique_points = {}
+
+	for point in points:
+		unique_points.setdefault(point.get_grid_key(cell_size), point)
+
+	return list(unique_points.values())
@@ -0,0 +1,164 @@
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
+
+Scalars = Union[float, np.ndarray]
+Vectors = Union["Vector2dArray", Vector2d]
+
+
+class Vector2dArray:
+	"""Represent N vectors in 2D space stored as two contiguous float64 arrays (struct of arrays)
+
+	Mirrors Vector2d API, but every method works on all vectors at once. Methods accept
+	either another Vector2dArray of the same length or a single Vector2d that is applied
+	to every vector. Methods that return scalars (dot_product, cross, get_magnitude ...)
+	return an array with one value per vector
+	"""
+
+	__slots__ = ("x", "y")
+
+	def __init__(self, x: Iterable[float], y: Iterable[float]):
+		self.x = np.ascontiguousarray(x, dtype=np.float64)
+		self.y = np.ascontiguousarray(y, dtype=np.float64)
+
+		if self.x.shape != self.y.shape or self.x.ndim != 1:
+			raise AttributeError("x and y should be one dimensional arrays of the same length, got {} and {}"
+			                     .format(self.x.shape, self.y.shape))
+
+	@classmethod
+	def from_vectors(cls, vectors: Iterable[Vector2d]) -> "Vector2dArray":
+		vectors = list(vectors)
+		x = np.fromiter((vector.x for vector in vectors), dtype=np.float64, count=len(vectors))
+		y = np.fromiter((vector.y for vector in vectors), dtype=np.float64, count=len(vectors))
+
+		return cls(x, y)
+
+	@classmethod
+	def from_array(cls, points: np.ndarray) -> "Vector2dArray":
+		"""Creates vectors from (N, 2) array"""
+
+		points = np.asarray(points, dtype=np.float64)
+		return cls(points[:, 0], points[:, 1])
+
+	@classmethod
+	def zeros(cls, count: int) -> "Vector2dArray":
+		return cls(np.zeros(count), np.zeros(count))
+
+	def to_vectors(self, exact: bool = True) -> List[Vector2d]:
+		return [Vector2d(x, y, exact) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+	def to_array(self) -> np.ndarray:
+		"""Returns (N, 2) array of coordinates"""
+
+		return np.column_stack((self.x, self.y))
+
+	def copy(self) -> "Vector2dArray":
+		return Vector2dArray(self.x.copy(), self.y.copy())
+
+	def __len__(self) -> int:
+		return self.x.shape[0]
+
+	def __getitem__(self, item) -> Union[Vector2d, "Vector2dArray"]:
+		"""Integer index returns a Vector2d, a slice, mask or an indices array returns Vector2dArray"""
+
+		if isinstance(item, (int, np.integer)):
+			return Vector2d(self.x[item], self.y[item], exact=True)
+
+		return Vector2dArray(self.x[item], self.y[item])
+
+	def scale(self, scalar: Scalars) -> "Vector2dArray":
+		return Vector2dArray(self.x * scalar, self.y * scalar)
+
+	def add_vector(self, another_vector: Vectors) -> "Vector2dArray":
+		return Vector2dArray(self.x + another_vector.x, self.y + another_vector.y)
+
+	def __add__(self, another_vector: Vectors) -> "Vector2dArray":
+		return self.add_vector(another_vector)
+
+	def add_scaled_vector(self, another_vector: Vectors, scalar: Scalars) -> "Vector2dArray":
+		return Vector2dArray(self.x + another_vector.x * scalar, self.y + another_vector.y * scalar)
+
+	def subtract_vector(self, another_vector: Vectors) -> "Vector2dArray":
+		return Vector2dArray(self.x - another_vector.x, self.y - another_vector.y)
+
+	def __sub__(self, another_vector: Vectors) -> "Vector2dArray":
+		return self.subtract_vector(another_vector)
+
+	def inverse(self) -> "Vector2dArray":
+		return Vector2dArray(-self.x, -self.y)
+
+	def __neg__(self) -> "Vector2dArray":
+		return self.inverse()
+
+	def get_perpendicular_vector(self) -> "Vector2dArray":
+		return Vector2dArray(self.y, -self.x)
+
+	def cross(self, other: Vectors) -> np.ndarray:
+		"""Cross product (vector product) of vectors
+
+		Returns the magnitudes of the vectors that perpendicular
+		to the plains that contain these vectors
+		"""
+
+		return self.x * other.y - self.y * other.x
+
+	def dot_product(self, another_vector: Vectors) -> np.ndarray:
+		return self.x * another_vector.x + self.y * another_vector.y
+
+	def get_magnitude(self) -> np.ndarray:
+		return np.hypot(self.x, self.y)
+
+	def get_squared_magnitude(self) -> np.ndarray:
+		return self.x * self.x + self.y * self.y
+
+	def normalize(self) -> "Vector2dArray":
+		"""Create unit vectors from the vectors, zero vectors stay zero"""
+
+		magnitude = self.get_magnitude()
+		magnitude[magnitude == 0] = np.inf
+
+		return Vector2dArray(self.x / magnitude, self.y / magnitude)
+
+	def project_on(self, another_vector: Vectors) -> "Vector2dArray":
+		scalar = self.dot_product(another_vector) / (another_vector.x * another_vector.x +
+		                                             another_vector.y * another_vector.y)
+
+		return Vector2dArray(another_vector.x * scalar, another_vector.y * scalar)
+
+	#########################
+	# In place operations
+	#########################
+
+	def iadd_scaled(self, another_vector: Vectors, scalar: Scalars) -> "Vector2dArray":
+		self.x += another_vector.x * scalar
+		self.y += another_vector.y * scalar
+
+		return self
+
+	def iscale(self, scalar: Scalars) -> "Vector2dArray":
+		self.x *= scalar
+		self.y *= scalar
+
+		return self
+
+	def is_close(self, other: Vectors) -> np.ndarray:
+		"""Compares vectors with the same tolerance as Vector2d, returns array of booleans"""
+
+		return (np.abs(self.x - other.x) <= POINTS_TOLERANCE) & \
+		       (np.abs(self.y - other.y) <= POINTS_TOLERANCE)
+
+	def __eq__(self, other: object) -> np.ndarray:
+		if not isinstance(other, (Vector2dArray, Vector2d)):
+			return NotImplemented
+
+		return self.is_close(other)
+
+	__hash__ = None
+
+	def __str__(self) -> str:
+		return "[{}]".format(", ".join(f"({x}; {y})" for x, y in zip(self.x.tolist(), self.y.tolist())))
+
+	def __repr__(self) -> str:
+		return f"Vector2dArray({self.x!r}, {self.y!r})"
@@ -59,9 +59,10 @@ class Entity(Object):
 
 		for comp in self.components:
 			for base in classes_to_check:
-				if base in (type(object), type(BaseComponent)):
+				# Components of different types share the base classes
+				if base is BaseComponent or not issubclass(base, BaseComponent):
 					continue
-				if base in getmro(comp):
+				if base in getmro(comp.__class__):
 					return True
 
 		return False
@@ -17,5 +17,9 @@ class Object(EventDispatcher):
 
 		return False
 
+	def __hash__(self) -> int:
+		# Objects are equal only to themselves, so they are hashed by identity
+		return id(self)
+
 	def __str__(self):
 		return "{}".format(type(self))
@@ -22,7 +22,7 @@ class ComponentParent(BaseComponent):
 		super(ComponentParent, self).__init__(**kwargs)
 		self.children: Set["Entity"] = set()
 
-	def add_child(self, child: Entity):
+	def add_child(self, child: "Entity"):
 		if self.is_child(child):
 			Logger.log_error("The object {} is already a child of the {}".format(child, self))
 			raise Exception("The object {} is already a child of the {}".format(child, self))
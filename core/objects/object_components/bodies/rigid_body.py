@@ -1,3 +1,5 @@
+from typing import Optional
+
 from core.math.vector2d import Vector2d
 from core.objects.entity import Entity
 from core.objects.object_components.base_component import BaseComponent, CT_RIGID_BODY, CT_TRANSFORM
@@ -10,8 +12,8 @@ class RigidBody(BaseComponent):
 	def __init__(self, name: str, attached_obj: Entity,
 	             linear_drag: float, mass: float = 1.0, angular_drag: float = 1.0,
 	             rb_type: str = "dynamic",
-	             velocity: Vector2d = Vector2d(0, 0),
-	             force: Vector2d = Vector2d(0, 0)):
+	             velocity: Optional[Vector2d] = None,
+	             force: Optional[Vector2d] = None):
 		if not rb_type in RB_TYPES:
 			raise AttributeError(
 				"Rigid body time should be one of the following values {}, but not {}".format(RB_TYPES,
@@ -21,8 +23,14 @@ class RigidBody(BaseComponent):
 		self.mass = 1
 		self.inverted_mass = 1 / mass
 
-		self.result_force = force
-		self.velocity = velocity
+		# The vectors are changed in place every update, so they shouldn't be shared between bodies
+		self.result_force = Vector2d(0, 0, exact=True)
+		self.velocity = Vector2d(0, 0, exact=True)
+
+		if force is not None:
+			self.result_force.set_vector(force)
+		if velocity is not None:
+			self.velocity.set_vector(velocity)
 
 		self.linear_drag = linear_drag
 		self.angular_drag = angular_drag
@@ -31,23 +39,23 @@ class RigidBody(BaseComponent):
 		self.type = rb_type
 
 	def add_force(self, force: Vector2d) -> None:
-		self.result_force = self.result_force + force
+		self.result_force.iadd(force)
 
 	def add_impulse(self, impulse: Vector2d) -> None:
 		raise NotImplemented()
 
 	def subtract_force(self, force: Vector2d) -> None:
-		self.result_force = self.result_force - force
+		self.result_force.isubtract(force)
 
 	def clear_force(self) -> None:
-		self.result_force = Vector2d(0, 0)
+		self.result_force.set(0.0, 0.0)
 
 	def update_component(self, delta_time):
 		"""Updated object's data (position, velocity ...)"""
 
-		self.attached_obj.get_component(CT_TRANSFORM).position.add_scaled_vector(self.velocity, delta_time)
+		self.attached_obj.get_component(CT_TRANSFORM).move(self.velocity, delta_time)
 
-		acceleration = self.result_force.scale(self.inverted_mass)
-		self.velocity.add_scaled_vector(acceleration, delta_time)
+		# a = F / m, so the velocity changes on F * (dt / m)
+		self.velocity.iadd_scaled(self.result_force, delta_time * self.inverted_mass)
 
 		self.clear_force()
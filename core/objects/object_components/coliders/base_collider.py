@@ -1,9 +1,10 @@
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from core.math.geometry.geometry_objects import BaseShape
 from core.objects.entity import Entity
 from core.objects.object_components.base_component import BaseComponent
+from core.objects.object_components.transform import Transform
 
 if TYPE_CHECKING:
 	from core.objects.object_components.bodies.base_body import BaseBody
@@ -11,15 +12,36 @@ if TYPE_CHECKING:
 
 class BaseCollider(BaseComponent):
 
-	def __init__(self, name: str, component_type: str, body: BaseBody, attached_obj: Entity,
+	def __init__(self, name: str, component_type: str, body: "BaseBody", attached_obj: Optional[Entity],
 	             shape: BaseShape,
 	             is_approximated_shape: bool = False):
-		super(BaseCollider, self).__init__(name, component_type, attached_obj)
+		super(BaseCollider, self).__init__()
 
+		self.name = name
+		self.component_type = component_type
 		self.shape = shape
 		self.body = body
 		self.is_approximated_shape = is_approximated_shape
 
+		self.transform: Optional[Transform] = None
+		if attached_obj is not None:
+			self.bind_transform(attached_obj.get_component("Transform"))
+
+	def bind_transform(self, transform: Transform) -> None:
+		"""Places the shape by the transform and keeps it in sync with the transform"""
+
+		if self.transform is not None:
+			self.transform.unbind_event_callback(on_position_changed=self.on_transform_changed,
+			                                     on_rotation_changed=self.on_transform_changed)
+
+		self.transform = transform
+		transform.bind_event_callback(on_position_changed=self.on_transform_changed,
+		                              on_rotation_changed=self.on_transform_changed)
+		self.shape.set_pose(transform.position, transform.rotation)
+
+	def on_transform_changed(self, sender: Transform, event_args) -> None:
+		self.shape.set_pose(sender.position, sender.rotation)
+
 	def update_component(self):
 		if self.body:
 			return
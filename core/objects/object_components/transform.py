@@ -1,19 +1,66 @@
+from typing import Optional
+
 from core.math.vector2d import Vector2d
-from core.objects.properties.property import ConstrainedProperty
+from events.event_arguments import PropertyChangedEventArgs
 from .base_component import BaseComponent
 
 
 class Transform(BaseComponent):
-	"""Store position of an object"""
+	"""Store position and rotation (degrees) of an object
+
+	Position and rotation are kept by each transform, observers are bound to the transform
+	events, so they are notified only about changes of the transform they are bound to. Don't
+	change the position vector in place, use move or set a new vector, otherwise the observers
+	(e.g. colliders that place their shapes) won't be notified
 
-	rotation = ConstrainedProperty()
+	:Events:
+	    on_position_changed: occurs when the position is set or moved
+	    on_rotation_changed: occurs when the rotation is set or rotated
+	"""
 
-	def __init__(self, **kwargs):
+	__events__ = ["on_position_changed", "on_rotation_changed"]
+
+	def __init__(self, position: Optional[Vector2d] = None, rotation: float = 0.0, **kwargs):
 		super().__init__(**kwargs)
 
-	def move(self, direction: Vector2d) -> None:
-		self.position.add_vector(direction)
+		# The transform owns its vector, moving it in place mustn't change the caller's one
+		self._position = Vector2d(0, 0, exact=True) if position is None else Vector2d(position.x, position.y,
+		                                                                              exact=True)
+		self._rotation = float(rotation)
 
-	def rotate(self, angle: float) -> None:
-		self.rotation += angle
+	@property
+	def position(self) -> Vector2d:
+		return self._position
+
+	@position.setter
+	def position(self, position: Vector2d) -> None:
+		# Vector2d equality has tolerance, small moves shouldn't be lost
+		if position.x == self._position.x and position.y == self._position.y:
+			return
+
+		self._position = Vector2d(position.x, position.y, exact=True)
+		self.dispatch_event("on_position_changed", PropertyChangedEventArgs(self._position))
+
+	@property
+	def rotation(self) -> float:
+		return self._rotation
 
+	@rotation.setter
+	def rotation(self, rotation: float) -> None:
+		if type(rotation) not in (int, float):
+			raise ValueError("Rotation should be a number, got {}".format(type(rotation)))
+
+		if rotation == self._rotation:
+			return
+
+		self._rotation = float(rotation)
+		self.dispatch_event("on_rotation_changed", PropertyChangedEventArgs(self._rotation))
+
+	def move(self, direction: Vector2d, scalar: float = 1.0) -> None:
+		"""Moves the position in place on the scaled direction"""
+
+		self._position.iadd_scaled(direction, scalar)
+		self.dispatch_event("on_position_changed", PropertyChangedEventArgs(self._position))
+
+	def rotate(self, angle: float) -> None:
+		self.rotation = self._rotation + angle
@@ -1,3 +1,9 @@
+from functools import partial
+from typing import Callable, Dict, List
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.geometry.quadtree import QuadTree
+from core.math.vector2d import Vector2d
 from core.objects.entity import Entity
 from core.objects.object_components.layouts.canvas import Canvas
 from logger.loggers import LoggingSystem as Logger
@@ -14,11 +20,54 @@ class Scene(Entity):
 		"""
 		super(Scene, self).__init__(name, tag)
 
-		self.add_component(Canvas(width, height, "Scene"))
+		self.canvas = Canvas(width, height, "Scene")
+		self.add_component(self.canvas)
+		# Positions of the children, the scene size is the initial size of the tree, it grows if needed
+		self.spatial_index = QuadTree(AABB(0, 0, width, height))
+		self._move_callbacks: Dict[Entity, Callable] = {}
 		# TODO create camera
 
 		Logger.log_info("New scene has just been created")
 
+	@property
+	def children(self):
+		return self.canvas.children
+
+	def add_child(self, child: Entity) -> None:
+		self.canvas.add_child(child)
+
+		transform = child.get_component("Transform")
+		self.spatial_index.insert(child, transform.position)
+
+		# The child is bound to the callback, so the index doesn't depend on the sender of the event
+		callback = self._move_callbacks[child] = partial(self.on_child_moved, child)
+		transform.bind_event_callback(on_position_changed=callback)
+
+	def remove_child(self, child: Entity) -> None:
+		self.canvas.remove_child(child)
+
+		transform = child.get_component("Transform")
+		transform.unbind_event_callback(on_position_changed=self._move_callbacks.pop(child))
+		self.spatial_index.remove(child)
+
+	def on_child_moved(self, child: Entity, sender, event_args) -> None:
+		self.spatial_index.move(child, event_args.new_value)
+
+	def query_rect(self, aabb: AABB) -> List[Entity]:
+		"""Returns children which positions are inside the box"""
+
+		return self.spatial_index.query_rect(aabb)
+
+	def query_radius(self, center: Vector2d, radius: float) -> List[Entity]:
+		"""Returns children which positions are not further from the center than the radius"""
+
+		return self.spatial_index.query_radius(center, radius)
+
+	def k_nearest(self, point: Vector2d, k: int) -> List[Entity]:
+		"""Returns k children closest to the point, ordered by the distance"""
+
+		return self.spatial_index.k_nearest(point, k)
+
 	def __repr__(self):
 		res = "Scene:{}\n(".format(self.name)
 
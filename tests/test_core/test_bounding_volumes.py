@@ -0,0 +1,63 @@
+import math
+import unittest
+
+from core.math.geometry.bounding_volumes import AABB, BoundingCircle
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.geometry_objects import Circle, Ellipse, Rectangle, Triangle, Ray, Line, Segment
+from core.math.vector2d import Vector2d
+
+
+class TestBoundingVolumes(unittest.TestCase):
+
+	def test_shapes(self):
+		circle = Circle(Vector2d(1, 1), 2)
+		self.assertEqual(AABB(-1, -1, 3, 3), circle.aabb)
+
+		circle.set_pose(Vector2d(1, 0))
+		self.assertEqual(AABB(0, -1, 4, 3), circle.aabb)
+		self.assertEqual(Vector2d(2, 1), circle.bounding_circle.center)
+
+		ellipse = Ellipse(Vector2d(0, 0), 2, 1)
+		self.assertEqual(AABB(-2, -1, 2, 1), ellipse.aabb)
+
+		ellipse.set_pose(Vector2d(0, 0), 90)
+		aabb = ellipse.aabb
+		self.assertAlmostEqual(1, aabb.max_x)
+		self.assertAlmostEqual(2, aabb.max_y)
+		self.assertEqual(2, ellipse.bounding_circle.radius)
+
+		square = Rectangle(Vector2d(0, 2), 2, 2)
+		self.assertEqual(AABB(0, 0, 2, 2), square.aabb)
+		self.assertEqual(Vector2d(1, 1), square.bounding_circle.center)
+		self.assertAlmostEqual(math.sqrt(2), square.bounding_circle.radius)
+
+		square.set_pose(Vector2d(1, 1), 45)
+		self.assertAlmostEqual(1 - math.sqrt(2), square.aabb.min_x)
+		self.assertAlmostEqual(1 + 2 * math.sqrt(2), square.aabb.max_y)
+
+	def test_lines(self):
+		self.assertEqual(AABB(1, -1, 3, 2), Segment(Vector2d(3, -1), Vector2d(1, 2)).aabb)
+		self.assertEqual(AABB(1, -math.inf, math.inf, 2), Ray(Vector2d(1, 2), Vector2d(3, -1)).aabb)
+		self.assertEqual(AABB(1, -math.inf, 1, math.inf), Line(Vector2d(1, 2), Vector2d(1, -1)).aabb)
+
+		ray = Ray(Vector2d(0, 0), Vector2d(1, 1))
+		self.assertTrue(ray.bounding_circle.is_intersect(BoundingCircle(Vector2d(100, -100), 1)))
+
+	def test_prefilter(self):
+		square = Rectangle(Vector2d(0, 2), 2, 2)
+		far_triangle = Triangle([Vector2d(10, 0), Vector2d(12, 0), Vector2d(11, 2)])
+		corner_circle = Circle(Vector2d(2.6, 2.6), 0.7)
+		close_triangle = Triangle([Vector2d(1, 1), Vector2d(4, 1), Vector2d(4, 4)])
+
+		CollisionDetection.reset_stats()
+
+		self.assertFalse(CollisionDetection.is_intersect(square, far_triangle))
+		self.assertIsNone(CollisionDetection.get_intersection_data(far_triangle, square))
+		self.assertFalse(CollisionDetection.is_intersect(square, corner_circle))
+		self.assertTrue(CollisionDetection.is_intersect(square, close_triangle))
+
+		self.assertEqual({"aabb": 2, "bounding_circle": 1, "narrow_phase": 1}, CollisionDetection.stats)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,164 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.geometry.collision_detection.dynamic_aabb_tree import DynamicAABBTree
+from core.math.geometry.collision_detection.line_sweep_algorithm import SweepAndPrune
+from core.math.geometry.collision_detection.spatial_hash_grid import SpatialHashGrid
+from core.math.geometry.geometry_objects import Circle, Rectangle, Segment, Line, Ray
+from core.math.vector2d import Vector2d, POINTS_TOLERANCE
+
+
+def get_pair_keys(pairs):
+	return {frozenset((id(first), id(second))) for first, second in pairs}
+
+
+def get_brute_force_pairs(shapes):
+	return get_pair_keys((first, second) for i, first in enumerate(shapes) for second in shapes[i + 1:]
+	                     if first.aabb.is_intersect(second.aabb))
+
+
+def get_box_distance(aabb, point):
+	return math.hypot(max(aabb.min_x - point.x, point.x - aabb.max_x, 0),
+	                  max(aabb.min_y - point.y, point.y - aabb.max_y, 0))
+
+
+class TestSweepAndPrune(unittest.TestCase):
+	def test_pairs(self):
+		first = Circle(Vector2d(0, 0), 1)
+		second = Rectangle(Vector2d(0.5, 4), 1, 1)
+		segment = Segment(Vector2d(0.5, -2), Vector2d(0.5, 2))
+
+		broad_phase = SweepAndPrune()
+		for shape in (first, second, segment):
+			broad_phase.add(shape)
+
+		# The rectangle overlaps the others on x, but not on y
+		self.assertEqual(get_pair_keys([(first, segment)]), get_pair_keys(broad_phase.get_pairs()))
+
+		second.set_pose(Vector2d(0, -2.5))
+		broad_phase.update()
+		self.assertEqual(3, len(broad_phase.get_pairs()))
+
+		broad_phase.remove(segment)
+		self.assertRaises(AttributeError, broad_phase.remove, segment)
+
+		pairs, data = broad_phase.get_intersection_data()
+		self.assertEqual(get_pair_keys([(first, second)]), get_pair_keys(pairs))
+		self.assertTrue(data.is_intersect[0])
+
+	def test_moving(self):
+		random.seed(1)
+		circles = [Circle(Vector2d(0, 0), random.uniform(0.2, 1)) for _ in range(100)]
+		broad_phase = SweepAndPrune(axis=1)
+
+		for circle in circles:
+			circle.set_pose(Vector2d(random.uniform(0, 20), random.uniform(0, 20)))
+			broad_phase.add(circle)
+
+		for _ in range(10):
+			for circle in circles:
+				x, y, _ = circle.get_pose()
+				circle.set_pose(Vector2d(x + random.uniform(-0.5, 0.5), y + random.uniform(-0.5, 0.5)))
+
+			broad_phase.update()
+			self.assertEqual(get_brute_force_pairs(circles), get_pair_keys(broad_phase.get_pairs()))
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+	def test_pairs(self):
+		random.seed(2)
+		circles = [Circle(Vector2d(0, 0), 0.5) for _ in range(200)]
+
+		for circle in circles:
+			circle.set_pose(Vector2d(random.uniform(0, 20), random.uniform(0, 20)))
+
+		# Smaller cells than the objects are still correct
+		for cell_size in (None, 0.3, 5):
+			broad_phase = SpatialHashGrid(cell_size)
+			for circle in circles:
+				broad_phase.add(circle)
+
+			self.assertEqual(get_brute_force_pairs(circles), get_pair_keys(broad_phase.get_pairs()))
+
+		# The last object takes the place of the removed one
+		broad_phase.remove(circles[0])
+		self.assertRaises(AttributeError, broad_phase.remove, circles[0])
+		self.assertRaises(AttributeError, broad_phase.add, circles[1])
+		self.assertEqual(get_brute_force_pairs(circles[1:]), get_pair_keys(broad_phase.get_pairs()))
+		self.assertRaises(AttributeError, broad_phase.add, Line(Vector2d(0, 0), Vector2d(1, 1)))
+
+		# Distance is measured to the bounding boxes
+		center = Vector2d(10, 10)
+		expected = {id(circle) for circle in circles[1:] if get_box_distance(circle.aabb, center) <= 3}
+		self.assertEqual(expected, {id(circle) for circle in broad_phase.query_radius(center, 3)})
+
+	def test_rebuild(self):
+		random.seed(3)
+		centers = np.array([(random.uniform(0, 50), random.uniform(0, 50)) for _ in range(1000)])
+		bounds = np.hstack((centers - 0.25, centers + 0.25))
+
+		grid = SpatialHashGrid()
+		grid.rebuild(bounds)
+		self.assertEqual(1000, len(grid))
+
+		expected = {(i, j) for i in range(len(bounds)) for j in range(i + 1, len(bounds))
+		            if (np.abs(centers[i] - centers[j]) <= 0.5 + POINTS_TOLERANCE).all()}
+		self.assertEqual(expected, {tuple(pair) for pair in grid.get_index_pairs().tolist()})
+
+
+class TestDynamicAABBTree(unittest.TestCase):
+	def test_moving(self):
+		random.seed(4)
+		circles = [Circle(Vector2d(0, 0), random.uniform(0.1, 0.5)) for _ in range(200)]
+		level = Rectangle(Vector2d(10, -0.5), 20, 1)
+		broad_phase = DynamicAABBTree()
+		broad_phase.add(level)
+
+		for circle in circles:
+			circle.set_pose(Vector2d(random.uniform(0, 20), random.uniform(0, 20)))
+			broad_phase.add(circle)
+
+		self.assertRaises(AttributeError, broad_phase.add, level)
+		self.assertLess(broad_phase.get_height(), 20)
+
+		for _ in range(10):
+			for circle in circles:
+				x, y, _ = circle.get_pose()
+				circle.set_pose(Vector2d(x + random.uniform(-0.2, 0.2), y + random.uniform(-0.2, 0.2)))
+
+			broad_phase.update()
+			self.assertEqual(get_brute_force_pairs(circles + [level]), get_pair_keys(broad_phase.get_pairs()))
+
+		for circle in circles[:100]:
+			broad_phase.remove(circle)
+
+		self.assertRaises(AttributeError, broad_phase.remove, circles[0])
+		self.assertEqual(101, len(broad_phase))
+
+		box = AABB(5, 5, 10, 10)
+		self.assertEqual({id(circle) for circle in circles[100:] if circle.aabb.is_intersect(box)},
+		                 {id(circle) for circle in broad_phase.query(box)})
+
+	def test_ray(self):
+		first = Circle(Vector2d(0, 0), 1)
+		second = Rectangle(Vector2d(4, 0), 1, 1)
+		third = Circle(Vector2d(0, 3), 1)
+
+		broad_phase = DynamicAABBTree()
+		for shape in (third, second, first):
+			broad_phase.add(shape)
+
+		# Objects are ordered by the distance along the ray
+		self.assertEqual([first, second], broad_phase.query_ray(Ray(Vector2d(-3, 0), Vector2d(-2, 0))))
+		self.assertEqual([second], broad_phase.query_ray(Ray(Vector2d(3, 0), Vector2d(10, 0))))
+		self.assertEqual([first, second], broad_phase.query_ray(Line(Vector2d(3, 0), Vector2d(10, 0))))
+		self.assertEqual([first], broad_phase.query_ray(Segment(Vector2d(-3, 0), Vector2d(2, 0))))
+		self.assertEqual([first, third], broad_phase.query_ray(Segment(Vector2d(0, -2), Vector2d(0, 5))))
+
+
+if __name__ == '__main__':
+	unittest.main()
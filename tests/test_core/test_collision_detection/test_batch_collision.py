@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.geometry_objects import Circle, Segment, Rectangle, ConvexPolygon, Line
+from core.math.vector2d import Vector2d
+
+
+class TestBatchCollision(unittest.TestCase):
+	def test_circles(self):
+		circles = [Circle(Vector2d(0, 0), 1), Circle(Vector2d(1.5, 0), 1), Circle(Vector2d(5, 5), 1),
+		           Circle(Vector2d(0, 0), 0.5)]
+		pairs = np.array([(0, 1), (0, 2), (0, 3)])
+		data = CollisionDetection.get_batch_intersection_data(pairs, circles)
+
+		self.assertEqual([True, False, True], data.is_intersect.tolist())
+		self.assertEqual([0, 2], data.get_intersecting_indexes().tolist())
+		self.assertAlmostEqual(0.5, data.penetration_depths[0])
+		self.assertTrue(np.isnan(data.penetration_depths[1]))
+		self.assertEqual(Vector2d(1, 0), data.normals[0])
+		self.assertEqual(Vector2d(1, 0), data.first_points[0])
+		self.assertEqual(Vector2d(0.5, 0), data.second_points[0])
+
+		# Same centers
+		self.assertAlmostEqual(1.5, data.penetration_depths[2])
+		self.assertEqual(Vector2d(1, 0), data.normals[2])
+
+	def test_circle_polygon(self):
+		square = Rectangle(Vector2d(0, 2), 2, 2)
+		hexagon = ConvexPolygon([Vector2d(1, 0), Vector2d(2, 0), Vector2d(3, 1), Vector2d(2, 2), Vector2d(1, 2),
+		                         Vector2d(0, 1)])
+		circles = [Circle(Vector2d(3, 1), 1.5), Circle(Vector2d(1.5, 1.5), 0.25), Circle(Vector2d(-1, -1), 0.5)]
+		pairs = [(circles[0], square), (hexagon, circles[1]), (circles[2], hexagon)]
+		data = CollisionDetection.get_batch_intersection_data(pairs)
+
+		self.assertEqual([True, True, False], data.is_intersect.tolist())
+
+		# Center outside
+		self.assertAlmostEqual(0.5, data.penetration_depths[0])
+		self.assertEqual(Vector2d(-1, 0), data.normals[0])
+		self.assertEqual(Vector2d(2, 1), data.second_points[0])
+
+		# Center inside, the pair is reversed
+		self.assertAlmostEqual(0.75, data.penetration_depths[1])
+		self.assertEqual(Vector2d(0, 1), data.normals[1])
+		self.assertEqual(Vector2d(1.5, 2), data.first_points[1])
+
+		for i in range(2):
+			expected = CollisionDetection.get_intersection_data(*pairs[i])
+			# EPA stops with some tolerance
+			self.assertAlmostEqual(expected.penetration_depth, data.penetration_depths[i], places=3)
+
+	def test_segments(self):
+		segments = [Segment(Vector2d(0, 0), Vector2d(4, 0)), Segment(Vector2d(1, -1), Vector2d(1, 1)),
+		            Segment(Vector2d(0, 1), Vector2d(4, 1)), Segment(Vector2d(5, -1), Vector2d(5, 1))]
+		pairs = [(segments[0], segments[1]), (segments[0], segments[2]), (segments[0], segments[3])]
+		data = CollisionDetection.get_batch_intersection_data(pairs)
+
+		self.assertEqual([True, False, False], data.is_intersect.tolist())
+		self.assertEqual(Vector2d(1, 0), data.first_points[0])
+
+		expected = CollisionDetection.get_intersection_data(*pairs[0])
+		self.assertAlmostEqual(expected.penetration_depth, data.penetration_depths[0])
+		self.assertEqual(expected.intersection_points, [data.get_collision_data(0).intersection_points[0]])
+
+	def test_fallback(self):
+		# There is no batch function for the pair
+		pairs = [(Line(Vector2d(0, 0), Vector2d(1, 1)), Segment(Vector2d(0, 2), Vector2d(2, 0))),
+		         (Circle(Vector2d(0, 0), 1), Circle(Vector2d(1, 0), 1))]
+		data = CollisionDetection.get_batch_intersection_data(pairs)
+
+		self.assertEqual([True, True], data.is_intersect.tolist())
+		self.assertEqual(Vector2d(1, 1), data.first_points[0])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,93 @@
+import math
+import unittest
+
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.geometry_objects import Circle, ConcavePolygon, Ellipse, Rectangle
+from core.math.vector2d import Vector2d
+
+
+class TestEllipses(unittest.TestCase):
+	def test_ellipses(self):
+		first = Ellipse(Vector2d(0, 0), 3, 1)
+		second = Ellipse(Vector2d(4.5, 0), 2, 1)
+
+		data = CollisionDetection.get_intersection_data(first, second)
+		self.assertAlmostEqual(0.5, data.penetration_depth)
+		self.assertEqual(Vector2d(1, 0), data.normal)
+		self.assertEqual((Vector2d(3, 0), Vector2d(2.5, 0)), data.contact_points)
+
+		# The horizontal radius of the rotated ellipse is vertical
+		rotated = Ellipse(Vector2d(0, 0), 2, 1)
+		rotated.set_pose(Vector2d(0, 4), 90)
+		self.assertFalse(CollisionDetection.is_intersect(first, rotated))
+		self.assertAlmostEqual(1, CollisionDetection.get_distance_length(first, rotated))
+
+		circle = Circle(Vector2d(0, 1.5), 1)
+		data = CollisionDetection.get_intersection_data(circle, first)
+		self.assertAlmostEqual(0.5, data.penetration_depth)
+		self.assertEqual(Vector2d(0, -1), data.normal)
+		self.assertAlmostEqual(-0.5, CollisionDetection.get_distance_length(first, circle))
+
+	def test_circles(self):
+		first = Circle(Vector2d(0, 0), 1)
+		data = CollisionDetection.get_intersection_data(first, Circle(Vector2d(1.5, 0), 1))
+		self.assertAlmostEqual(0.5, data.penetration_depth)
+		self.assertEqual(Vector2d(1, 0), data.normal)
+		self.assertEqual((Vector2d(1, 0), Vector2d(0.5, 0)), data.contact_points)
+		self.assertEqual({(0.75, -0.6614), (0.75, 0.6614)},
+		                 {(round(point.x, 4), round(point.y, 4)) for point in data.intersection_points})
+
+		data = CollisionDetection.get_intersection_data(first, Circle(Vector2d(0, -3), 2))
+		self.assertEqual(0, data.penetration_depth)
+		self.assertEqual(Vector2d(0, -1), data.normal)
+		self.assertEqual([Vector2d(0, -1)], data.intersection_points)
+
+		# Concentric circles are pushed apart along x, the borders don't cross
+		data = CollisionDetection.get_intersection_data(first, Circle(Vector2d(0, 0), 0.5))
+		self.assertAlmostEqual(1.5, data.penetration_depth)
+		self.assertEqual(Vector2d(1, 0), data.normal)
+		self.assertEqual((Vector2d(1, 0), Vector2d(-0.5, 0)), data.contact_points)
+		self.assertEqual([], data.intersection_points)
+
+		self.assertIsNone(CollisionDetection.get_intersection_data(first, Circle(Vector2d(3, 0), 1)))
+
+	def test_ellipse_polygon(self):
+		ellipse = Ellipse(Vector2d(0, 0), 3, 1)
+		ellipse.set_pose(Vector2d(0, 0), 45)
+		square = Rectangle(Vector2d(2, 2.5), 1, 1)
+
+		data = CollisionDetection.get_intersection_data(ellipse, square)
+		self.assertIsNotNone(data)
+		self.assertEqual(Vector2d(2, 1.5), data.contact_points[1])
+		self.assertTrue(CollisionDetection.is_intersect(square, ellipse))
+
+		square.set_pose(Vector2d(1, 0))
+		self.assertFalse(CollisionDetection.is_intersect(ellipse, square))
+		self.assertIsNone(CollisionDetection.get_intersection_data(square, ellipse))
+
+		# The side touches the circle
+		circle = Circle(Vector2d(2.5, 0), 1)
+		self.assertAlmostEqual(0.5, CollisionDetection.get_distance_length(circle, Rectangle(Vector2d(4, 1), 1, 2)))
+
+	def test_ellipse_concave_polygon(self):
+		poly = ConcavePolygon([Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(2, 2), Vector2d(0, 4)])
+
+		# The circle is in the notch, inside the bounding box of the polygon
+		circle = Circle(Vector2d(2, 3.5), 0.5)
+		self.assertFalse(CollisionDetection.is_intersect(circle, poly))
+		self.assertIsNone(CollisionDetection.get_intersection_data(poly, circle))
+		self.assertAlmostEqual(1.5 / math.sqrt(2) - 0.5, CollisionDetection.get_distance_length(poly, circle))
+
+		circle = Circle(Vector2d(2, 2.5), 0.5)
+		data = CollisionDetection.get_intersection_data(circle, poly)
+		self.assertTrue(CollisionDetection.is_intersect(poly, circle))
+		self.assertAlmostEqual(0.5 - 0.5 / math.sqrt(2), data.penetration_depth)
+		self.assertEqual(Vector2d(-1, -1).normalize(), data.normal)
+		self.assertEqual(Vector2d(1, 1).normalize(), CollisionDetection.get_intersection_data(poly, circle).normal)
+
+		self.assertFalse(CollisionDetection.is_intersect(Ellipse(Vector2d(2, 3.5), 1, 0.3), poly))
+		self.assertTrue(CollisionDetection.is_intersect(poly, Ellipse(Vector2d(2, 2.8), 1.5, 0.3)))
+
+
+if __name__ == '__main__':
+	unittest.main()
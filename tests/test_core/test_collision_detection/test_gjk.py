@@ -0,0 +1,84 @@
+import unittest
+
+from core.math.geometry.collision_detection.epa import get_inter_data_convex_shapes
+from core.math.geometry.collision_detection.gjk import gjk, is_intersect_gjk
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.geometry_objects import Circle, Ellipse, Rectangle, Triangle, ConvexPolygon, ConcavePolygon
+from core.math.vector2d import Vector2d
+
+
+class TestGJK(unittest.TestCase):
+	square = Rectangle(Vector2d(0, 2), 2, 2)
+	triangle = Triangle([Vector2d(4, 0), Vector2d(6, 0), Vector2d(5, 2)])
+	circle = Circle(Vector2d(1, 5), 1)
+	ellipse = Ellipse(Vector2d(-4, 1), 2, 1)
+
+	def test_polygons(self):
+		result = gjk(self.square, self.triangle)
+
+		self.assertFalse(result.is_intersect)
+		self.assertAlmostEqual(2, result.distance)
+		self.assertEqual(Vector2d(2, 0), result.first_point)
+		self.assertEqual(Vector2d(4, 0), result.second_point)
+
+		overlapping = ConvexPolygon([Vector2d(1, 1), Vector2d(3, 1), Vector2d(3, 3)])
+		self.assertTrue(gjk(self.square, overlapping).is_intersect)
+		self.assertTrue(is_intersect_gjk(overlapping, self.square))
+		self.assertFalse(is_intersect_gjk(self.triangle, self.square))
+
+	def test_ellipses(self):
+		result = gjk(self.circle, self.square)
+
+		self.assertAlmostEqual(2, result.distance, delta=0.01)
+		self.assertEqual(Vector2d(1, 4), result.first_point)
+		self.assertEqual(Vector2d(1, 2), result.second_point)
+
+		self.assertAlmostEqual(2, gjk(self.ellipse, self.square).distance, delta=0.01)
+		self.assertTrue(is_intersect_gjk(Ellipse(Vector2d(3, 1), 1.5, 0.5), self.square))
+
+
+class TestEPA(unittest.TestCase):
+	square = Rectangle(Vector2d(0, 2), 2, 2)
+
+	def test_polygons(self):
+		data = get_inter_data_convex_shapes(self.square, Rectangle(Vector2d(1.5, 1.5), 2, 2))
+
+		self.assertAlmostEqual(0.5, data.penetration_depth)
+		self.assertEqual(Vector2d(1, 0), data.normal)
+		self.assertEqual(Vector2d(2, 0.75), data.contact_points[0])
+		self.assertEqual(Vector2d(1.5, 0.75), data.contact_points[1])
+
+		reversed_data = data.get_reversed()
+		self.assertEqual(Vector2d(-1, 0), reversed_data.normal)
+		self.assertEqual(Vector2d(1.5, 0.75), reversed_data.contact_points[0])
+
+		self.assertIsNone(get_inter_data_convex_shapes(self.square, Rectangle(Vector2d(3, 2), 1, 1)))
+
+	def test_intersection_points(self):
+		data = CollisionDetection.get_intersection_data(self.square, Rectangle(Vector2d(1.5, 1.5), 2, 2))
+		self.assertEqual([Vector2d(1.5, 0), Vector2d(2, 1.5)],
+		                 sorted(data.intersection_points, key=lambda point: point.x))
+		self.assertEqual(Vector2d(2, 0.75), data.contact_points[0])
+
+		# One polygon inside the other, the sides don't cross
+		data = CollisionDetection.get_intersection_data(self.square, Rectangle(Vector2d(0.5, 1.5), 1, 1))
+		self.assertEqual([], data.intersection_points)
+		self.assertAlmostEqual(1.5, data.penetration_depth)
+
+		concave = ConcavePolygon([Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(2, 2), Vector2d(0, 4)])
+		data = CollisionDetection.get_intersection_data(concave, Rectangle(Vector2d(3, 5), 2, 2))
+		self.assertEqual([Vector2d(3, 3), Vector2d(4, 3)],
+		                 sorted(data.intersection_points, key=lambda point: point.x))
+
+	def test_circles(self):
+		data = get_inter_data_convex_shapes(Circle(Vector2d(0, 0), 1), Circle(Vector2d(0, -1.5), 1))
+
+		self.assertAlmostEqual(0.5, data.penetration_depth, delta=0.01)
+		self.assertEqual(Vector2d(0, -1), data.normal)
+
+		data = get_inter_data_convex_shapes(Circle(Vector2d(1, 0.5), 1), self.square)
+		self.assertAlmostEqual(1.5, data.penetration_depth, delta=0.01)
+
+
+if __name__ == '__main__':
+	unittest.main()
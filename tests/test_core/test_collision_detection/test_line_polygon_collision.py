@@ -0,0 +1,57 @@
+import unittest
+
+from core.math.geometry.collision_detection.line_polygon.convex_polygon_clipping import \
+	clip_segment_convexpolygon, clip_ray_convexpolygon
+from core.math.geometry.collision_detection.line_polygon.probable_inter_sides import \
+	get_probable_intersect_sides_line, get_probable_intersect_sides_ray
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.geometry_objects import Segment, Line, Ray, Rectangle, ConvexPolygon
+from core.math.vector2d import Vector2d
+
+
+class TestLinePolygon(unittest.TestCase):
+	square = Rectangle(Vector2d(0, 2), 2, 2)
+	hexagon = ConvexPolygon([Vector2d(1, 0), Vector2d(2, 0), Vector2d(3, 1), Vector2d(2, 2), Vector2d(1, 2),
+	                         Vector2d(0, 1)])
+
+	def test_clipping(self):
+		result = clip_segment_convexpolygon(Segment(Vector2d(-1, 1), Vector2d(3, 1)), self.square)
+		self.assertAlmostEqual(0.25, result.entry_t)
+		self.assertAlmostEqual(0.75, result.exit_t)
+		self.assertEqual([Vector2d(0, 1), Vector2d(2, 1)], result.get_border_points())
+		self.assertAlmostEqual(1, result.penetration_depth)
+
+		# Starts inside, the start isn't on the border
+		result = clip_ray_convexpolygon(Ray(Vector2d(1.5, 1), Vector2d(2.5, 2)), self.hexagon)
+		self.assertFalse(result.is_entry_on_border)
+		self.assertEqual([Vector2d(2.25, 1.75)], result.get_border_points())
+
+		# Touches the vertex
+		result = clip_segment_convexpolygon(Segment(Vector2d(3, 0), Vector2d(3, 2)), self.hexagon)
+		self.assertEqual([Vector2d(3, 1)], result.get_border_points())
+
+		self.assertIsNone(clip_segment_convexpolygon(Segment(Vector2d(3, 3), Vector2d(5, 1)), self.square))
+		self.assertIsNone(clip_ray_convexpolygon(Ray(Vector2d(3, 1), Vector2d(4, 1)), self.square))
+
+	def test_posed_polygon(self):
+		square = Rectangle(Vector2d(0, 2), 2, 2)
+		square.set_pose(Vector2d(5, 0), 45)
+
+		data = CollisionDetection.get_intersection_data(Line(Vector2d(0, 1), Vector2d(1, 1)), square)
+		self.assertEqual([Vector2d(4, 1), Vector2d(6, 1)], sorted(data.intersection_points, key=lambda p: p.x))
+
+		self.assertTrue(CollisionDetection.is_intersect(square, Segment(Vector2d(5, 0.5), Vector2d(5, 1))))
+		self.assertFalse(CollisionDetection.is_intersect(square, Segment(Vector2d(3, 0), Vector2d(4, -1))))
+
+	def test_probable_sides(self):
+		# Goes through the vertex (2, 2), both sides with it are returned
+		sides = get_probable_intersect_sides_line(self.hexagon, Line(Vector2d(0, 0), Vector2d(1, 1)))
+		self.assertEqual(3, len(sides))
+
+		sides = get_probable_intersect_sides_ray(self.hexagon, Ray(Vector2d(1.5, 1), Vector2d(2.5, 2)))
+		self.assertEqual(1, len(sides))
+		self.assertEqual(Vector2d(3, 1), sides[0].first_point)
+
+
+if __name__ == '__main__':
+	unittest.main()
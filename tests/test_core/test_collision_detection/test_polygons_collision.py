@@ -1,8 +1,103 @@
 import unittest
 
+from core.math.geometry.collision_detection.polygons.minkowski_difference_of_polygons import \
+	polygons_difference, convex_polygons_difference
+from core.math.geometry.collision_detection.objects_collision_detection import CollisionDetection
+from core.math.geometry.collision_detection.separated_axis import is_intersect_convex_convex, \
+	find_separating_axis, _separating_axes
+from core.math.geometry.convex_hull import create_convex_hull
+from core.math.geometry.geometry_objects import ConvexPolygon, Rectangle, Triangle, ConcavePolygon
+from core.math.vector2d import Vector2d
+
 
 class TestConvexPolygons(unittest.TestCase):
-	raise NotImplemented()
+	square = Rectangle(Vector2d(0, 2), 2, 2)
+	triangle = Triangle([Vector2d(3, 0), Vector2d(5, 0), Vector2d(4, 2)])
+	hexagon = ConvexPolygon([Vector2d(1, 0), Vector2d(2, 0), Vector2d(3, 1), Vector2d(2, 2), Vector2d(1, 2),
+	                         Vector2d(0, 1)])
+
+	def test_minkowski_difference(self):
+		for first, second in ((self.square, self.triangle), (self.triangle, self.hexagon),
+		                      (self.hexagon, self.square), (self.square, self.square)):
+			difference = convex_polygons_difference(first, second)
+			hull = create_convex_hull(polygons_difference(first.points, second.points))
+
+			self.assertEqual(hull.points_count, difference.points_count)
+			self.assertAlmostEqual(hull.get_area(), difference.get_area())
+
+			for point in hull.points:
+				self.assertIn(point, difference.points)
+
+
+	def test_separated_axis(self):
+		self.assertIsNone(find_separating_axis(self.square, self.hexagon))
+		self.assertEqual([-1, 0], find_separating_axis(self.square, self.triangle).tolist())
+
+		self.assertTrue(is_intersect_convex_convex(self.square, self.hexagon, "first pair"))
+		self.assertNotIn("first pair", _separating_axes)
+
+		self.assertFalse(is_intersect_convex_convex(self.square, self.triangle, "second pair"))
+		self.assertEqual([-1, 0], _separating_axes["second pair"].tolist())
+
+		# The cached axis doesn't separate the polygons anymore
+		self.square.set_pose(Vector2d(2.5, 0))
+		self.assertTrue(is_intersect_convex_convex(self.square, self.triangle, "second pair"))
+		self.assertNotIn("second pair", _separating_axes)
+		self.square.set_pose(Vector2d(0, 0))
+
+	def test_dispatch(self):
+		self.assertFalse(CollisionDetection.is_intersect(self.square, self.triangle))
+		self.assertTrue(CollisionDetection.is_intersect(self.hexagon, self.square))
+		self.assertAlmostEqual(1, CollisionDetection.get_distance_length(self.triangle, self.square))
+
+		shifted_square = Rectangle(Vector2d(1.5, 2), 2, 2)
+		data = CollisionDetection.get_intersection_data(self.square, shifted_square)
+		reversed_data = CollisionDetection.get_intersection_data(shifted_square, self.square)
+		self.assertAlmostEqual(0.5, data.penetration_depth)
+		self.assertEqual(Vector2d(1, 0), data.normal)
+		self.assertEqual(Vector2d(-1, 0), reversed_data.normal)
+
+		# Subclass of a registered type uses the function of the base class
+		class Square(Rectangle):
+			pass
+
+		self.assertFalse(CollisionDetection.is_intersect(Square(Vector2d(10, 10), 1, 1), self.triangle))
+
+		with self.assertRaises(TypeError):
+			CollisionDetection.is_intersect(self.square, object())
+
+
+class TestConcavePolygons(unittest.TestCase):
+	# U shape with the hole from x=1 to x=3
+	cup = ConcavePolygon([Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(3, 4), Vector2d(3, 1),
+	                      Vector2d(1, 1), Vector2d(1, 4), Vector2d(0, 4)])
+
+	def test_convex_parts(self):
+		self.assertEqual(3, len(self.cup.convex_parts))
+
+		# Box of the polygon contains the rectangle, but boxes of the parts don't
+		inside_hole = Rectangle(Vector2d(1.5, 3), 1, 1)
+		self.assertEqual([], self.cup.parts_tree.query(inside_hole.aabb))
+
+		self.assertFalse(CollisionDetection.is_intersect(self.cup, inside_hole))
+		self.assertIsNone(CollisionDetection.get_intersection_data(inside_hole, self.cup))
+		self.assertAlmostEqual(0.5, CollisionDetection.get_distance_length(inside_hole, self.cup))
+
+		on_wall = Rectangle(Vector2d(3.5, 5), 1, 2)
+		self.assertTrue(CollisionDetection.is_intersect(on_wall, self.cup))
+		self.assertAlmostEqual(0.5, CollisionDetection.get_intersection_data(self.cup, on_wall).penetration_depth)
+
+	def test_concave_concave(self):
+		# Upside down cup which left wall goes into the hole of the first one
+		other_cup = ConcavePolygon([Vector2d(x + 1.5, 5.5 - y) for x, y in
+		                            ((0, 0), (4, 0), (4, 4), (3, 4), (3, 1), (1, 1), (1, 4), (0, 4))])
+		self.assertFalse(CollisionDetection.is_intersect(self.cup, other_cup))
+		self.assertAlmostEqual(0.5, CollisionDetection.get_distance_length(other_cup, self.cup))
+
+		other_cup.set_pose(Vector2d(0, -1))
+		self.assertTrue(CollisionDetection.is_intersect(self.cup, other_cup))
+		self.assertAlmostEqual(0.5, CollisionDetection.get_intersection_data(self.cup, other_cup).penetration_depth)
+		other_cup.set_pose(Vector2d(0, 0))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from core.math.geometry.convex_hull import create_convex_hull, get_convex_hull_indexes, \
+	get_convex_hulls_indexes
+from core.math.vector2d import Vector2d
+
+
+class TestConvexHull(unittest.TestCase):
+	points = [
+		Vector2d(0, 0),
+		Vector2d(1, 1),
+		Vector2d(2, 0),
+		Vector2d(1, 0),
+		Vector2d(2, 2),
+		Vector2d(0, 2),
+		Vector2d(1, 2),
+		Vector2d(0, 0)
+	]
+
+	def test_hull_indexes(self):
+		self.assertEqual([0, 2, 4, 5], get_convex_hull_indexes(self.points))
+
+		coordinates = np.array([(p.x, p.y) for p in self.points])
+		self.assertEqual([0, 2, 4, 5], get_convex_hull_indexes(coordinates))
+
+	def test_create_convex_hull(self):
+		hull = create_convex_hull(self.points)
+
+		self.assertEqual([Vector2d(0, 0), Vector2d(2, 0), Vector2d(2, 2), Vector2d(0, 2)], hull.points)
+		self.assertEqual(4, hull.get_area())
+
+		with self.assertRaises(AttributeError):
+			create_convex_hull([Vector2d(0, 0), Vector2d(1, 1), Vector2d(2, 2)])
+
+	def test_degenerate(self):
+		self.assertEqual([], get_convex_hull_indexes([]))
+		self.assertEqual([0], get_convex_hull_indexes([Vector2d(1, 1), Vector2d(1, 1)]))
+		self.assertEqual([2, 1], get_convex_hull_indexes([Vector2d(1, 1), Vector2d(3, 3), Vector2d(0, 0)]))
+		self.assertEqual([0, 1], get_convex_hull_indexes(np.array([(0, 5), (0, 7), (0, 6)])))
+
+	def test_batch(self):
+		point_sets = [self.points, np.array([(0, 0), (4, 0), (1, 1), (0, 4)]), []]
+
+		self.assertEqual([get_convex_hull_indexes(points) for points in point_sets],
+		                 get_convex_hulls_indexes(point_sets))
+
+
+if __name__ == '__main__':
+	unittest.main()
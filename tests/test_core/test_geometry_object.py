@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from core.math.geometry.geometry_objects import *
 
 
@@ -112,6 +114,27 @@ class TestGeometryObjects(unittest.TestCase):
 		self.assertNotEqual(Vector2d(1, -6), self.line.get_closest_point(Vector2d(1, -6.5)),
 		                    "Should not be second point")
 
+	def test_cached_values(self):
+		segment = Segment(Vector2d(0, 0), Vector2d(2, 2))
+
+		self.assertIs(segment.get_vector(), segment.get_vector())
+		self.assertEqual(1, segment.get_slope())
+		self.assertEqual(0, segment.get_y_intercept())
+		self.assertTrue(segment.is_point_belongs(Vector2d(1, 1)))
+
+		segment.second_point = Vector2d(2, 4)
+
+		self.assertEqual(Vector2d(2, 4), segment.get_vector())
+		self.assertEqual(2, segment.get_slope())
+		self.assertFalse(segment.is_point_belongs(Vector2d(1, 1)))
+		self.assertTrue(segment.is_point_belongs(Vector2d(1.5, 3)))
+
+		segment.first_point.y = 2
+		segment.invalidate_cache()
+
+		self.assertEqual(1, segment.get_slope())
+		self.assertEqual(2, segment.get_y_intercept())
+
 	circle = Circle(Vector2d(-10, -2), 6)
 
 	def test_circle(self):
@@ -131,7 +154,10 @@ class TestGeometryObjects(unittest.TestCase):
 		self.assertTrue(self.ellipse.is_point_belongs(Vector2d(-3.17, 2)), "Should belongs")
 		self.assertTrue(self.ellipse.is_point_belongs(Vector2d(-7.7, 3.6)), "Should belongs")
 		self.assertTrue(self.ellipse.is_point_belongs(Vector2d(-6.87, 3.34)), "Should belongs")
-		self.assertFalse(self.ellipse.is_point_belongs(Vector2d(-4.47, 0.23)), "Should not belongs")
+		self.assertFalse(self.ellipse.is_point_belongs(Vector2d(-6, 6.2)), "Should not belongs")
+
+		self.assertEqual(Vector2d(-0.34, 2), self.ellipse.get_closest_point(Vector2d(1, 2)))
+		self.assertAlmostEqual(-1, self.ellipse.get_distance_to_point(Vector2d(-6, 5)))
 
 	points_convex_poly = [
 		Vector2d(-7.29, 2),
@@ -164,6 +190,74 @@ class TestGeometryObjects(unittest.TestCase):
 
 	# concave_poly = ConcavePolygon(points_concave_poly)
 
+	def test_polygon_lazy_values(self):
+		square = ConvexPolygon([Vector2d(0, 0), Vector2d(2, 0), Vector2d(2, 2), Vector2d(0, 2)])
+
+		self.assertIsNone(square._sides)
+		self.assertIsNone(square._centroid)
+
+		self.assertEqual(Vector2d(1, 1), square.centroid)
+		self.assertIs(square.sides, square.sides)
+		self.assertEqual(4, square.sides_count)
+		self.assertEqual(2, len(square.triangles))
+		self.assertEqual(Segment(Vector2d(1, 1), Vector2d(0, 0)).get_vector(), square.diagonals[0].get_vector())
+
+		square.points[2].x = 4
+		square.points[2].y = 4
+		square.invalidate_cache()
+
+		self.assertEqual(4, square.get_width())
+
+	def test_pose(self):
+		local_points = [Vector2d(0, 0), Vector2d(2, 0), Vector2d(0, 2)]
+		triangle = ConvexPolygon(local_points)
+
+		self.assertIs(local_points, triangle.points)
+
+		triangle.set_pose(Vector2d(1, 1), 90)
+
+		self.assertEqual([Vector2d(1, 1), Vector2d(1, 3), Vector2d(-1, 1)], triangle.points)
+		self.assertEqual(Vector2d(1, 3), triangle.sides[0].second_point)
+		self.assertEqual([Vector2d(0, 0), Vector2d(2, 0), Vector2d(0, 2)], triangle.local_points)
+
+		circle = Circle(Vector2d(1, 0), 1)
+		circle.set_pose(Vector2d(-1, 0), 180)
+
+		self.assertEqual(Vector2d(-2, 0), circle.center)
+		self.assertTrue(circle.is_point_belongs(Vector2d(-2.5, 0)))
+
+	def test_polygon_vertices(self):
+		square = ConvexPolygon(np.array([(0, 0), (2, 0), (2, 2), (0, 2)]))
+
+		self.assertEqual(Vector2d(2, 2), square.points[2])
+		self.assertEqual([[1, 2], [3, 0]], square.edges[1::2].tolist())
+		self.assertEqual(4, square.get_area())
+		self.assertEqual(Vector2d(1, 1), square.get_centroid())
+		self.assertIs(square.points[1], square.get_support_point(Vector2d(1, -1)))
+		self.assertEqual(Vector2d(0, 0), square.the_most_distant_points[2])
+
+		clockwise_square = ConvexPolygon(square.vertices[::-1])
+		self.assertEqual(4, clockwise_square.get_area())
+		self.assertEqual(Vector2d(1, 1), clockwise_square.get_centroid())
+
+		self.assertFalse(ConvexPolygon(self.points_convex_poly).is_concave())
+		with self.assertRaises(AttributeError):
+			ConvexPolygon(np.array([(p.x, p.y) for p in self.points_concave_poly]))
+
+	def test_support_point(self):
+		poly = ConvexPolygon(self.points_convex_poly)
+		square = Rectangle(Vector2d(-5, -1), 2, 2)
+
+		# All the dot products are negative
+		self.assertEqual(Vector2d(-3.44, 1.98), poly.get_support_point(Vector2d(1, 0)))
+		self.assertEqual(Vector2d(-7.29, 2), poly.get_support_point(Vector2d(-1, -1), start_index=3))
+		self.assertEqual(Vector2d(-3, -1), square.get_support_point(Vector2d(1, 1)))
+
+		octagon = ConvexPolygon([Vector2d(math.cos(i * PI / 4), math.sin(i * PI / 4)) for i in range(8)])
+		for i in range(8):
+			direction = Vector2d(math.cos(i * PI / 4), math.sin(i * PI / 4))
+			self.assertEqual(i, octagon.get_support_index(direction))
+
 	def test_convex_poly(self):
 		with self.assertRaises(AttributeError):
 			self_inter_poly = ConcavePolygon(self.points_self_inter_poly)
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from core.math.geometry.geometry_objects import ConcavePolygon, ConvexPolygon, Rectangle
+from core.math.geometry.point_in_polygon import is_points_inside_polygon, is_points_inside_convex_polygon
+from core.math.vector2d import Vector2d
+
+
+class TestPointInPolygon(unittest.TestCase):
+	cup = ConcavePolygon([Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(3, 4), Vector2d(3, 1),
+	                      Vector2d(1, 1), Vector2d(1, 4), Vector2d(0, 4)])
+	hexagon = ConvexPolygon([Vector2d(1, 0), Vector2d(2, 0), Vector2d(3, 1), Vector2d(2, 2), Vector2d(1, 2),
+	                         Vector2d(0, 1)])
+
+	def test_crossing_test(self):
+		points = np.array([(0.5, 3), (2, 3), (2, 0.5), (3, 2), (1, 1), (5, 1), (3.5, 4.005), (0, 1)])
+
+		self.assertEqual([True, False, True, True, True, False, True, True],
+		                 is_points_inside_polygon(self.cup.vertices, points).tolist())
+		self.assertEqual([False, True], self.cup.is_points_belong([Vector2d(2, 2), Vector2d(3.5, 2)]).tolist())
+		self.assertTrue(self.cup.is_point_belongs(Vector2d(4, 4)))
+
+	def test_wedge_test(self):
+		points = np.random.RandomState(0).uniform(-1, 4, (500, 2))
+		vertices = self.hexagon.vertices
+
+		self.assertEqual(is_points_inside_polygon(vertices, points).tolist(),
+		                 is_points_inside_convex_polygon(vertices, points).tolist())
+
+		square = Rectangle(Vector2d(0, 2), 2, 2)
+		square.set_pose(Vector2d(1, 1), 45)
+		self.assertEqual([True, True, False],
+		                 square.is_points_belong([Vector2d(1, 2), Vector2d(1, 1), Vector2d(2, 1)]).tolist())
+
+
+if __name__ == '__main__':
+	unittest.main()
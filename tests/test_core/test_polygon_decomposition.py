@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from core.math.geometry.geometry_objects import ConcavePolygon
+from core.math.geometry.polygon_decomposition import get_ear_clipping_triangles, get_convex_parts_indexes
+from core.math.vector2d import Vector2d
+
+
+class TestPolygonDecomposition(unittest.TestCase):
+	# Three teeth that look up
+	comb = [(0, 0), (7, 0), (7, 3), (6, 3), (6, 1), (4, 1), (4, 3), (3, 3), (3, 1), (1, 1), (1, 3), (0, 3)]
+
+	def test_ear_clipping(self):
+		for points in (self.comb, self.comb[::-1]):
+			triangles = get_ear_clipping_triangles(np.array(points, dtype=np.float64))
+			area = 0
+
+			for a, b, c in triangles:
+				(ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+				cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+				self.assertGreater(cross, 0, "Triangles should be counterclockwise")
+				area += cross / 2
+
+			self.assertEqual(13, area)
+
+	def test_convex_parts(self):
+		parts = get_convex_parts_indexes(np.array(self.comb, dtype=np.float64))
+
+		# The teeth and the base, the base can be split by the teeth corners
+		self.assertLessEqual(len(parts), 6)
+		self.assertEqual(sorted(range(len(self.comb))), sorted({i for part in parts for i in part}))
+
+		comb = ConcavePolygon([Vector2d(x, y) for x, y in self.comb])
+		self.assertAlmostEqual(comb.get_area(), sum(part.get_area() for part in comb.convex_parts))
+
+		comb.set_pose(Vector2d(10, 0), 90)
+		self.assertEqual((10, 0, 90), comb.convex_parts[0].get_pose())
+
+		aabb = comb.parts_tree.root.aabb
+		self.assertAlmostEqual(7, aabb.min_x)
+		self.assertAlmostEqual(7, aabb.max_y)
+
+		with self.assertRaises(AttributeError):
+			ConcavePolygon([Vector2d(0, 0), Vector2d(4, 4), Vector2d(4, 0), Vector2d(0, 4), Vector2d(2, 1)])
+
+
+if __name__ == '__main__':
+	unittest.main()
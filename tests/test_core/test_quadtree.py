@@ -0,0 +1,77 @@
+import math
+import random
+import unittest
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.geometry.quadtree import QuadTree
+from core.math.vector2d import Vector2d
+
+
+class Item:
+	pass
+
+
+def get_keys(items):
+	return {id(item) for item in items}
+
+
+class TestQuadTree(unittest.TestCase):
+	def test_queries(self):
+		random.seed(5)
+		tree = QuadTree(AABB(0, 0, 10, 10), capacity=4)
+		positions = {}
+
+		for _ in range(300):
+			item = Item()
+			# Some positions are outside, the tree grows
+			positions[item] = (random.uniform(-10, 20), random.uniform(-10, 20))
+			tree.insert(item, Vector2d(*positions[item], exact=True))
+
+		self.assertRaises(AttributeError, tree.insert, item, Vector2d(0, 0))
+
+		for _ in range(5):
+			for item in list(positions)[:50]:
+				tree.remove(item)
+				del positions[item]
+
+			for item, (x, y) in positions.items():
+				positions[item] = (x + random.uniform(-1, 1), y + random.uniform(-1, 1))
+				tree.move(item, Vector2d(*positions[item], exact=True))
+
+			self.assertEqual(len(positions), len(tree))
+
+			center = Vector2d(random.uniform(0, 10), random.uniform(0, 10), exact=True)
+			self.assertEqual(get_keys(item for item, (x, y) in positions.items()
+			                          if math.hypot(x - center.x, y - center.y) <= 4),
+			                 get_keys(tree.query_radius(center, 4)))
+
+			box = AABB(center.x - 3, center.y - 1, center.x + 2, center.y + 5)
+			self.assertEqual(get_keys(item for item, (x, y) in positions.items()
+			                          if box.min_x <= x <= box.max_x and box.min_y <= y <= box.max_y),
+			                 get_keys(tree.query_rect(box)))
+
+			nearest = sorted(positions, key=lambda item: math.hypot(positions[item][0] - center.x,
+			                                                        positions[item][1] - center.y))
+			self.assertEqual([id(item) for item in nearest[:5]], [id(item) for item in tree.k_nearest(center, 5)])
+
+		self.assertRaises(AttributeError, tree.remove, Item())
+
+	def test_same_positions(self):
+		tree = QuadTree(AABB(0, 0, 1, 1), capacity=2)
+		items = [Item() for _ in range(20)]
+
+		for item in items:
+			tree.insert(item, Vector2d(0.5, 0.5))
+
+		self.assertEqual(get_keys(items), get_keys(tree.k_nearest(Vector2d(0, 0), 30)))
+		self.assertEqual(Vector2d(0.5, 0.5), tree.get_position(items[0]))
+
+		for item in items:
+			tree.remove(item)
+
+		self.assertTrue(tree.root.is_leaf())
+		self.assertRaises(AttributeError, QuadTree, AABB(0, 0, 0, 1))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,59 @@
+import math
+import random
+import unittest
+
+from core.math.geometry.bounding_volumes import AABB
+from core.math.vector2d import Vector2d
+from core.objects.entity import Entity
+from core.objects.scene import Scene
+
+
+def get_position(entity):
+	return entity.get_component("Transform").position
+
+
+class TestScene(unittest.TestCase):
+	def test_queries(self):
+		random.seed(7)
+		scene = Scene(20, 20, "Scene")
+		entities = [Entity("Entity{}".format(i), "Test") for i in range(50)]
+
+		for entity in entities:
+			entity.get_component("Transform").position = Vector2d(random.uniform(0, 20), random.uniform(0, 20),
+			                                                      exact=True)
+			scene.add_child(entity)
+
+		self.assertEqual(set(entities), scene.children)
+
+		for step in range(5):
+			for i, entity in enumerate(entities):
+				transform = entity.get_component("Transform")
+
+				# Both ways of changing the position update the index
+				if i % 2:
+					transform.move(Vector2d(random.uniform(-3, 3), random.uniform(-3, 3), exact=True))
+				else:
+					transform.position = Vector2d(random.uniform(-5, 25), random.uniform(-5, 25), exact=True)
+
+			center = Vector2d(random.uniform(0, 20), random.uniform(0, 20), exact=True)
+			distances = {entity: math.hypot(get_position(entity).x - center.x, get_position(entity).y - center.y)
+			             for entity in entities}
+
+			self.assertEqual({entity for entity in entities if distances[entity] <= 6},
+			                 set(scene.query_radius(center, 6)))
+
+			box = AABB(center.x - 5, center.y - 3, center.x + 4, center.y + 6)
+			self.assertEqual({entity for entity in entities if box.min_x <= get_position(entity).x <= box.max_x and
+			                  box.min_y <= get_position(entity).y <= box.max_y}, set(scene.query_rect(box)))
+
+			self.assertEqual(sorted(entities, key=distances.get)[:4], scene.k_nearest(center, 4))
+
+		removed = entities[0]
+		scene.remove_child(removed)
+		removed.get_component("Transform").position = get_position(entities[1]).copy()
+		self.assertEqual([entities[1]], scene.k_nearest(get_position(entities[1]), 1))
+		self.assertNotIn(removed, scene.query_radius(get_position(entities[1]), 1))
+
+
+if __name__ == '__main__':
+	unittest.main()
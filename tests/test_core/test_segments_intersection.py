@@ -0,0 +1,62 @@
+import itertools
+import random
+import unittest
+
+from core.math.geometry.geometry_objects import ConcavePolygon, Segment
+from core.math.geometry.segments_intersection import get_segments_intersections, iterate_segments_intersections
+from core.math.vector2d import Vector2d
+
+
+def get_orientation(a, b, c):
+	return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def is_on_segment(a, b, c):
+	return min(a[0], b[0]) <= c[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= c[1] <= max(a[1], b[1])
+
+
+def is_segments_intersect(first, second):
+	(a, b), (c, d) = first, second
+	orientations = (get_orientation(a, b, c), get_orientation(a, b, d), get_orientation(c, d, a),
+	                get_orientation(c, d, b))
+
+	if orientations[0] * orientations[1] < 0 and orientations[2] * orientations[3] < 0:
+		return True
+
+	return any(orientation == 0 and is_on_segment(*segment, point) for orientation, segment, point in
+	           zip(orientations, (first, first, second, second), (c, d, a, b)))
+
+
+class TestSegmentsIntersection(unittest.TestCase):
+	def test_segments(self):
+		segments = [Segment(Vector2d(0, 0), Vector2d(4, 4)), Segment(Vector2d(0, 4), Vector2d(4, 0)),
+		            Segment(Vector2d(2, -1), Vector2d(2, 5)), Segment(Vector2d(5, 0), Vector2d(6, 1))]
+
+		intersections = get_segments_intersections(segments)
+		self.assertEqual({(0, 1), (0, 2), (1, 2)}, {(i, j) for i, j, _ in intersections})
+		self.assertTrue(all(point == Vector2d(2, 2) for _, _, point in intersections))
+
+	def test_degenerate(self):
+		# Integer ends give vertical, collinear and touching segments
+		random.seed(6)
+
+		for _ in range(100):
+			segments = [((random.randint(0, 5), random.randint(0, 5)), (random.randint(0, 5), random.randint(0, 5)))
+			            for _ in range(random.randint(2, 20))]
+			expected = {(i, j) for i, j in itertools.combinations(range(len(segments)), 2)
+			            if is_segments_intersect(segments[i], segments[j])}
+
+			pairs = [(i, j) for i, j, _ in iterate_segments_intersections(segments)]
+			self.assertEqual(len(pairs), len(set(pairs)))
+			self.assertEqual(expected, set(pairs))
+
+	def test_polygon(self):
+		# The side from (2, 2) ends on the first side at (2, 0)
+		self.assertRaises(AttributeError, ConcavePolygon,
+		                  [Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(2, 2), Vector2d(2, 0)])
+
+		ConcavePolygon([Vector2d(0, 0), Vector2d(4, 0), Vector2d(4, 4), Vector2d(2, 2), Vector2d(0, 4)])
+
+
+if __name__ == '__main__':
+	unittest.main()
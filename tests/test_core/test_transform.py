@@ -0,0 +1,56 @@
+import unittest
+
+from core.math.geometry.geometry_objects import Circle, Rectangle
+from core.math.vector2d import Vector2d
+from core.objects.object_components.coliders.base_collider import BaseCollider
+from core.objects.object_components.transform import Transform
+
+
+class TestTransform(unittest.TestCase):
+	def test_colliders(self):
+		first = Transform()
+		second = Transform(position=Vector2d(5, 5))
+		self.assertEqual(Vector2d(0, 0), first.position)
+		self.assertEqual(Vector2d(5, 5), second.position)
+
+		first_collider = BaseCollider("First", "Collider", None, None, Circle(Vector2d(0, 0), 1))
+		second_collider = BaseCollider("Second", "Collider", None, None, Rectangle(Vector2d(0, 1), 1, 1))
+		first_collider.bind_transform(first)
+		second_collider.bind_transform(second)
+		self.assertEqual((5, 5, 0), second_collider.shape.get_pose())
+
+		first.move(Vector2d(1, 0), 2)
+		self.assertEqual((2, 0, 0), first_collider.shape.get_pose())
+		self.assertEqual((5, 5, 0), second_collider.shape.get_pose())
+
+		second.position = Vector2d(7, 6)
+		second.rotate(30)
+		self.assertEqual((2, 0, 0), first_collider.shape.get_pose())
+		self.assertEqual((7, 6, 30), second_collider.shape.get_pose())
+		self.assertEqual(Vector2d(2, 0), first.position)
+
+		# The collider stops following the old transform
+		second_collider.bind_transform(first)
+		second.move(Vector2d(1, 1))
+		self.assertEqual((2, 0, 0), second_collider.shape.get_pose())
+
+		with self.assertRaises(ValueError):
+			first.rotation = "90"
+
+	def test_own_position(self):
+		spawn = Vector2d(1, 1)
+		first = Transform(spawn)
+		second = Transform(spawn)
+		first.move(Vector2d(5, 0))
+		self.assertEqual(Vector2d(6, 1), first.position)
+		self.assertEqual(Vector2d(1, 1), second.position)
+		self.assertEqual(Vector2d(1, 1), spawn)
+
+		second.position = spawn
+		second.move(Vector2d(0, 2))
+		self.assertEqual(Vector2d(1, 3), second.position)
+		self.assertEqual(Vector2d(1, 1), spawn)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from core.math.vector2d import Vector2d
+from core.math.vector2d_array import Vector2dArray
+
+
+class TestVector2dArray(unittest.TestCase):
+    vectors = [Vector2d(1, 1), Vector2d(2.5, 3.5), Vector2d(-4, 6), Vector2d(0, 0)]
+    other_vectors = [Vector2d(1, 0), Vector2d(-1, 2), Vector2d(3, 3), Vector2d(0, 1)]
+
+    array = Vector2dArray.from_vectors(vectors)
+    other_array = Vector2dArray.from_vectors(other_vectors)
+
+    def assert_matches(self, result: Vector2dArray, expected):
+        self.assertEqual(len(result), len(expected))
+        self.assertTrue(np.all(result == Vector2dArray.from_vectors(expected)))
+
+    def test_construction(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertEqual(self.array[1], Vector2d(2.5, 3.5))
+        self.assertEqual(self.array.to_vectors(), self.vectors)
+        self.assertEqual(self.array[1:3].to_vectors(), self.vectors[1:3])
+        self.assertTrue(self.array.x.flags["C_CONTIGUOUS"])
+
+        with self.assertRaises(AttributeError):
+            Vector2dArray([1, 2], [1])
+
+    def test_mirrors_vector2d(self):
+        pairs = list(zip(self.vectors, self.other_vectors))
+
+        np.testing.assert_allclose(self.array.dot_product(self.other_array),
+                                   [a.dot_product(b) for a, b in pairs])
+        np.testing.assert_allclose(self.array.cross(self.other_array), [a.cross(b) for a, b in pairs])
+        np.testing.assert_allclose(self.array.get_magnitude(), [a.get_magnitude() for a in self.vectors])
+
+        self.assert_matches(self.array.normalize(), [a.normalize() for a in self.vectors])
+        self.assert_matches(self.array.project_on(self.other_array), [a.project_on(b) for a, b in pairs])
+        self.assert_matches(self.array.get_perpendicular_vector(),
+                            [a.get_perpendicular_vector() for a in self.vectors])
+        self.assert_matches(self.array.add_scaled_vector(self.other_array, -3.25),
+                            [a.add_scaled_vector(b, -3.25) for a, b in pairs])
+        self.assert_matches(self.array - self.other_array, [a - b for a, b in pairs])
+
+    def test_broadcast_single_vector(self):
+        vector = Vector2d(2, -1)
+
+        np.testing.assert_allclose(self.array.dot_product(vector), [a.dot_product(vector) for a in self.vectors])
+        self.assert_matches(self.array + vector, [a + vector for a in self.vectors])
+
+    def test_comparison(self):
+        shifted = self.array.add_vector(Vector2d(0.005, -0.005))
+        self.assertTrue(np.all(shifted == self.array))
+
+        shifted = self.array.add_vector(Vector2d(0.05, 0))
+        self.assertFalse(np.any(shifted == self.array))
+
+    def test_in_place(self):
+        array = self.array.copy()
+        array.iadd_scaled(self.other_array, 2).iscale(0.5)
+
+        self.assert_matches(array, [a.add_scaled_vector(b, 2).scale(0.5)
+                                    for a, b in zip(self.vectors, self.other_vectors)])
+        self.assert_matches(self.array, self.vectors)
+
+
+if __name__ == '__main__':
+    unittest.main()
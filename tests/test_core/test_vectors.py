@@ -1,7 +1,7 @@
 import math
 import unittest
 
-from core.math.vector2d import Vector2d
+from core.math.vector2d import Vector2d, get_unique_points
 
 
 class TestVector2d(unittest.TestCase):
@@ -170,6 +170,56 @@ class TestVector2d(unittest.TestCase):
 	    self.assertEqual(self.third_vector.project_on(self.first_vector), Vector2d(-1, 0))
 	    self.assertEqual(self.fourth_vector.project_on(self.first_vector), Vector2d(0, 0))
 
+    def test_exact_mode(self):
+        rounded = Vector2d(1 / 3, 2 / 3)
+        exact = Vector2d(1 / 3, 2 / 3, exact=True)
+
+        self.assertEqual(rounded.x, 0.3333)
+        self.assertEqual(exact.x, 1 / 3)
+        self.assertEqual(rounded, exact)
+
+        self.assertTrue(exact.scale(3).exact)
+        self.assertTrue(exact.add_scaled_vector(rounded, 2).exact)
+        self.assertFalse(rounded.normalize().exact)
+
+        with self.assertRaises(AttributeError):
+            exact.z = 1
+
+    def test_in_place_operations(self):
+        vector = Vector2d(1, 2, exact=True)
+        same_vector = vector.iadd_scaled(Vector2d(2, 1), 0.5)
+
+        self.assertIs(vector, same_vector)
+        self.assertEqual(vector, Vector2d(2, 2.5))
+
+        vector.iscale(2)
+        self.assertEqual(vector, Vector2d(4, 5))
+
+        vector.iadd(Vector2d(-1, -1)).isubtract(Vector2d(3, 0))
+        self.assertEqual(vector, Vector2d(0, 4))
+
+        vector.inormalize()
+        self.assertEqual(vector, Vector2d(0, 1))
+
+        Vector2d(0, 0).inormalize()
+
+        vector -= Vector2d(1, 1)
+        self.assertEqual(vector, Vector2d(-1, 0))
+
+        rounded = Vector2d(0, 0)
+        rounded.iadd_scaled(Vector2d(1, 1), 1 / 3)
+        self.assertEqual(rounded.x, 0.3333)
+
+    def test_grid_key(self):
+        with self.assertRaises(TypeError):
+            hash(Vector2d(1, 1))
+
+        self.assertEqual(Vector2d(1.001, -2.002).get_grid_key(), Vector2d(0.999, -1.998).get_grid_key())
+        self.assertNotEqual(Vector2d(1, 1).get_grid_key(), Vector2d(1.02, 1).get_grid_key())
+
+        points = [Vector2d(0, 0), Vector2d(1, 1), Vector2d(0.001, -0.002), Vector2d(1, 1), Vector2d(2, 0)]
+        self.assertEqual(get_unique_points(points), [Vector2d(0, 0), Vector2d(1, 1), Vector2d(2, 0)])
+
 
 if __name__ == '__main__':
     unittest.main()